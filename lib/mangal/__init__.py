@@ -1,4 +1,5 @@
 __all__ = [
     'driver',
-    'exceptions'
+    'exceptions',
+    'scripts'
 ]
\ No newline at end of file
@@ -3,6 +3,7 @@ __all__ = [
     'button',
     'checkbox',
     'combobox',
+    'condition',
     'dropdownlist',
     'grid',
     'image',
@@ -12,11 +12,13 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, \
-    ElementNotVisibleException
+    ElementNotVisibleException, WebDriverException
 from frlog import LOG
 from mariner.timeout import Timeout
 from mangal.exceptions import ComponentException, ComponentFailedStateException, \
     ComponentNotFoundException
+from mangal import scripts
+import condition
 
 
 class BaseComponent(object):
@@ -29,7 +31,8 @@ class BaseComponent(object):
           - State inspection
           - Access to child components of component
     """
-
+    # JavaScript helpers shared by scripts executed in browser on behalf of components
+    scriptHelpers = condition.scriptHelpers
 
     class Element(object):
         """
@@ -59,8 +62,11 @@ class BaseComponent(object):
             """
             timeout = Timeout(timeout=self.driver.timeout, description="%s.element.%s(%s, %s): selector='%s'. Time out."
                 % (self.name, self.attributeName, args, kwargs, self.selector))
+            # Element is looked up at least once, even if driver's deadline has passed already
+            isFirstAttempt = True
             while True:
-                if not timeout.exceeded(raiseException=False):
+                if isFirstAttempt or not timeout.exceeded(raiseException=False):
+                    isFirstAttempt = False
                     if self.element is None:
                         try:
                             # Base web element of component, instance of WebDriver.WebElement. In
@@ -69,7 +75,7 @@ class BaseComponent(object):
                             self.element = self.webDriver.find_element_by_xpath(xpath=self.selector)
                         except NoSuchElementException:
                             self.element = None
-                            time.sleep(self.driver.delay)
+                            self.driver.sleep()
                             continue
                     try:
                         attribute = getattr(self.element, self.attributeName)
@@ -88,7 +94,7 @@ class BaseComponent(object):
                         break
                     except (StaleElementReferenceException, ElementNotVisibleException):
                         self.element = None
-                        time.sleep(self.driver.delay)
+                        self.driver.sleep()
                 else:
                     raise ComponentNotFoundException(message="%s.element.%s(%s, %s): selector='%s'. Time out."
                     % (self.name, self.attributeName, args, kwargs, self.selector),
@@ -136,19 +142,145 @@ class BaseComponent(object):
         LOG.l5("%s.getCSSProperty(%s): '%s'" % (self.name, propertyName, cssProperty))
         return cssProperty
 
-    def isPresent(self, suppressLog=False):
+    @staticmethod
+    def probe(driver, selectors):
+        """
+            Inspect presence and visibility of web elements in single script call. Unlike
+              touching element through Element.callAttribute(), doesn't wait for element to
+              appear, so answer on missing element is immediate.
+            @param driver: Instance of Mangal.Driver.
+            @param selectors: List of XPath selectors of elements.
+            @return: List of dictionaries {'present': <True/False>, 'visible': <True/False>}, one
+              per selector in order of selectors.
+        """
+        script = BaseComponent.scriptHelpers + """
+            var result = [];
+            for (var index = 0; index < arguments[0].length; index++) {
+                var element = findElement(arguments[0][index]);
+                result.push({
+                    'present': element !== null,
+                    'visible': (element !== null) && isVisible(element)
+                });
+            }
+            return result;
+        """
+        return driver.getWebDriver().execute_script(scripts.tag(scripts.probeId, script),
+            list(selectors))
+
+    @staticmethod
+    def getStates(driver, components, cssProperties=None, memo=False):
+        """
+            Read state of several components in single script call, instead of separate WebDriver
+              commands per attribute. Doesn't wait for elements to appear (see probe()).
+            @param driver: Instance of Mangal.Driver.
+            @param components: List of components (or anything having 'selector').
+            @param cssProperties: Names of computed CSS properties to read (ex. ['display']).
+            @param memo: If True, states read less than driver.stateMemoTime ago are reused,
+              unless mutating command (click, typing, navigation) was issued since, and states
+              read now are kept for reuse.
+            @return: List of dictionaries {'present': <True/False>, 'visible': <True/False>,
+              'class': ..., 'value': ..., 'text': ..., 'css': {<property>: <value>}}, one per
+              component in order of components. Values are None if element is absent, 'text'
+              is empty if element is hidden (as with WebElement.text).
+        """
+        cssProperties = list(cssProperties or [])
+        keys = [(component.selector, tuple(cssProperties)) for component in components]
+        now = time.time()
+        states = {}
+        if memo:
+            for key in keys:
+                if key in driver.stateMemo and now - driver.stateMemo[key][0] < \
+                driver.stateMemoTime:
+                    states[key] = driver.stateMemo[key][1]
+        missingKeys = [key for key in keys if key not in states]
+        if missingKeys:
+            script = BaseComponent.scriptHelpers + """
+                var result = [];
+                for (var index = 0; index < arguments[0].length; index++) {
+                    var element = findElement(arguments[0][index]);
+                    var state = {'present': element !== null, 'visible': false, 'class': null,
+                        'value': null, 'text': null, 'css': {}};
+                    if (element !== null) {
+                        state.visible = isVisible(element);
+                        state['class'] = element.getAttribute('class') || '';
+                        state.value = ('value' in element) ? element.value :
+                            element.getAttribute('value');
+                        state.text = state.visible ? getText(element) : '';
+                        var style = window.getComputedStyle(element);
+                        for (var i = 0; i < arguments[1].length; i++) {
+                            state.css[arguments[1][i]] = style.getPropertyValue(arguments[1][i]);
+                        }
+                    }
+                    result.push(state);
+                }
+                return result;
+            """
+            for key, state in zip(missingKeys, driver.getWebDriver().execute_script(scripts.tag(
+            scripts.getStatesId, script), [selector for selector, _ in missingKeys],
+            cssProperties)):
+                states[key] = state
+                if memo:
+                    driver.stateMemo[key] = (now, state)
+        return [states[key] for key in keys]
+
+    def getState(self, cssProperties=None, memo=False):
+        """
+            Read class, value, text, presence, visibility and given CSS properties of base element
+              in single script call (see getStates()).
+            @return: Dictionary of state.
+        """
+        state = self.getStates(driver=self.driver, components=[self],
+            cssProperties=cssProperties, memo=memo)[0]
+        LOG.l5('%s.getState(): %s' % (self.name, state))
+        return state
+
+    def _waitUntil(self, stateCondition, methodName, exceptionClass=ComponentFailedStateException):
+        """
+            Block until condition holds or driver's time out is reached. Condition is evaluated in
+              browser by condition engine (see condition.evaluate()) rather than by polling from
+              test side.
+            @param stateCondition: Instance of condition.Condition, built by factories of condition
+              module (ex. condition.enabled(self)).
+            @param methodName: Name of waiting method, used in messages (ex. 'waitUntilEnabled').
+            @param exceptionClass: Exception raised on time out.
+        """
+        if not condition.evaluate(driver=self.driver, conditions=[stateCondition])[0]:
+            raise exceptionClass(message='%s.%s(): Time out.' % (self.name, methodName),
+                driver=self.driver, screenshotName=self.name + '.' + methodName)
+        LOG.l5('%s.%s()' % (self.name, methodName))
+
+    # Conditions on component for composed waits (see condition.waitUntil()), ex.
+    #   condition.waitUntil(driver, page.txtName.visible() & page.btnNext.enabled())
+    def present(self):
+        return condition.present(self)
+
+    def absent(self):
+        return condition.absent(self)
+
+    def visible(self):
+        return condition.visible(self)
+
+    def hidden(self):
+        return condition.hidden(self)
+
+    def isPresent(self, suppressLog=False, wait=False):
         """
             Inspects if element is present (can be found) in DOM.
               Note: This is not equal to isVisible(), as element could be present in DOM but hidden.
+            @param wait: If False (default), answer immediately (see probe()). If True, wait for
+              element to appear until driver's time out.
             @return: True if present, otherwise False.
         """
-        try:
-            # To determine if component is present, we just 'touch' it using __getattr__ above with
-            #   any attribute.
-            if self.element.id():
-                isPresent = True
-        except ComponentNotFoundException:
-            isPresent = False
+        if not wait:
+            isPresent = self.probe(driver=self.driver, selectors=[self.selector])[0]['present']
+        else:
+            try:
+                # To determine if component is present, we just 'touch' it using __getattr__ above
+                #   with any attribute.
+                if self.element.id():
+                    isPresent = True
+            except ComponentNotFoundException:
+                isPresent = False
         if not suppressLog:
             LOG.l5('%s.isPresent(): %s' % (self.name, isPresent))
         return isPresent
@@ -159,38 +291,30 @@ class BaseComponent(object):
               or component have been loaded.
               Note: Present <> enabled, element can easily be disabled still being present.
         """
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.waitUntilPresent(): Time out.'
-            % self.name)
-        while not self.isPresent(suppressLog=True):
-            if timeout.exceeded(raiseException=False):
-                raise ComponentNotFoundException(message='%s.waitUntilPresent(): Time out.' %
-                self.name, driver=self.driver, screenshotName=self.name + '.waitUntilPresent')
-            time.sleep(self.driver.delay)
-        LOG.l5('%s.waitUntilPresent()' % self.name)
+        self._waitUntil(condition.present(self), methodName='waitUntilPresent',
+            exceptionClass=ComponentNotFoundException)
 
     def waitUntilAbsent(self):
         """
             Wait until base element of component has completely disappeared from DOM.
         """
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.waitUntilAbsent(): Time out.'
-            % self.name)
-        while self.isPresent(suppressLog=True):
-            if timeout.exceeded(raiseException=False):
-                raise ComponentFailedStateException(message='%s.waitUntilAbsent(): Time out.' %
-                self.name, driver=self.driver, screenshotName=self.name + '.waitUntilAbsent')
-            time.sleep(self.driver.delay)
-        LOG.l5('%s.waitUntilAbsent()' % self.name)
+        self._waitUntil(condition.absent(self), methodName='waitUntilAbsent')
 
-    def isVisible(self, suppressLog=False):
+    def isVisible(self, suppressLog=False, wait=False):
         """
             Inspect if base HTML element is visible. Setting <... style='display:none>' hides
               element from visibility on web page, still retaining it in DOM.
+            @param wait: If False (default), answer immediately (see probe()). If True, wait for
+              element to appear until driver's time out.
             @return: True if base element of component visible, otherwise False.
         """
-        try:
-            isVisible = self.element.is_displayed()
-        except ComponentNotFoundException:
-            isVisible = False
+        if not wait:
+            isVisible = self.probe(driver=self.driver, selectors=[self.selector])[0]['visible']
+        else:
+            try:
+                isVisible = self.element.is_displayed()
+            except ComponentNotFoundException:
+                isVisible = False
         if not suppressLog:
             LOG.l5('%s.isVisible(): %s' % (self.name, isVisible))
         return isVisible
@@ -199,28 +323,14 @@ class BaseComponent(object):
         """
             Wait until base element of component has become visible on web page.
         """
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.waitUntilVisible(): Time out.'
-            % self.name)
-        while not self.isVisible(suppressLog=True):
-            if timeout.exceeded(raiseException=False):
-                raise ComponentFailedStateException(message='%s.waitUntilVisible(): Time out.' %
-                self.name, driver=self.driver, screenshotName=self.name + '.waitUntilVisible')
-            time.sleep(self.driver.delay)
-        LOG.l5('%s.waitUntilVisible()' % self.name)
+        self._waitUntil(condition.visible(self), methodName='waitUntilVisible')
 
     def waitUntilHidden(self):
         """
             Wait until base element of component became invisible on web page; still, it's present
               in DOM, the same as isDisplayed() == False.
         """
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.waitUntilHidden(): Time out.'
-            % self.name)
-        while self.isVisible(suppressLog=True):
-            if timeout.exceeded(raiseException=False):
-                raise ComponentFailedStateException(message='%s.waitUntilHidden(): Time out.' %
-                self.name, driver=self.driver, screenshotName=self.name + '.waitUntilHidden')
-            time.sleep(self.driver.delay)
-        LOG.l5('%s.waitUntilHidden()' % self.name)
+        self._waitUntil(condition.hidden(self), methodName='waitUntilHidden')
 
     def getChild(self, relativePath):
         """
@@ -239,15 +349,19 @@ class BaseComponent(object):
             % (self.name, childPath), driver=self.driver, screenshotName=self.name + '.getChild')
         return childComponent
 
-    def getChildren(self, relativePath):
+    def getChildren(self, relativePath, bulk=True):
         """
             Returns child web elements of component (wrapped in instances of BaseComponent) using
               relative XPath. Used, as example, for finding item elements in menu item list.
             @param relativePath: XPath of child elements in reference to selector of component.
+            @param bulk: If True (default), enumerate all children in single script call.
+              Otherwise, probe children one by one until first missing one.
             @return: List of instances of BaseComponent with found child elements as base elements.
         """
         # Sanitize path to remove duplicated '/' and ensure leading one
         relativePath = '/' + '/'.join(filter(None, relativePath.split('/')))
+        if bulk:
+            return self._getChildrenBulk(relativePath=relativePath)
         children = []
         childIndex = 1
         while True:
@@ -261,3 +375,41 @@ class BaseComponent(object):
                 break
             childIndex += 1
         return children
+
+    def _getChildrenBulk(self, relativePath):
+        """
+            Enumerate child web elements of component in single script call. Children are
+              addressed by the same positional selectors as in getChildren() (ex.
+              '<selector>/div/ul/li[3]'), and their base elements are pre-set with found
+              WebElements, so no extra lookup is needed on first access while recovery after
+              StaleElementReferenceException still works.
+            @param relativePath: Sanitized XPath of child elements in reference to selector of
+              component.
+            @return: List of instances of BaseComponent with found child elements as base elements.
+        """
+        script = """
+            var path = arguments[0], children = [];
+            for (var index = 1; ; index++) {
+                var child = document.evaluate(path + '[' + index + ']', document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                if (!child) {
+                    break;
+                }
+                children.push(child);
+            }
+            return children;
+        """
+        elements = self.webDriver.execute_script(scripts.tag(scripts.getChildrenId, script),
+            self.selector + relativePath) or []
+        # No children found: ensure component itself is present, the same way as one-by-one
+        #   probing does (raises ComponentNotFoundException on time out)
+        if not elements:
+            self.element.id()
+        children = []
+        for childIndex in range(len(elements)):
+            childPath = self.selector + relativePath + '[%s]' % str(childIndex + 1)
+            childComponent = BaseComponent(driver=self.driver, selector=childPath,
+                name=self.name + '.child')
+            childComponent.element.element = elements[childIndex]
+            children.append(childComponent)
+        return children
@@ -37,12 +37,21 @@ class Button(BaseComponent):
         LOG.l5("%s.getText(): '%s'" % (self.name, text))
         return text
 
+    def enabled(self):
+        return condition.enabled(self)
+
+    def disabled(self):
+        return condition.disabled(self)
+
     def isEnabled(self):
         """
             Returns state of button on web page.
             @return: True if button bright and clickable, False if dimmed and inactive.
         """
-        elementClass = self.getAttribute(attributeName='class', suppressLog=True)
+        elementClass = self.getState(memo=True)['class']
+        if elementClass is None:
+            # Button not rendered yet, wait for it as when touching element
+            elementClass = self.getAttribute(attributeName='class', suppressLog=True)
         if 'x-item-disabled' in elementClass:
             isEnabled = False
         else:
@@ -54,24 +63,10 @@ class Button(BaseComponent):
         """
             Wait until button has become enabled.
         """
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.waitUntilEnabled(): Time out.'
-            % self.name)
-        while not self.isEnabled():
-            if timeout.exceeded(raiseException=False):
-                raise ComponentFailedStateException(message='%s.waitUntilEnabled(): Time out.' %
-                self.name, driver=self.driver, screenshotName=self.name + '.waitUntilEnabled')
-            time.sleep(self.driver.delay)
-        LOG.l5('%s.waitUntilEnabled()' % self.name)
+        self._waitUntil(condition.enabled(self), methodName='waitUntilEnabled')
 
     def waitUntilDisabled(self):
         """
             Wait until button has become disabled.
         """
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.waitUntilDisabled(): Time out.'
-            % self.name)
-        while self.isEnabled():
-            if timeout.exceeded(raiseException=False):
-                raise ComponentFailedStateException(message='%s.waitUntilDisabled(): Time out.' %
-                self.name, driver=self.driver, screenshotName=self.name + '.waitUntilDisabled')
-            time.sleep(self.driver.delay)
-        LOG.l5('%s.waitUntilDisabled()' % self.name)
+        self._waitUntil(condition.disabled(self), methodName='waitUntilDisabled')
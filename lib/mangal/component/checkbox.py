@@ -42,28 +42,17 @@ class CheckBox(BaseComponent):
     def select(self, suppressLog=False):
         if not self.isSelected(suppressLog=True):
             self.selectableElement.element.click()
-            timeout = Timeout(timeout=self.driver.timeout, description='%s.select(): Time out.' %
-                self.name)
-            # Re-examine check box state while timeout has not been reached
-            while not self.isSelected(suppressLog=True):
-                if timeout.exceeded(raiseException=False):
-                    raise ComponentFailedStateException(message='%s.select(): Time out.' %
-                    self.name, driver=self.driver, screenshotName=self.name + '.select')
-                time.sleep(self.driver.delay)
+            # Wait until check box state has changed or timeout has been reached
+            self._waitUntil(condition.hasClass(self, 'x-form-cb-checked'), methodName='select')
             if not suppressLog:
                 LOG.l4('%s.select()' % self.name)
 
     def unselect(self, suppressLog=False):
         if self.isSelected(suppressLog=True):
             self.selectableElement.element.click()
-            timeout = Timeout(timeout=self.driver.timeout, description='%s.unselect(): Time out.' %
-                self.name)
-            # Re-examine check box state while timeout has not been reached
-            while self.isSelected(suppressLog=True):
-                if timeout.exceeded(raiseException=False):
-                    raise ComponentFailedStateException(message='%s.unselect(): Time out.' %
-                    self.name, driver=self.driver, screenshotName=self.name + '.unselect')
-                time.sleep(self.driver.delay)
+            # Wait until check box state has changed or timeout has been reached
+            self._waitUntil(condition.lacksClass(self, 'x-form-cb-checked'),
+                methodName='unselect')
             if not suppressLog:
                 LOG.l4('%s.unselect()' % self.name)
 
@@ -19,13 +19,8 @@ class ComboBox(DropDownList):
         """
         newText = self.inputElement.getAttribute(attributeName='value', suppressLog=True) + text
         self.inputElement.element.send_keys(text)
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.setText(%s): Time out.' %
-            (self.name, text))
-        while self.inputElement.getAttribute(attributeName='value', suppressLog=True) != newText:
-            if timeout.exceeded(raiseException=False):
-                raise ComponentFailedStateException(message='%s.setText(%s): Time out.' %
-                (self.name, text), driver=self.driver, screenshotName=self.name + '.setText')
-            time.sleep(self.driver.delay)
+        self._waitUntil(condition.text(self.inputElement, text=newText, exact=True),
+            methodName='setText')
         LOG.l4("%s.setText(text='%s')" % (self.name, text))
 
 class ComboBoxItems(DropDownItems):
@@ -0,0 +1,491 @@
+"""
+    Composable wait conditions for Mangal components and pages.
+"""
+
+import abc
+import time
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, \
+    WebDriverException
+from frlog import LOG
+from mangal.exceptions import ComponentFailedStateException
+from mangal import scripts
+
+
+# JavaScript helpers shared by scripts executed in browser on behalf of components
+scriptHelpers = """
+    var findElement = function (selector) {
+        return document.evaluate(selector, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    };
+    var isVisible = function (element) {
+        var style = window.getComputedStyle(element);
+        if ((style.visibility === 'hidden') || (style.visibility === 'collapse') ||
+        (parseFloat(style.opacity) === 0)) {
+            return false;
+        }
+        for (var node = element; node && (node.nodeType === 1); node = node.parentNode) {
+            if (window.getComputedStyle(node).display === 'none') {
+                return false;
+            }
+        }
+        return element.getClientRects().length > 0;
+    };
+    var hasClass = function (element, className) {
+        return (' ' + (element.getAttribute('class') || '') + ' ').indexOf(' ' + className +
+            ' ') >= 0;
+    };
+    var getText = function (element) {
+        return (element.innerText || element.textContent || '').replace(/^\\s+|\\s+$/g, '');
+    };
+    var getContent = function (element) {
+        return /^(INPUT|TEXTAREA)$/.test(element.tagName) ? element.value : getText(element);
+    };
+"""
+
+# Fragments of messages of WebDriver errors caused by script being discarded with page (ex.
+#   'document unloaded while waiting for result'), after which waiting is resumed. Other errors
+#   (ex. JavaScript or XPath errors in conditions) are raised at once.
+transientErrors = ['unload', 'navigat', 'stale', 'reload', 'discarded']
+
+
+def isTransient(error):
+    """
+        @param error: Instance of WebDriverException raised by script.
+        @return: True if script has been interrupted by page change and is worth retrying.
+    """
+    if isinstance(error, (StaleElementReferenceException, TimeoutException)):
+        return True
+    message = (error.msg or '').lower()
+    return any([fragment in message for fragment in transientErrors])
+
+
+# Predicates which conditions are built of (see ElementCondition), as JavaScript functions of
+#   element (null if absent or if condition is not bound to element) and parameters of condition.
+#   Conditions refer to predicates by name, so they are passed to browser as data and every
+#   condition is expressed once. Functions evaluating conditions outside browser (ex. fake
+#   WebDriver of offline tests) implement the same predicates.
+predicatesScript = """
+    var predicates = {
+        'present': function (element, params) {
+            return element !== null;
+        },
+        'visible': function (element, params) {
+            return (element !== null) && isVisible(element);
+        },
+        'hasClass': function (element, params) {
+            return (element !== null) && (hasClass(element, params.className) === params.state);
+        },
+        'text': function (element, params) {
+            if (element === null) {
+                return false;
+            }
+            var content = getContent(element) || '';
+            return (content === params.text) || (!params.exact &&
+                (content.indexOf(params.text) >= 0));
+        },
+        'routed': function (element, params) {
+            return location.hash === params.path;
+        }
+    };
+"""
+
+# Waits in browser until any of conditions holds. Conditions are re-evaluated on every DOM mutation
+#   (at most once per animation frame), on input events and, as a fallback for changes not
+#   reflected in DOM (ex. CSS transitions), periodically. Conditions are given as trees built by
+#   Condition.serialize(). Returns list of states of conditions.
+waitScript = """
+    var conditions = arguments[0], selectors = arguments[1], timeout = arguments[2];
+    var callback = arguments[arguments.length - 1];
+    var check = function () {
+        var elements = {};
+        var element = function (index) {
+            if (!elements.hasOwnProperty(index)) {
+                elements[index] = findElement(selectors[index]);
+            }
+            return elements[index];
+        };
+        var test = function (condition) {
+            var i;
+            if ('allOf' in condition) {
+                for (i = 0; i < condition.allOf.length; i++) {
+                    if (!test(condition.allOf[i])) {
+                        return false;
+                    }
+                }
+                return true;
+            }
+            if ('anyOf' in condition) {
+                for (i = 0; i < condition.anyOf.length; i++) {
+                    if (test(condition.anyOf[i])) {
+                        return true;
+                    }
+                }
+                return false;
+            }
+            if ('not' in condition) {
+                return !test(condition.not);
+            }
+            // Unknown predicate fails the script rather than the condition
+            return Boolean(predicates[condition.predicate](condition.element === null ? null :
+                element(condition.element), condition.params));
+        };
+        var states = [];
+        for (var i = 0; i < conditions.length; i++) {
+            states.push(test(conditions[i]));
+        }
+        return states;
+    };
+    var states = check();
+    if ((states.indexOf(true) >= 0) || (timeout <= 0)) {
+        callback(states);
+        return;
+    }
+    var done = false, scheduled = false, observer = null, timer = null, interval = null;
+    var finish = function (states) {
+        if (done) {
+            return;
+        }
+        done = true;
+        if (observer) {
+            observer.disconnect();
+        }
+        document.removeEventListener('input', schedule, true);
+        document.removeEventListener('change', schedule, true);
+        clearTimeout(timer);
+        clearInterval(interval);
+        callback(states);
+    };
+    var evaluate = function () {
+        scheduled = false;
+        if (!done) {
+            var states = check();
+            if (states.indexOf(true) >= 0) {
+                finish(states);
+            }
+        }
+    };
+    var schedule = function () {
+        if (scheduled) {
+            return;
+        }
+        scheduled = true;
+        if (window.requestAnimationFrame) {
+            window.requestAnimationFrame(evaluate);
+        } else {
+            setTimeout(evaluate, 0);
+        }
+    };
+    if (window.MutationObserver) {
+        observer = new MutationObserver(schedule);
+        observer.observe(document.documentElement, {'childList': true, 'subtree': true,
+            'attributes': true, 'characterData': true});
+    }
+    document.addEventListener('input', schedule, true);
+    document.addEventListener('change', schedule, true);
+    interval = setInterval(evaluate, 250);
+    timer = setTimeout(function () {
+        finish(check());
+    }, timeout);
+"""
+
+
+class Condition(object):
+    """
+        Abstract condition on state of components or application, evaluated in browser.
+          Conditions are combined with operators '&' (all of), '|' (any of) and '~' (not), ex.
+          visible(txtName) & enabled(btnNext). Combined condition is evaluated as a whole in
+          single script call.
+        Sub-classes implement serialize(), describing condition as data for waitScript, and have
+          description used in messages.
+    """
+    __metaclass__ = abc.ABCMeta
+
+    def __init__(self, description):
+        self.description = description
+
+    def __and__(self, other):
+        return AllOf(self, other)
+
+    def __or__(self, other):
+        return AnyOf(self, other)
+
+    def __invert__(self):
+        return Not(self)
+
+    def __str__(self):
+        return self.description
+
+    @abc.abstractmethod
+    def serialize(self, selectors):
+        """
+            Describe condition as tree of JSON-serializable dictionaries, one of:
+              {'predicate': <name of predicate>, 'element': <index of selector or None>,
+              'params': <dictionary>} for single predicate (see predicatesScript),
+              {'allOf': [<trees>]}, {'anyOf': [<trees>]} or {'not': <tree>} for compositions.
+            @param selectors: List of selectors shared by all conditions evaluated together.
+              Selector of element condition refers to is appended to it, unless present already,
+              and referred to by its index.
+            @return: Dictionary.
+        """
+
+
+class ElementCondition(Condition):
+    """
+        Condition on single web element.
+    """
+    def __init__(self, selector, predicate, description, **params):
+        """
+            @param selector: XPath selector of element.
+            @param predicate: Name of predicate of element (null if absent) and params, see
+              predicatesScript (ex. 'visible').
+            @param description: Description used in messages (ex. 'LoginPage.btnSignIn visible').
+            @param params: Parameters of predicate.
+        """
+        super(ElementCondition, self).__init__(description=description)
+        self.selector = selector
+        self.predicate = predicate
+        self.params = params
+
+    def serialize(self, selectors):
+        if self.selector not in selectors:
+            selectors.append(self.selector)
+        return {'predicate': self.predicate, 'element': selectors.index(self.selector),
+            'params': self.params}
+
+
+class ApplicationCondition(Condition):
+    """
+        Condition on state of application loaded in browser rather than of single element (ex.
+          its route).
+    """
+    def __init__(self, predicate, description, **params):
+        """
+            @param predicate: Name of predicate of params, see predicatesScript (ex. 'routed').
+            @param description: Description used in messages (ex. "route '#dashboard'").
+            @param params: Parameters of predicate.
+        """
+        super(ApplicationCondition, self).__init__(description=description)
+        self.predicate = predicate
+        self.params = params
+
+    def serialize(self, selectors):
+        return {'predicate': self.predicate, 'element': None, 'params': self.params}
+
+
+class AllOf(Condition):
+    """
+        Condition holding if all given conditions hold.
+    """
+    def __init__(self, *conditions):
+        self.conditions = []
+        for condition in conditions:
+            # Flatten nested conditions of the same kind (ex. 'a & b & c')
+            self.conditions.extend(condition.conditions if isinstance(condition, AllOf) else
+                [condition])
+        super(AllOf, self).__init__(description='(%s)' % ' & '.join([str(condition) for condition
+            in self.conditions]))
+
+    def serialize(self, selectors):
+        return {'allOf': [condition.serialize(selectors=selectors) for condition in
+            self.conditions]}
+
+
+class AnyOf(Condition):
+    """
+        Condition holding if any of given conditions holds.
+    """
+    def __init__(self, *conditions):
+        self.conditions = []
+        for condition in conditions:
+            self.conditions.extend(condition.conditions if isinstance(condition, AnyOf) else
+                [condition])
+        super(AnyOf, self).__init__(description='(%s)' % ' | '.join([str(condition) for condition
+            in self.conditions]))
+
+    def serialize(self, selectors):
+        return {'anyOf': [condition.serialize(selectors=selectors) for condition in
+            self.conditions]}
+
+
+class Not(Condition):
+    """
+        Condition holding if given condition does not hold.
+    """
+    def __init__(self, condition):
+        super(Not, self).__init__(description='~' + str(condition))
+        self.condition = condition
+
+    def serialize(self, selectors):
+        return {'not': self.condition.serialize(selectors=selectors)}
+
+
+def present(component):
+    return ElementCondition(selector=component.selector, predicate='present',
+        description='%s present' % component.name)
+
+
+def absent(component):
+    condition = ~present(component)
+    condition.description = '%s absent' % component.name
+    return condition
+
+
+def visible(component):
+    return ElementCondition(selector=component.selector, predicate='visible',
+        description='%s visible' % component.name)
+
+
+def hidden(component):
+    """
+        Condition holding if component is absent or invisible.
+    """
+    condition = ~visible(component)
+    condition.description = '%s hidden' % component.name
+    return condition
+
+
+def hasClass(component, className):
+    return ElementCondition(selector=component.selector, predicate='hasClass',
+        description="%s has class '%s'" % (component.name, className), className=className,
+        state=True)
+
+
+def lacksClass(component, className):
+    """
+        Condition holding if component is present and has not given class.
+    """
+    return ElementCondition(selector=component.selector, predicate='hasClass',
+        description="%s lacks class '%s'" % (component.name, className), className=className,
+        state=False)
+
+
+def enabled(component):
+    condition = lacksClass(component, 'x-item-disabled')
+    condition.description = '%s enabled' % component.name
+    return condition
+
+
+def disabled(component):
+    condition = hasClass(component, 'x-item-disabled')
+    condition.description = '%s disabled' % component.name
+    return condition
+
+
+def text(component, text, exact=False):
+    """
+        Condition holding if component's text (value of input elements) is equal to given text or,
+          if exact is False, contains it.
+    """
+    return ElementCondition(selector=component.selector, predicate='text',
+        description="%s text '%s'" % (component.name, text), text=text, exact=exact)
+
+
+def routed(path):
+    """
+        Condition holding if application is at given route (location.hash, ex. '#dashboard').
+    """
+    return ApplicationCondition(predicate='routed', description="route '%s'" % path, path=path)
+
+
+def opened(page):
+    """
+        Condition holding if all page's unique components ('token') are present and visible (see
+          BasePage.isOpen()).
+    """
+    tokens = page.token if isinstance(page.token, list) else [page.token]
+    condition = AllOf(*[visible(token) for token in tokens])
+    condition.description = '%s open' % page.name
+    return condition
+
+
+def closed(page):
+    condition = ~opened(page)
+    condition.description = '%s closed' % page.name
+    return condition
+
+
+def allOf(*conditions):
+    return AllOf(*conditions)
+
+
+def anyOf(*conditions):
+    return AnyOf(*conditions)
+
+
+def evaluate(driver, conditions, timeout=None):
+    """
+        Wait until any of given conditions holds or time out is reached. All conditions are
+          evaluated at once in single asynchronous script call (see waitScript). If script is
+          interrupted (ex. page reload), waiting is resumed for remaining time.
+        @param driver: Instance of Mangal.Driver.
+        @param conditions: List of conditions.
+        @param timeout: Time out in seconds. Default is driver's time out. If 0, conditions are
+          evaluated once without waiting.
+        @return: List of states (True/False) of conditions, in order of conditions.
+    """
+    if timeout is None:
+        timeout = driver.timeout
+    selectors = []
+    trees = [condition.serialize(selectors=selectors) for condition in conditions]
+    script = scripts.tag(scripts.waitConditionsId, scriptHelpers + predicatesScript + waitScript)
+    deadline = time.time() + timeout
+    while True:
+        remaining = max(deadline - time.time(), 0)
+        try:
+            # Script bounds its wait by remaining time itself, WebDriver's script time out is
+            #   only a safety net and is kept constant (see Driver.executeAsyncScript())
+            states = driver.executeAsyncScript(script, max(timeout, driver.timeout) + 1, trees,
+                selectors, int(remaining * 1000))
+            break
+        except WebDriverException, e:
+            if not isTransient(e):
+                LOG.l4('evaluate(): Script failed:', e.msg)
+                raise
+            # Script has been discarded by browser (ex. document unloaded), try once again
+            if time.time() >= deadline:
+                states = [False] * len(conditions)
+                break
+            driver.sleep()
+    return states
+
+
+def check(driver, condition):
+    """
+        Evaluate condition once, without waiting.
+        @return: True if condition holds, False otherwise.
+    """
+    return evaluate(driver=driver, conditions=[condition], timeout=0)[0]
+
+
+def waitUntil(driver, condition, exceptionClass=ComponentFailedStateException,
+screenshotName=None):
+    """
+        Block until condition holds or driver's time out is reached.
+        @param condition: Condition, ex. visible(page.txtName) & enabled(page.btnNext).
+        @param exceptionClass: Exception raised on time out.
+        @param screenshotName: Name of screenshot taken on time out. Default is description of
+          condition.
+    """
+    waitUntilAny(driver=driver, conditions=[condition], exceptionClass=exceptionClass,
+        screenshotName=screenshotName)
+
+
+def waitUntilAny(driver, conditions, exceptionClass=ComponentFailedStateException,
+screenshotName=None):
+    """
+        Block until any of conditions holds or driver's time out is reached. Allows to resolve
+          as soon as either of alternative outcomes occurs (ex. next page of wizard is open or
+          validation error is shown).
+        @param conditions: List of conditions.
+        @param exceptionClass: Exception raised on time out.
+        @param screenshotName: Name of screenshot taken on time out. Default is description of
+          conditions.
+        @return: First of conditions holding.
+    """
+    description = ' | '.join([str(condition) for condition in conditions])
+    states = evaluate(driver=driver, conditions=conditions)
+    if True not in states:
+        raise exceptionClass(message='waitUntil(%s): Time out.' % description, driver=driver,
+            screenshotName=screenshotName or description)
+    LOG.l5('waitUntil(%s)' % description)
+    return conditions[states.index(True)]
@@ -89,13 +89,8 @@ class DropDownList(BaseComponent):
         """
         if not self.isExpanded():
             self.clickableElement.element.click()
-            timeout = Timeout(timeout=self.driver.timeout, description='%s.expand(): Time out.' %
-                self.name)
-            while not self.isExpanded():
-                if timeout.exceeded(raiseException=False):
-                    raise ComponentFailedStateException(message='%s.expand(): Time out.' %
-                    self.name, driver=self.driver, screenshotName=self.name + '.expand')
-                time.sleep(self.driver.delay)
+            self._waitUntil(condition.hasClass(self.pickerElement, 'x-pickerfield-open'),
+                methodName='expand')
             LOG.l4('%s.expand()' % self.name)
 
     def collapse(self):
@@ -104,13 +99,8 @@ class DropDownList(BaseComponent):
         """
         if self.isExpanded():
             self.clickableElement.element.click()
-            timeout = Timeout(timeout=self.driver.timeout, description='%s.collapse(): Time out.' %
-                self.name)
-            while self.isExpanded():
-                if timeout.exceeded(raiseException=False):
-                    raise ComponentFailedStateException(message='%s.collapse(): Time out.' %
-                    self.name, driver=self.driver, screenshotName=self.name + '.collapse')
-                time.sleep(self.driver.delay)
+            self._waitUntil(condition.lacksClass(self.pickerElement, 'x-pickerfield-open'),
+                methodName='collapse')
             LOG.l4('%s.collapse()' % self.name)
 
     def select(self, item, exact=False):
@@ -1,15 +1,120 @@
-import copy
+import itertools
+import json
 import re
 from selenium.webdriver.common.keys import Keys
 from base_component import *
 
 
+class RowFilter(object):
+    """
+        Filter of grid rows compiled once from filtering attributes (see Grid._satisfyFilters()):
+          control keys are parsed, regular expressions precompiled and a test prepared per
+          attribute, so filtering a row only runs the tests, stopping at first decisive one.
+          Compiled filters are cached by filtering attributes (see compile()).
+    """
+    # Compiled filters by key of filtering attributes
+    _cache = {}
+    cacheSize = 256
+
+    def __init__(self, filterAttrs):
+        filterAttrs = dict(filterAttrs)
+        self.attributeCondition = filterAttrs.pop('attributeCondition', 'OR').upper()
+        valuesCondition = filterAttrs.pop('valuesCondition', 'OR').upper()
+        matchPattern = filterAttrs.pop('matchPattern', False)
+        self.numberOfAttributes = len(filterAttrs)
+        # List of (attribute name, test of attribute value) pairs. Attributes of unsupported type
+        #   get no test, thus never match.
+        self.tests = []
+        for attributeName, value in filterAttrs.items():
+            test = self._compileTest(value=value, valuesCondition=valuesCondition,
+                matchPattern=matchPattern)
+            if test is not None:
+                self.tests.append((attributeName, test))
+        LOG.l5('RowFilter(%s): %s of %s tests' % (filterAttrs, self.attributeCondition,
+            len(self.tests)))
+
+    @staticmethod
+    def _compileTest(value, valuesCondition, matchPattern):
+        if any([isinstance(value, attributeType) for attributeType in (int, str, unicode)]):
+            if matchPattern:
+                pattern = re.compile(str(value))
+                return lambda attribute: pattern.search(str(attribute)) is not None
+            text = str(value)
+            return lambda attribute: str(attribute) == text
+        if isinstance(value, list):
+            values = tuple(value)
+            if valuesCondition == 'OR':
+                return lambda attribute: any(value in attribute for value in values)
+            if valuesCondition == 'AND':
+                return lambda attribute: all(value in attribute for value in values)
+            return lambda attribute: False
+        return None
+
+    @classmethod
+    def compile(cls, filterAttrs):
+        """
+            Return compiled filter for filtering attributes, reusing one compiled before for
+              equal attributes.
+        """
+        try:
+            # Type of value is part of key, as equal values of different types compile to
+            #   different tests (ex. True == 1, but rows are matched against 'True' and '1')
+            key = tuple(sorted([(name, type(value), tuple(value) if isinstance(value, list) else
+                value) for name, value in filterAttrs.items()]))
+            hash(key)
+        except TypeError:
+            # Unhashable values (ex. dictionaries) are not cached
+            return cls(filterAttrs)
+        if key not in cls._cache:
+            if len(cls._cache) >= cls.cacheSize:
+                cls._cache.clear()
+            cls._cache[key] = cls(filterAttrs)
+        return cls._cache[key]
+
+    def __call__(self, attributes):
+        """
+            @param attributes: Row as dictionary of column names and cell values.
+            @return: True if row satisfies filter, False otherwise.
+        """
+        # Filter of control keys only (ex. {'matchPattern': True}) has no column predicates left
+        #   and matches every row, the same as no filter at all
+        if not self.numberOfAttributes:
+            return True
+        if self.attributeCondition == 'OR':
+            for attributeName, test in self.tests:
+                if attributeName in attributes and test(attributes[attributeName]):
+                    return True
+            return False
+        if self.attributeCondition == 'AND':
+            # Every filtering attribute must be present in row and match
+            if len(self.tests) != self.numberOfAttributes:
+                return False
+            for attributeName, test in self.tests:
+                if attributeName not in attributes or not test(attributes[attributeName]):
+                    return False
+            return True
+        return False
+
+
 class Grid(BaseComponent):
     """
         Represent grid on Mars web UI pages such as LUNs, Consistency Groups, Initiator Groups, grid
           on a dialog.
     """
-    def __init__(self, driver, selector, name=''):
+    def __init__(self, driver, selector, name='', useSnapshot=True, useStore=False,
+    useSelectionModel=False):
+        """
+            @param driver: Instance of Mangal.Driver
+            @param selector: Selector of head element of grid
+            @param name: Name of component
+            @param useSnapshot: If True (default), read grid page in single round trip to browser
+              using getSnapshot(). If False, read grid element by element.
+            @param useStore: If True, read all pages of grid from its Ext store in single call
+              using getStoreRows(). Default is False.
+            @param useSelectionModel: If True, select()/unselect() apply rows of page to Ext
+              selection model of grid in single script call rather than clicking checkboxes.
+              Default is False.
+        """
         super(Grid, self).__init__(driver=driver, selector=selector, name=name)
 
         # Selectors of grid elements
@@ -18,6 +123,11 @@ class Grid(BaseComponent):
         # List of column names
         self.columnNames = []
 
+        # Visible columns as read by refreshColumnNames(), and fingerprint of header they were read
+        #   from
+        self.columns = []
+        self.columnsFingerprint = None
+
         # Path to header section in grid element
         self.headerRelativePath = '/div[starts-with(@id, "headercontainer")]/div/div/div'
 
@@ -37,6 +147,21 @@ class Grid(BaseComponent):
         # WebElements return values as Unicode strings, we need to encode them to ASCII
         self.charSet = 'ascii'
 
+        # If True, rows of grid page are read with single script call (see getSnapshot()) rather
+        #   than by querying every row and cell with separate WebDriver commands
+        self.useSnapshot = useSnapshot
+
+        # If True, find(allPages=True) reads rows from Ext store backing the grid (see
+        #   getStoreRows()) rather than paging through grid
+        self.useStore = useStore
+
+        # If True, rows are selected through Ext selection model of grid (see _setRowsSelected())
+        self.useSelectionModel = useSelectionModel
+
+        # Positions (1-based) of rows of grid page read last by Ext record id (see getRowById()).
+        #   Only positions are kept, rows themselves are always read anew.
+        self.rowIndex = {}
+
     def __getattr__(self, attributeName):
         """
             Attempt to return Element instance by given element name (ex. 'btnNextPage')
@@ -69,63 +194,33 @@ class Grid(BaseComponent):
                 'lblDisplaying': '/' + self.pagingToolbarPath + '/div[@data-mg-comp="displayItem"]'
             }
 
-    def _select(self, select, **filterAttrs):
+    def _select(self, select, allPages=False, limit=None, first=False, **filterAttrs):
         """
             Select/unselect grid row by checking/unchecking checkbox
             @param select: Select rows if True, unselect if False
+            @param allPages, limit, first: Which matching rows to process, see iterRows().
         """
         self.refreshColumnNames()
         # If grid has no checkbox'ed fields
         if 'selected' not in self.columnNames:
             raise AttributeError('Grid rows not selectable.')
-        # If filtering attributes provided, go row by row, and select those satisfying filtering
-        #   condition
+        # If filtering attributes provided, select rows satisfying filtering condition, page by
+        #   page: rows of page needing change are toggled all at once, then their final state is
+        #   verified with single read
         if filterAttrs:
-            # <tr> elements (rows) in grid table
-            gridRows = self.getChildren(relativePath=self.tableRelativePath)
-            for gridRow in gridRows:
-                resultRow = {}
-                # <tr class='...'>
-                rowClass = gridRow.getAttribute(attributeName='class', suppressLog=True)
-                # 'Simplified' version of row
-                if 'x-grid-data-row' in rowClass:
-                    cellPath = self.dataCellPath
-                # 'Complicated' version of row with <table> in place of <td>
-                elif 'x-grid-wrap-row' in rowClass:
-                    cellPath = self.wrapCellPath
-                rowCells = gridRow.getChildren(relativePath=cellPath)
-                # Go through all cells in row
-                for cellIndex in range(len(self.columnNames)):
-                    # <td class='...'>
-                    cellClass = rowCells[cellIndex].getAttribute(attributeName='class', suppressLog=True)
-                    # If cell represent checkbox
-                    if 'x-grid-cell-row-checker' in cellClass:
-                        if 'x-grid-row-selected' in rowClass:
-                            # 'selected': True
-                            resultRow[self.columnNames[cellIndex]] = True
-                        else:
-                            # 'selected': False
-                            resultRow[self.columnNames[cellIndex]] = False
-                        # Getting inner (clickable) element of checkbox
-                        clickableComponent = rowCells[cellIndex].getChild(relativePath='/div/div')
-                    else:
-                        # <column_name>: <cell_text>
-                        resultRow[self.columnNames[cellIndex]] = rowCells[cellIndex].element.text()
-                # If grid row confirms filtering condition
-                if self._satisfyFilters(resultRow, filterAttrs):
-                    # If checkbox state is opposite to required
-                    if ('x-grid-row-selected' in rowClass) != select:
-                        clickableComponent.element.click()
-                        # Wait until check box is marked as selected
-                        timeout = Timeout(timeout=self.driver.timeout, description='%s._select(): Setting row check box state timed out.'
-                            % self.name)
-                        while ('x-grid-row-selected' in
-                        gridRow.getAttribute(attributeName='class', suppressLog=True)) != select:
-                            if timeout.exceeded(raiseException=False):
-                                raise ComponentFailedStateException(message='%s._select(): Setting row check box state timed out.'
-                                % self.name, driver=self.driver, screenshotName=self.name +
-                                '._select')
-                            time.sleep(self.driver.delay)
+            if first:
+                limit = 1
+            for pageRows in self._iterPages(rowFilter=RowFilter.compile(filterAttrs),
+            allPages=allPages):
+                if limit is not None:
+                    pageRows = pageRows[:limit]
+                    limit -= len(pageRows)
+                # Rows whose checkbox state is opposite to required
+                self._setRowsSelected(rows=[row for row, _ in pageRows if
+                    ('x-grid-row-selected' in row['class']) != select], select=select)
+                # Following pages are only read while more rows are wanted
+                if limit == 0:
+                    break
         # If no filtering attributes provided, click on 'Select All' checkbox in header
         else:
             # Checkbox in grid's header
@@ -136,29 +231,61 @@ class Grid(BaseComponent):
             if 'x-grid-hd-checker-on' not in headerCheckBox.getAttribute(attributeName='class',
             suppressLog=True):
                 clickableComponent.element.click()
-                timeout = Timeout(timeout=self.driver.timeout, description='%s._select(): Setting header check box state timed out.'
-                    % self.name)
-                while 'x-grid-hd-checker-on' not in \
-                headerCheckBox.getAttribute(attributeName='class', suppressLog=True):
-                    if timeout.exceeded(raiseException=False):
-                        raise ComponentFailedStateException(message='%s._select(): Setting header check box state timed out.'
-                        % self.name, driver=self.driver, screenshotName=self.name + '._select')
-                    time.sleep(self.driver.delay)
+                self._waitUntil(condition.hasClass(headerCheckBox, 'x-grid-hd-checker-on'),
+                    methodName='_select')
             # If ordered unselect all, uncheck header checkbox to make all rows unselected
             if not select:
                 clickableComponent.element.click()
-                timeout = Timeout(timeout=self.driver.timeout, description='%s._select(): Setting header check box state timed out.'
-                    % self.name)
-                while 'x-grid-hd-checker-on' in headerCheckBox.getAttribute(attributeName='class',
-                suppressLog=True):
-                    if timeout.exceeded(raiseException=False):
-                        raise ComponentFailedStateException(message='%s._select(): Setting header check box state timed out.'
-                        % self.name, driver=self.driver, screenshotName=self.name + '._select')
-                    time.sleep(self.driver.delay)
+                self._waitUntil(condition.lacksClass(headerCheckBox, 'x-grid-hd-checker-on'),
+                    methodName='_select')
+
+    def _setRowsSelected(self, rows, select):
+        """
+            Select/unselect given rows of current page in single operation and wait until all of
+              them are in required state. With useSelectionModel, rows are applied to Ext selection
+              model of grid in single script call, otherwise their checkboxes are clicked one
+              after another without waiting in between.
+            @param rows: List of rows as read by _readRows().
+            @param select: Select rows if True, unselect if False.
+        """
+        if not rows:
+            return
+        if self.useSelectionModel:
+            self.webDriver.execute_script(self._getStoreScript(scripts.selectGridRecordsId, """
+                var view = grid.getView(), selectionModel = grid.getSelectionModel();
+                var nodes = document.evaluate(arguments[1], document, null,
+                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                var records = [];
+                for (var i = 0; i < arguments[2].length; i++) {
+                    var node = nodes.snapshotItem(arguments[2][i] - 1);
+                    records.push(view.getRecord(view.findItemByChild(node) || node));
+                }
+                if (arguments[3]) {
+                    selectionModel.select(records, true);
+                } else {
+                    selectionModel.deselect(records);
+                }
+            """), self.selector, self.selector + self.tableRelativePath,
+                [row['index'] for row in rows], select)
+            # Script changes page behind WebDriver's back, see Driver.mutatingCommands
+            self.driver.stateMemo.clear()
+        else:
+            for row in rows:
+                self._getCheckerComponent(row).element.click()
+        # Final state of all rows verified at once
+        isSelected = condition.hasClass if select else condition.lacksClass
+        rowsSelected = condition.AllOf(*[isSelected(self._getRowComponent(row),
+            'x-grid-row-selected') for row in rows])
+        if not condition.evaluate(driver=self.driver, conditions=[rowsSelected])[0]:
+            raise ComponentFailedStateException(message='%s._select(): Time out.' % self.name,
+                driver=self.driver, screenshotName=self.name + '._select')
+        LOG.l5('%s._setRowsSelected(%s rows, %s)' % (self.name, len(rows), select))
 
     def select(self, **filterAttrs):
         """
-            Select rows in grid by specifying filtering parameters (see _satisfyFilters())
+            Select rows in grid by specifying filtering parameters (see _satisfyFilters()). Rows
+              on all pages, or first matching ones only, are selected with allPages, limit and
+              first (see iterRows()).
         """
         LOG.l4('%s.select(%s)' % (self.name, filterAttrs))
         return self._select(select=True, **filterAttrs)
@@ -170,6 +297,23 @@ class Grid(BaseComponent):
         LOG.l4('%s.unselect(%s)' % (self.name, filterAttrs))
         return self._select(select=False, **filterAttrs)
 
+    def selectOnly(self, **filterAttrs):
+        """
+            Make rows of current page satisfying filtering parameters (see _satisfyFilters()) the
+              only selected ones, same as unselect() followed by select(), but rows already in
+              required state are not touched, so nothing is clicked if selection is right already.
+        """
+        self.refreshColumnNames()
+        if 'selected' not in self.columnNames:
+            raise AttributeError('Grid rows not selectable.')
+        rowFilter = RowFilter.compile(filterAttrs)
+        for pageRows in self._iterPages(rowFilter=RowFilter.compile({}), allPages=False):
+            for select in [False, True]:
+                self._setRowsSelected(rows=[row for row, resultRow in pageRows if
+                    rowFilter(resultRow) == select and ('x-grid-row-selected' in row['class']) !=
+                    select], select=select)
+        LOG.l4('%s.selectOnly(%s)' % (self.name, filterAttrs))
+
     def sort(self, column, ascend=True):
         """
             Sort the grid by given column in ascending or descending order.
@@ -189,13 +333,12 @@ class Grid(BaseComponent):
             except ValueError:
                 raise LookupError("Column '%s' is not found." % column)
         if cellIndex is not None:
-            headerCells = self.getChildren(relativePath=self.headerRelativePath)
-            headerCellClass = headerCells[cellIndex].getAttribute(attributeName='class',
-                suppressLog=True)
+            headerCellClass = self.columns[cellIndex]['class']
             if 'x-column-header-checkbox' in headerCellClass:
                 raise AttributeError("Unable to sort by checkbox'ed field.")
             if ('x-column-header-sort-' + order) not in headerCellClass:
-                clickableComponent = headerCells[cellIndex].getChild(relativePath='/div')
+                clickableComponent = self.getChild(relativePath=self.headerRelativePath +
+                    '[%s]/div' % self.columns[cellIndex]['position'])
                 clickableComponent.element.click()
                 # TODO: Wait until completion
         else:
@@ -210,11 +353,9 @@ class Grid(BaseComponent):
               ex. {'column': 'serial_number', 'ascend': True}
         """
         self.refreshColumnNames()
-        # Elements of header
-        headerCells = self.getChildren(relativePath=self.headerRelativePath)
         cellName = None
-        for cellIndex in range(len(headerCells)):
-            cellClass = headerCells[cellIndex].getAttribute(attributeName='class', suppressLog=True)
+        for cellIndex in range(len(self.columns)):
+            cellClass = self.columns[cellIndex]['class']
             # If cell is marked as sorted in ascending order
             if 'x-column-header-sort-ASC' in cellClass:
                 # Get name of cell (ex. 'serial_number')
@@ -243,73 +384,74 @@ class Grid(BaseComponent):
             @param valuesCondition: Determines how list values are compared - AND/OR. Default is OR.
             @param matchPattern: If Boolean True, does regex comparison. Default is False.
               Applicable only for attributes and not for values list.
+            To filter many rows, compile filter once with RowFilter.compile() instead.
         """
-        filterAttrs = copy.deepcopy(filterAttrs)
-        LOG.l5('Input Attributes: ', attributes)
-        LOG.l5('Input Filters: ', filterAttrs)
-        if not len(filterAttrs.keys()):
-            return True
-        attributeCondition = filterAttrs.get('attributeCondition', 'OR').upper()
-        if 'attributeCondition' in filterAttrs:
-            del filterAttrs['attributeCondition']
-        valuesCondition = filterAttrs.get('valuesCondition', 'OR').upper()
-        if 'valuesCondition' in filterAttrs:
-            del filterAttrs['valuesCondition']
-        matchPattern = filterAttrs.get('matchPattern', False)
-        if 'matchPattern' in filterAttrs:
-            del filterAttrs['matchPattern']
-        attrCount = 0
-        for fAttr in filterAttrs.keys():
-            if fAttr in attributes:
-                if any([isinstance(filterAttrs[fAttr], attributeType) for attributeType in (int,
-                str, unicode)]):
-                    if matchPattern:
-                        if len(re.findall(str(filterAttrs[fAttr]), str(attributes[fAttr]))):
-                            if attributeCondition == 'OR':
-                                return True
-                            else:
-                                attrCount += 1
-                    else:
-                        if str(attributes[fAttr]) == str(filterAttrs[fAttr]):
-                            if attributeCondition == 'OR':
-                                return True
-                            else:
-                                attrCount += 1
-                # If filterAttrs key is list
-                elif isinstance(filterAttrs[fAttr], list):
-                    valCount = 0
-                    valFound = False
-                    for value in filterAttrs[fAttr]:
-                        if value in attributes[fAttr]:
-                            if valuesCondition == 'OR':
-                                valFound = True
-                                break
-                            else:
-                                valCount += 1
-                    if attributeCondition == 'OR':
-                        if valuesCondition == 'OR' and valFound:
-                            return True
-                        if valuesCondition == 'AND' and valCount == len(filterAttrs[fAttr]):
-                            attrCount += 1
-                    if attributeCondition == 'AND':
-                        if valuesCondition == 'OR' and valFound:
-                            attrCount += 1
-                        elif valuesCondition == 'AND' and valCount == len(filterAttrs[fAttr]):
-                            attrCount += 1
-        if attributeCondition == 'AND' and attrCount == len(filterAttrs):
-            return True
-        if attributeCondition == 'OR' and attrCount > 0:
-            return True
-        return False
+        return RowFilter.compile(filterAttrs)(attributes)
 
-    def find(self, allPages=False, **filterAttrs):
+    def find(self, allPages=False, budget=None, **filterAttrs):
         """
             Find all rows of grid that satisfy filterAttrs
             @param attributeCondition: Determine how attributes are compared: AND/OR. Default: OR
             @param valuesCondition: Determine how list values are compared: AND/OR. Default: OR
+            @param budget: Time in seconds finding may take in total (see Driver.deadline()).
+              Default is driver's budget per page read, so walk through all pages of large grid
+              gets as much time per page as reading of single page.
             @return: List of dictionaries representing matching rows of grid
         """
+        if budget is None:
+            budget = self.driver.budget * (self.pages if allPages and not self.useStore else 1)
+        with self.driver.deadline(budget=budget):
+            resultRows = list(self.iterRows(allPages=allPages, **filterAttrs))
+        LOG.l4('%s.find(%s)' % (self.name, filterAttrs))
+        return resultRows
+
+    def iterRows(self, allPages=True, limit=None, first=False, **filterAttrs):
+        """
+            Iterate over rows of grid that satisfy filterAttrs (see find()). Rows are read page by
+              page, and next page is only requested when consumer asks for more rows, so
+              iteration stopped early (ex. by 'break') saves reading of remaining pages.
+            @param allPages: If True (default), start from first page and continue to following
+              pages. If False, iterate over current page only.
+            @param limit: Maximum number of rows to yield. Default is no limit.
+            @param first: If True, yield first matching row only (same as limit=1).
+            @return: Generator of dictionaries representing matching rows of grid.
+        """
+        rows = self._iterRows(rowFilter=RowFilter.compile(filterAttrs), allPages=allPages,
+            fromStore=self.useStore)
+        for _, resultRow in self._limitRows(rows, limit=limit, first=first):
+            yield resultRow
+
+    @staticmethod
+    def _limitRows(rows, limit=None, first=False):
+        if first:
+            limit = 1
+        return rows if limit is None else itertools.islice(rows, limit)
+
+    def _iterRows(self, rowFilter, allPages, fromStore=False):
+        """
+            Generator of matching rows as pairs (row as read by _readRows(), row parsed by
+              _parseRow()), see iterRows().
+        """
+        for pageRows in self._iterPages(rowFilter=rowFilter, allPages=allPages,
+        fromStore=fromStore):
+            for row, resultRow in pageRows:
+                yield row, resultRow
+
+    def _iterPages(self, rowFilter, allPages, fromStore=False):
+        """
+            Generator of matching rows grouped by grid page, as lists of pairs (see _iterRows()).
+              Next page is requested when consumer asks for it, so rows of a page may be acted
+              upon before grid is paged.
+            @param fromStore: If True and allPages, read all rows from grid's store at once (see
+              getStoreRows()). Rows are yielded as single group of pairs (None, row parsed by
+              _parseRow()), as they have no elements on page, so consumers acting upon rows
+              (ex. select(), clickLink()) page through grid instead.
+        """
         self.refreshColumnNames()
+        # Whole data set is available from grid's store without paging through grid
+        if allPages and fromStore:
+            yield [(None, resultRow) for resultRow in self.getStoreRows() if rowFilter(resultRow)]
+            return
         if allPages:
             if self.page > 1:
                 self.goFirstPage()
@@ -317,84 +459,322 @@ class Grid(BaseComponent):
         # Process current page only
         else:
             lastPage = self.page
-        resultRows = []
         while self.page <= lastPage:
-            # List of all rows in page
-            gridRows = self.getChildren(relativePath=self.tableRelativePath)
-            # For each row
-            for gridRow in gridRows:
-                resultRow = {}
-                # Get value of <tr class> representing row
-                rowClass = gridRow.getAttribute(attributeName='class', suppressLog=True)
-                # 'Simplified' version of row
-                if 'x-grid-data-row' in rowClass:
-                    cellPath = self.dataCellPath
-                # 'Complicated' version of row with <table> in place of <td>
-                elif 'x-grid-wrap-row' in rowClass:
-                    cellPath = self.wrapCellPath
-                rowCells = gridRow.getChildren(relativePath=cellPath)
-                # For each cell in current row
-                for cellIndex in range(len(self.columnNames)):
-                    # <td class>
-                    cellClass = rowCells[cellIndex].element.get_attribute('class')
-                    # If cell represent checkbox
-                    if 'x-grid-cell-row-checker' in cellClass:
-                        # If checkbox selected
-                        if 'x-grid-row-selected' in rowClass:
-                            # {'selected': True}
-                            resultRow[self.columnNames[cellIndex]] = True
-                        else:
-                            # {'selected': False}
-                            resultRow[self.columnNames[cellIndex]] = False
-                    else:
-                        # If cell is not checkbox, get its visible text
-                        resultRow[self.columnNames[cellIndex]] = rowCells[cellIndex].element.text()
+            pageRows = []
+            rows = self._readRows()
+            self._indexRows(rows)
+            # For each row in page
+            for row in rows:
+                resultRow = self._parseRow(row)
                 # Check if row satisfies filter condition
-                if self._satisfyFilters(resultRow, filterAttrs):
-                    resultRows.append(resultRow)
+                if rowFilter(resultRow):
+                    pageRows.append((row, resultRow))
+            yield pageRows
             if self.page == lastPage:
                 break
             else:
                 self.goNextPage()
                 # Wait until next page loaded
-                WebDriverWait(driver=self.webDriver, timeout=self.driver.timeout).until(lambda _:
-                self.webDriver.execute_script(script='return document.readyState') == 'complete')
-        LOG.l4('%s.find(%s)' % (self.name, filterAttrs))
-        return resultRows
+                WebDriverWait(driver=self.webDriver, timeout=self.driver.timeout).until(
+                    lambda _: self.webDriver.execute_script(script=scripts.tag(
+                    scripts.readyStateId, 'return document.readyState')) == 'complete')
 
     def refreshColumnNames(self):
         """
             Update list of normalized column names (lower case, ' ' -> '_') in grid(ex. ['selected',
               'name', 'consistency_group', 'size', 'state', 'serial_number', 'mapping',
-              'creation_time'])
-        """
-        if not self.columnNames:
-            columnNames = []
-            for headerItem in self.getChildren(relativePath=self.headerRelativePath):
-                if headerItem.getCSSProperty(propertyName='display') != 'none':
-                    headerItemClass = headerItem.getAttribute(attributeName='class',
-                        suppressLog=True)
-                    columnName = headerItem.getAttribute(attributeName='data-mg-comp',
-                        suppressLog=True)
-                    # After 'or': some grids have first unnamed column which is not checkbox,
-                    #   but its belonging cells are checkboxes. Assumption is to take them as
-                    #   'Select all rows' checkboxes.
-                    if ('x-column-header-checkbox' in headerItemClass) or (('x-column-header-first'
-                    in headerItemClass) and not columnName):
-                        columnNames.append('selected')
+              'creation_time']) and list of visible columns (see getColumns()). Header is checked
+              in single script call, which returns its elements only if fingerprint of header
+              (number of elements and hash of their names, visibility and classes) has changed
+              since last call, so columns shown, hidden or re-sorted later are noticed.
+        """
+        # Returns JSON of {'fingerprint': ..., 'columns': [{'position': <1-based position among
+        #   header elements>, 'class': ..., 'name': <data-mg-comp>, 'visible': ..., 'tag': ...,
+        #   'id': ..., 'text': ...}, ...]}, without 'columns' if fingerprint is the known one
+        script = """
+            var headers = document.evaluate(arguments[0], document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var columns = [], parts = [];
+            for (var index = 0; index < headers.snapshotLength; index++) {
+                var header = headers.snapshotItem(index);
+                var column = {
+                    'position': index + 1,
+                    'class': header.getAttribute('class') || '',
+                    'name': header.getAttribute('data-mg-comp'),
+                    'visible': window.getComputedStyle(header).display !== 'none',
+                    'tag': header.tagName.toLowerCase(),
+                    'id': header.id,
+                    'text': (header.innerText || header.textContent || '').replace(
+                        /^\\s+|\\s+$/g, '')
+                };
+                columns.push(column);
+                parts.push([column.name, column.visible, column['class']].join('|'));
+            }
+            var text = parts.join(';'), hash = 5381;
+            for (index = 0; index < text.length; index++) {
+                hash = ((hash * 33) ^ text.charCodeAt(index)) >>> 0;
+            }
+            var fingerprint = headers.snapshotLength + ':' + hash;
+            if (fingerprint === arguments[1]) {
+                return JSON.stringify({'fingerprint': fingerprint});
+            }
+            return JSON.stringify({'fingerprint': fingerprint, 'columns': columns});
+        """
+        details = json.loads(self.webDriver.execute_script(scripts.tag(scripts.getGridColumnsId,
+            script), self.selector + self.headerRelativePath, self.columnsFingerprint))
+        if 'columns' not in details:
+            return
+        columns = []
+        for column in details['columns']:
+            if column['visible']:
+                columnName = self._getColumnName(headerClass=column['class'],
+                    columnName=column['name'])
+                if columnName is None:
+                    raise ValueError("Invalid header element type: tag=%s, id=%s, text=%s" %
+                        (column['tag'], column['id'], column['text']))
+                column['name'] = columnName
+                columns.append(column)
+        self.columns = columns
+        self.columnNames = [column['name'] for column in columns]
+        self.columnsFingerprint = details['fingerprint']
+        LOG.l5('%s.refreshColumnNames(): %s' % (self.name, self.columnNames))
+
+    def getColumns(self):
+        """
+            @return: List of visible columns of grid as dictionaries {'position': <1-based position
+              among header elements>, 'class': <class of header element>, 'name': <column
+              name>, ...}
+        """
+        self.refreshColumnNames()
+        return self.columns
+
+    def _getColumnName(self, headerClass, columnName):
+        """
+            Return normalized name of column by attributes of its header element.
+            @param headerClass: Value of 'class' of header element.
+            @param columnName: Value of 'data-mg-comp' of header element (may be None).
+            @return: Column name (ex. 'selected', 'name', 'health_state'), None if header element
+              is not recognized.
+        """
+        # After 'or': some grids have first unnamed column which is not checkbox, but its
+        #   belonging cells are checkboxes. Assumption is to take them as 'Select all rows'
+        #   checkboxes.
+        if ('x-column-header-checkbox' in headerClass) or (('x-column-header-first' in
+        headerClass) and not columnName):
+            return 'selected'
+        if columnName is not None and 'health_state_column' in columnName:
+            return 'health_state'
+        return columnName
+
+    def getSnapshot(self, rowPath=None):
+        """
+            Read all rows of current grid page in single script call instead of querying each row
+              and cell with separate WebDriver commands.
+            @param rowPath: Path to rows relative to grid element. Default is all rows of page
+              (tableRelativePath).
+            @return: List of dictionaries representing rows in order of appearance, ex.
+              [{'index': 1, 'class': 'x-grid-row x-grid-data-row ...', 'cells': [{'class':
+              'x-grid-cell-row-checker ...', 'text': ''}, {'class': '...', 'text': 'LUN_1'}, ...],
+              'recordId': 'ext-record-1'}, ...], where 'index' is 1-based position of row in grid
+              table and 'recordId' is id of Ext record shown by row (None if not rendered).
+        """
+        script = """
+            var rowPath = arguments[0], dataCellPath = arguments[1], wrapCellPath = arguments[2];
+            var evaluate = function (path, context) {
+                return document.evaluate(path, context, null,
+                    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            };
+            var rows = evaluate(rowPath, document);
+            var result = [];
+            for (var rowIndex = 0; rowIndex < rows.snapshotLength; rowIndex++) {
+                var row = rows.snapshotItem(rowIndex);
+                var rowClass = row.getAttribute('class') || '';
+                var cellPath = null;
+                if (rowClass.indexOf('x-grid-data-row') >= 0) {
+                    cellPath = dataCellPath;
+                } else if (rowClass.indexOf('x-grid-wrap-row') >= 0) {
+                    cellPath = wrapCellPath;
+                }
+                var cells = [];
+                if (cellPath !== null) {
+                    var rowCells = evaluate('.' + cellPath, row);
+                    for (var cellIndex = 0; cellIndex < rowCells.snapshotLength; cellIndex++) {
+                        var cell = rowCells.snapshotItem(cellIndex);
+                        cells.push({
+                            'class': cell.getAttribute('class') || '',
+                            'text': (cell.innerText || cell.textContent || '').replace(/^\\s+|\\s+$/g, '')
+                        });
+                    }
+                }
+                // Ext record id is held either by row itself or by inner row of wrapped row
+                var recordNode = evaluate('descendant-or-self::*[@data-recordid]', row)
+                    .snapshotItem(0);
+                result.push({'index': rowIndex + 1, 'class': rowClass, 'cells': cells,
+                    'recordId': recordNode ? recordNode.getAttribute('data-recordid') : null});
+            }
+            return JSON.stringify(result);
+        """
+        snapshot = json.loads(self.webDriver.execute_script(scripts.tag(scripts.getGridSnapshotId,
+            script), self.selector + (rowPath or self.tableRelativePath), self.dataCellPath,
+            self.wrapCellPath))
+        LOG.l5('%s.getSnapshot(): %s rows' % (self.name, len(snapshot)))
+        return snapshot
+
+    def _readRows(self, rowPath=None):
+        """
+            Read rows of current grid page either as snapshot (see getSnapshot()) or element by
+              element, depending on useSnapshot.
+            @param rowPath: Path to rows relative to grid element, see getSnapshot().
+            @return: List of rows in format of getSnapshot().
+        """
+        if self.useSnapshot:
+            return self.getSnapshot(rowPath=rowPath)
+        rows = []
+        gridRows = self.getChildren(relativePath=rowPath or self.tableRelativePath)
+        for rowIndex in range(len(gridRows)):
+            # <tr class='...'>
+            rowClass = gridRows[rowIndex].getAttribute(attributeName='class', suppressLog=True)
+            cells = []
+            cellPath = self._getCellPath(rowClass)
+            if cellPath is not None:
+                for rowCell in gridRows[rowIndex].getChildren(relativePath=cellPath):
+                    # <td class='...'>
+                    cellClass = rowCell.getAttribute(attributeName='class', suppressLog=True)
+                    # Text of checkbox cell is of no interest
+                    if 'x-grid-cell-row-checker' in cellClass:
+                        cellText = ''
                     else:
-                        if columnName is not None:
-                            if 'health_state_column' in columnName:
-                                columnNames.append('health_state')
-                            else:
-                                columnNames.append(columnName)
-                        else:
-                            raise ValueError("Invalid header element type: tag=%s, id=%s, text=%s" %
-                                (headerItem.element.tag_name(), headerItem.element.id(),
-                                headerItem.element.text()))
-            self.columnNames = columnNames
-
-    def clickLink(self, **filterAttrs):
+                        cellText = rowCell.element.text()
+                    cells.append({'class': cellClass, 'text': cellText})
+            # Ext record id is held either by row itself or by inner row of wrapped row, the
+            #   same lookup as in getSnapshot()
+            recordElements = gridRows[rowIndex].element.find_elements_by_xpath(
+                xpath='descendant-or-self::*[@data-recordid]')
+            rows.append({'index': rowIndex + 1, 'class': rowClass, 'cells': cells,
+                'recordId': recordElements[0].get_attribute(name='data-recordid') if
+                recordElements else None})
+        return rows
+
+    def _getCellPath(self, rowClass):
+        """
+            Return relative path from row to its cells depending on type of row.
+            @param rowClass: Value of <tr class> representing row.
+        """
+        # 'Simplified' version of row
+        if 'x-grid-data-row' in rowClass:
+            cellPath = self.dataCellPath
+        # 'Complicated' version of row with <table> in place of <td>
+        elif 'x-grid-wrap-row' in rowClass:
+            cellPath = self.wrapCellPath
+        else:
+            cellPath = None
+        return cellPath
+
+    def _parseRow(self, row):
+        """
+            Convert row read by _readRows() into dictionary of column names and cell values, ex.
+              {'selected': False, 'name': 'LUN_1', 'size': '1 GiB', ...}
+        """
+        resultRow = {}
+        for cellIndex in range(min(len(self.columnNames), len(row['cells']))):
+            # If cell represent checkbox
+            if 'x-grid-cell-row-checker' in row['cells'][cellIndex]['class']:
+                # {'selected': True/False}
+                resultRow[self.columnNames[cellIndex]] = 'x-grid-row-selected' in row['class']
+            else:
+                # <column_name>: <cell_text>
+                resultRow[self.columnNames[cellIndex]] = row['cells'][cellIndex]['text']
+        return resultRow
+
+    def _getRowComponent(self, row):
+        """
+            Return row read by _readRows() as BaseComponent. Row is addressed by id of Ext record
+              it shows, so its selector keeps pointing at the same logical row after sorting or
+              reloading of grid. Rows without record id are addressed by position in grid.
+        """
+        if row.get('recordId'):
+            return BaseComponent(driver=self.driver, selector=self.selector +
+                self.tableRelativePath + '[descendant-or-self::*[@data-recordid=%s]]' %
+                self._quote(row['recordId']), name=self.name + '.row[%s]' % row['recordId'])
+        return BaseComponent(driver=self.driver, selector=self.selector + self.tableRelativePath +
+            '[%s]' % row['index'], name=self.name + '.row')
+
+    @staticmethod
+    def _quote(text):
+        """
+            Return text as XPath string literal.
+        """
+        if '"' not in text:
+            return '"%s"' % text
+        if "'" not in text:
+            return "'%s'" % text
+        return 'concat(%s)' % ', \'"\', '.join(['"%s"' % part for part in text.split('"')])
+
+    def _indexRows(self, rows):
+        """
+            Replace index of row positions by record id with rows of page just read.
+        """
+        self.rowIndex = dict([(row['recordId'], row['index']) for row in rows if
+            row.get('recordId')])
+
+    def _readRowById(self, recordId):
+        """
+            Read row showing Ext record of given id anew. If position of row is known from page
+              read before (see rowIndex), that row only is read; current page is read, and index
+              rebuilt, if position is unknown or row there shows other record now (ex. grid
+              sorted or paged since).
+            @return: Row in format of getSnapshot(), None if row not found on current page.
+        """
+        position = self.rowIndex.get(recordId)
+        if position is not None:
+            rows = self._readRows(rowPath=self.tableRelativePath + '[%s]' % position)
+            if rows and rows[0]['recordId'] == recordId:
+                rows[0]['index'] = position
+                return rows[0]
+        rows = self._readRows()
+        self._indexRows(rows)
+        for row in rows:
+            if row['recordId'] == recordId:
+                return row
+        return None
+
+    def getRowById(self, recordId):
+        """
+            Return row showing Ext record of given id on current page. Row is read anew on every
+              call, its position known from page read before (by find(), iterRows() etc.) saves
+              reading of whole page.
+            @param recordId: Id of Ext record (value of 'data-recordid' of row).
+            @return: Dictionary representing row (see find()), None if row not found.
+        """
+        self.refreshColumnNames()
+        row = self._readRowById(recordId)
+        LOG.l5('%s.getRowById(%s): %s' % (self.name, recordId, row is not None))
+        return self._parseRow(row) if row is not None else None
+
+    def getCell(self, recordId, columnName):
+        """
+            Return cell of row showing Ext record of given id as BaseComponent.
+            @param recordId: Id of Ext record (value of 'data-recordid' of row).
+            @param columnName: Name of column (see refreshColumnNames()).
+        """
+        self.refreshColumnNames()
+        row = self._readRowById(recordId)
+        if row is None:
+            raise AttributeError('Grid row not found: %s' % recordId)
+        return self._getRowComponent(row).getChild(relativePath=self._getCellPath(row['class']) +
+            '[%s]' % (self.columnNames.index(columnName) + 1))
+
+    def _getCheckerComponent(self, row):
+        """
+            Return inner (clickable) element of checkbox cell of row read by _readRows().
+        """
+        for cellIndex in range(len(row['cells'])):
+            if 'x-grid-cell-row-checker' in row['cells'][cellIndex]['class']:
+                return self._getRowComponent(row).getChild(relativePath=
+                    self._getCellPath(row['class']) + '[%s]/div/div' % (cellIndex + 1))
+        raise AttributeError('Grid row not selectable.')
+
+    def clickLink(self, allPages=False, **filterAttrs):
         """
             Make a click on link in grid cell
             @param filterAttrs: Pairs of column name and sought-for value locating cell (ex. name=
@@ -403,6 +783,8 @@ class Grid(BaseComponent):
               locates first encountered row in grid which satisfies filtering options
             @param click: 1-element dictionary which specifies name of cell in found row and text
               value presented in cell (ex. click={'consistency_group': 'CG_1'})
+            @param allPages: If True, look for row on all pages, starting from first one, and stop
+              paging at first matching row. Default is current page only.
         """
         self.refreshColumnNames()
         # Memorize to variable, then remove 'click' from filter attributes
@@ -422,63 +804,36 @@ class Grid(BaseComponent):
         isLinkFound = False
         cellName = click.keys()[0]
         searchText = click[click.keys()[0]]
-        # All rows on current page of grid
-        gridRows = self.getChildren(relativePath=self.tableRelativePath)
-        # For each row
-        for gridRow in gridRows:
-            resultRow = {}
-            # Row: <tr class>
-            rowClass = gridRow.getAttribute(attributeName='class', suppressLog=True)
-            # 'Simplified' version of row
-            if 'x-grid-data-row' in rowClass:
-                cellPath = self.dataCellPath
-            # 'Complicated' version of row with <table> in place of <td>
-            elif 'x-grid-wrap-row' in rowClass:
-                cellPath = self.wrapCellPath
-            self.rowCells = gridRow.getChildren(relativePath=cellPath)
-            # For each cell in current row
-            for cellIndex in range(len(self.columnNames)):
-                cellClass = self.rowCells[cellIndex].getAttribute(attributeName='class',
-                    suppressLog=True)
-                # If cell represents checkbox
-                if 'x-grid-cell-row-checker' in cellClass:
-                    # If checkbox selected
-                    if 'x-grid-row-selected' in rowClass:
-                        # {'selected': True}
-                        resultRow[self.columnNames[cellIndex]] = True
-                    else:
-                        # {'selected': False}
-                        resultRow[self.columnNames[cellIndex]] = False
+        # For each row of grid satisfying filter condition
+        for row, resultRow in self._iterRows(rowFilter=RowFilter.compile(filterAttrs),
+        allPages=allPages):
+            # TODO: Investigate deeper
+            # Get index of cell among all cells in row by name (ex. 'Name' -> 1)
+            targetCellIndex = self.columnNames.index(cellName) + 1
+            targetCell = self._getRowComponent(row).getChild(relativePath='/td[%s]' %
+                targetCellIndex)
+            timeout = Timeout(timeout=self.driver.timeout, description="%s.clickLink(click={'%s': '%s'}): Link not found."
+                % (self.name, cellName, searchText))
+            while True:
+                if not timeout.exceeded(raiseException=False):
+                    try:
+                        # <a> can have various levels of nesting in <td>
+                        targetLink = targetCell.element.\
+                        find_element_by_xpath(xpath='//a[contains(text(), "{searchText}")]'.
+                        format(searchText=searchText))
+                        # Click on <a href>
+                        targetLink.click()
+                        isLinkFound = True
+                        break
+                    except StaleElementReferenceException:
+                        pass
+                    self.driver.sleep()
                 else:
-                    resultRow[self.columnNames[cellIndex]] = self.rowCells[cellIndex].element.text()
-            # If row satisfies filter condition
-            if self._satisfyFilters(resultRow, filterAttrs):
-                # TODO: Investigate deeper
-                # Get index of cell among all cells in row by name (ex. 'Name' -> 1)
-                targetCellIndex = self.columnNames.index(cellName) + 1
-                targetCell = gridRow.getChild(relativePath='/td[%s]' % targetCellIndex)
-                timeout = Timeout(timeout=self.driver.timeout, description="%s.clickLink(click={'%s': '%s'}): Link not found."
-                    % (self.name, cellName, searchText))
-                while True:
-                    if not timeout.exceeded(raiseException=False):
-                        try:
-                            # <a> can have various levels of nesting in <td>
-                            targetLink = targetCell.element.\
-                            find_element_by_xpath(xpath='//a[contains(text(), "{searchText}")]'.
-                            format(searchText=searchText))
-                            # Click on <a href>
-                            targetLink.click()
-                            isLinkFound = True
-                            break
-                        except StaleElementReferenceException:
-                            pass
-                        time.sleep(self.driver.delay)
-                    else:
-                        raise ComponentFailedStateException(message="%s.clickLink(click={'%s': '%s'}): Link not found."
-                            % (self.name, cellName, searchText), driver=self.driver,
-                            screenshotName=self.name + '.clickLink')
-                if isLinkFound:
-                    break
+                    raise ComponentFailedStateException(message="%s.clickLink(click={'%s': '%s'}): Link not found."
+                        % (self.name, cellName, searchText), driver=self.driver,
+                        screenshotName=self.name + '.clickLink')
+            if isLinkFound:
+                break
         if not isLinkFound:
             raise ComponentFailedStateException(message="%s.clickLink(click={'%s': '%s'}): Link not found."
                 % (self.name, cellName, searchText), driver=self.driver, screenshotName=self.name +
@@ -542,26 +897,31 @@ class Grid(BaseComponent):
 
     def getPageDetails(self):
         """
-            Details about pages of grid. Depict paging toolbar on web UI (left bottom)
+            Details about pages of grid. Depict paging toolbar on web UI (left bottom). Paging
+              toolbar and its controls are read in single script call (see getStates()).
         """
-        hasPaging = False
-        try:
-            self.element.find_element_by_xpath(xpath=self.pagingToolbarPath)
-            hasPaging = True
-        except NoSuchElementException:
-            pass
+        self.refreshSelectors()
+        controlNames = ['btnFirstPage', 'btnPreviousPage', 'txtCurrentPage', 'btnNextPage',
+            'btnLastPage', 'lblOfNumber']
+        components = [BaseComponent(driver=self.driver, selector=self.selector + '/' +
+            '/'.join(filter(None, path.split('/'))), name=self.name) for path in
+            ['/' + self.pagingToolbarPath] + [self.selectors[name] for name in controlNames]]
+        states = self.getStates(driver=self.driver, components=components)
+        hasPaging = states[0]['present']
+        if hasPaging and not all([state['present'] for state in states[1:]]):
+            # Paging toolbar is being rendered, wait for its controls
+            condition.waitUntil(driver=self.driver, condition=condition.allOf(*[
+                condition.present(component) for component in components[1:]]))
+            states = self.getStates(driver=self.driver, components=components)
         if hasPaging:
+            controls = dict(zip(controlNames, states[1:]))
             details = {
-                'hasFirstPage': 'x-item-disabled' not in
-                    self.btnFirstPage.element.get_attribute(name='class'),
-                'hasPreviousPage': 'x-item-disabled' not in
-                self.btnPreviousPage.element.get_attribute(name='class'),
-                'page': int(self.txtCurrentPage.element.get_attribute(name='value')),
-                'hasNextPage': 'x-item-disabled' not in
-                    self.btnNextPage.element.get_attribute(name='class'),
-                'hasLastPage': 'x-item-disabled' not in
-                    self.btnLastPage.element.get_attribute(name='class'),
-                'pages': int(self.lblOfNumber.element.text().split()[1])
+                'hasFirstPage': 'x-item-disabled' not in controls['btnFirstPage']['class'],
+                'hasPreviousPage': 'x-item-disabled' not in controls['btnPreviousPage']['class'],
+                'page': int(controls['txtCurrentPage']['value']),
+                'hasNextPage': 'x-item-disabled' not in controls['btnNextPage']['class'],
+                'hasLastPage': 'x-item-disabled' not in controls['btnLastPage']['class'],
+                'pages': int(controls['lblOfNumber']['text'].split()[1])
             }
         else:
             details = {
@@ -592,3 +952,159 @@ class Grid(BaseComponent):
             details['firstRow'] = details['lastRow'] = details['rows'] = 0
         LOG.l5('%s.getRowDetails():\n%s' % (self.name, details))
         return details
+
+    def _getStoreScript(self, scriptId, body):
+        """
+            Prepend script body with lookup of Ext grid component owning head element of grid.
+              Inside of body, 'grid' refers to Ext grid panel and 'store' to its Ext.data.Store.
+            @param scriptId: Id of script (see scripts.tag()).
+            @param body: JavaScript code using 'grid' and 'store' variables.
+        """
+        return scripts.tag(scriptId, """
+            var node = document.evaluate(arguments[0], document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            var grid = null;
+            while (node && !grid) {
+                grid = node.id ? Ext.getCmp(node.id) : null;
+                node = node.parentNode;
+            }
+            if (grid && !grid.getStore) {
+                grid = grid.down('tablepanel');
+            }
+            if (!grid) {
+                throw new Error('Ext grid component not found');
+            }
+            var store = grid.getStore();
+            var getDetails = function () {
+                var total = store.getTotalCount(), pageSize = store.pageSize || total;
+                return {
+                    'total': total,
+                    'count': store.getCount(),
+                    'page': store.currentPage || 1,
+                    'pageSize': pageSize,
+                    'pages': pageSize ? Math.max(1, Math.ceil(total / pageSize)) : 1
+                };
+            };
+        """ + body)
+
+    def getStoreDetails(self):
+        """
+            Details about data set of grid as reported by Ext store backing the grid. Unlike
+              getPageDetails(), doesn't depend on paging toolbar being rendered.
+            @return: Dictionary {'total': <number_of_records_in_all_pages>, 'count':
+              <number_of_records_loaded>, 'page': <current_page>, 'pageSize':
+              <records_per_page>, 'pages': <number_of_pages>}
+        """
+        details = self.webDriver.execute_script(self._getStoreScript(scripts.getStoreDetailsId, """
+            return JSON.stringify(getDetails());
+        """), self.selector)
+        details = json.loads(details)
+        LOG.l5('%s.getStoreDetails():\n%s' % (self.name, details))
+        return details
+
+    def getStoreRows(self):
+        """
+            Return all rows of grid across all pages (including those not rendered) by reading
+              records of Ext store backing the grid in single asynchronous script call. Records
+              not loaded into store are requested through store's proxy with current filters and
+              sorters, without changing page displayed in grid. Cell values are rendered by
+              column renderers, so rows have the same format as ones returned by find().
+            @return: List of dictionaries representing rows of grid.
+        """
+        script = self._getStoreScript(scripts.getStoreRowsId, """
+            var callback = arguments[arguments.length - 1];
+            var view = grid.getView();
+            var columns = [];
+            Ext.Array.each(grid.headerCt.getGridColumns(), function (column, columnIndex) {
+                if (column.isHidden() || !column.el) {
+                    return;
+                }
+                columns.push({
+                    'column': column,
+                    'index': columnIndex,
+                    'class': column.el.dom.className || '',
+                    'name': column.el.dom.getAttribute('data-mg-comp')
+                });
+            });
+            var render = function (records) {
+                return Ext.Array.map(records, function (record, rowIndex) {
+                    var cells = Ext.Array.map(columns, function (item) {
+                        var column = item.column;
+                        var value = column.dataIndex ? record.get(column.dataIndex) : null;
+                        var text = value;
+                        if (column.renderer) {
+                            try {
+                                text = column.renderer.call(column.scope || column, value, {},
+                                    record, rowIndex, item.index, store, view);
+                            } catch (e) {
+                                text = value;
+                            }
+                        }
+                        text = (text === null || text === undefined) ? '' : String(text);
+                        return Ext.String.trim(Ext.String.htmlDecode(Ext.util.Format.stripTags(text)));
+                    });
+                    return {
+                        'selected': grid.getSelectionModel().isSelected(record),
+                        'cells': cells
+                    };
+                });
+            };
+            var finish = function (records) {
+                if (records === null) {
+                    callback(JSON.stringify({'error': 'Reading of store records failed'}));
+                    return;
+                }
+                callback(JSON.stringify({
+                    'columns': Ext.Array.map(columns, function (item) {
+                        return {'class': item['class'], 'name': item.name};
+                    }),
+                    'details': getDetails(),
+                    'rows': render(records)
+                }));
+            };
+            var total = store.getTotalCount();
+            var proxy = store.getProxy ? store.getProxy() : null;
+            // All records are already loaded into store (grid is not paged)
+            if (!proxy || store.getCount() >= total) {
+                finish(store.getRange());
+                return;
+            }
+            var config = {
+                'action': 'read',
+                'start': 0,
+                'limit': total,
+                'page': 1,
+                'filters': store.filters ? store.filters.items : [],
+                'sorters': store.sorters ? store.sorters.items : [],
+                'params': Ext.apply({}, (store.lastOptions || {}).params)
+            };
+            if (proxy.createOperation) {
+                config.callback = function (records, operation, success) {
+                    finish(success ? records : null);
+                };
+                proxy.createOperation('read', config).execute();
+            } else {
+                proxy.read(Ext.create('Ext.data.Operation', config), function (operation) {
+                    finish(operation.wasSuccessful() ? operation.getRecords() : null);
+                });
+            }
+        """)
+        result = json.loads(self.driver.executeAsyncScript(script, self.driver.timeout,
+            self.selector))
+        if 'error' in result:
+            raise ComponentException(message='%s.getStoreRows(): %s.' % (self.name,
+                result['error']), driver=self.driver, screenshotName=self.name + '.getStoreRows')
+        columnNames = [self._getColumnName(headerClass=column['class'],
+            columnName=column['name']) for column in result['columns']]
+        rows = []
+        for record in result['rows']:
+            resultRow = {}
+            for cellIndex in range(len(columnNames)):
+                if columnNames[cellIndex] == 'selected':
+                    resultRow['selected'] = record['selected']
+                elif columnNames[cellIndex] is not None:
+                    resultRow[columnNames[cellIndex]] = record['cells'][cellIndex]
+            rows.append(resultRow)
+        LOG.l5('%s.getStoreRows(): %s of %s rows' % (self.name, len(rows),
+            result['details']['total']))
+        return rows
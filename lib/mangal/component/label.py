@@ -19,12 +19,4 @@ class Label(BaseComponent):
         return text
 
     def waitUntilText(self, text, exact=False):
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.waitUntilText(%s): Time out.'
-            % (self.name, text))
-        while not ((self.element.text() == text) or ((not exact) and (text in
-        self.element.text()))):
-            if timeout.exceeded(raiseException=False):
-                raise ComponentFailedStateException(message='%s.waitUntilText(%s): Time out.' %
-                (self.name, text), driver=self.driver, screenshotName=self.name + '.waitUntilText')
-            time.sleep(self.driver.delay)
-        LOG.l5("%s.waitUntilText(text='%s')" % (self.name, text))
+        self._waitUntil(condition.text(self, text=text, exact=exact), methodName='waitUntilText')
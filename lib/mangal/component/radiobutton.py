@@ -29,12 +29,5 @@ class RadioButton(BaseComponent):
     def select(self):
         if not self.isSelected():
             self.selectableElement.element.click()
-            timeout = Timeout(timeout=self.driver.timeout, description='%s.select(): Time out.' %
-                self.name)
-            while not 'x-form-cb-checked' in self.getAttribute(attributeName='class',
-            suppressLog=True):
-                if timeout.exceeded(raiseException=False):
-                    raise ComponentFailedStateException(message='%s.select(): Time out.' %
-                    self.name, driver=self.driver, screenshotName=self.name + '.select')
-                time.sleep(self.driver.delay)
+            self._waitUntil(condition.hasClass(self, 'x-form-cb-checked'), methodName='select')
             LOG.l4('%s.select()' % self.name)
@@ -3,8 +3,16 @@ try:
 except ImportError:
     raise ImportError("As root Install python-selenium by running: 'pip install selenium'")
 
+import atexit
+import hashlib
+import itertools
 import os
+import Queue
+import sys
+import threading
 import time
+import unittest
+from contextlib import contextmanager
 
 import express
 from frlog import LOG
@@ -12,18 +20,293 @@ from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 
+from mangal import scripts
+
+
+class CommandStats(object):
+    """
+        Counts and times WebDriver commands issued through Driver, by command type (ex.
+          'findElement', 'executeScript') and by name of component, page or wizard which issued
+          them (ex. 'LUNsPage.gridLUNs'). Time spent in retry sleeps (see Driver.sleep()) is
+          recorded the same way under command type 'sleep'.
+    """
+    def __init__(self):
+        # {(command, owner): [count, total time]}
+        self.records = {}
+        self.startTime = time.time()
+        # Commands are recorded by screenshot writer's thread too (see ScreenshotWriter)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def getOwnerName(depth=2, maxDepth=30):
+        """
+            Find name of nearest component, page or wizard in call stack, i.e. the nearest
+              caller whose 'self' has attributes 'driver' and 'name'.
+        """
+        frame = sys._getframe(depth)
+        while frame is not None and maxDepth > 0:
+            caller = frame.f_locals.get('self')
+            if caller is not None and not isinstance(caller, Driver) and \
+            'driver' in getattr(caller, '__dict__', {}) and 'name' in caller.__dict__:
+                return caller.name
+            frame = frame.f_back
+            maxDepth -= 1
+        return '<test>'
+
+    @staticmethod
+    def getTestName(depth=2, maxDepth=30):
+        """
+            Find id of test case in call stack (ex. 'test_module.TestClass.test_method' when driver
+              is set up by test's setUp()).
+        """
+        frame = sys._getframe(depth)
+        while frame is not None and maxDepth > 0:
+            caller = frame.f_locals.get('self')
+            if isinstance(caller, unittest.TestCase):
+                return caller.id()
+            frame = frame.f_back
+            maxDepth -= 1
+        return 'commands'
+
+    def record(self, command, owner, duration):
+        with self._lock:
+            record = self.records.setdefault((command, owner), [0, 0.0])
+            record[0] += 1
+            record[1] += duration
+
+    def getSummary(self):
+        """
+            @return: Summary as list of lines: totals, then time per command type, per owner and
+              per (owner, command type), heaviest first.
+        """
+        with self._lock:
+            records = dict([(key, list(record)) for key, record in self.records.items()])
+        byCommand = {}
+        byOwner = {}
+        for (command, owner), (count, duration) in records.items():
+            for key, table in ((command, byCommand), (owner, byOwner)):
+                total = table.setdefault(key, [0, 0.0])
+                total[0] += count
+                total[1] += duration
+        commands = [record for (command, _), record in records.items() if command != 'sleep']
+        lines = ['Duration: %.3f s' % (time.time() - self.startTime),
+            'Commands: %d, %.3f s' % (sum([count for count, _ in commands]),
+            sum([duration for _, duration in commands])),
+            'Sleeps: %d, %.3f s' % tuple(byCommand.get('sleep', [0, 0.0]))]
+        for title, table in (('command', byCommand), ('owner', byOwner), ('owner, command',
+        dict([('%s, %s' % (owner, command), record) for (command, owner), record in
+        records.items()]))):
+            lines.append('')
+            lines.append('%-70s %8s %10s %10s' % ('By ' + title, 'count', 'total, s', 'mean, ms'))
+            for key, (count, duration) in sorted(table.items(), key=lambda item: -item[1][1]):
+                lines.append('%-70s %8d %10.3f %10.1f' % (key, count, duration,
+                    1000 * duration / count))
+        return lines
+
+
+class ScreenshotWriter(object):
+    """
+        Background worker taking and saving screenshots requested by Driver.queueScreenshot(), so
+          the failing thread doesn't block on transfer of PNG from browser. Worker issues its
+          commands under session lock of driver (see Driver._instrument()), so they don't
+          interleave with commands of test.
+    """
+    def __init__(self):
+        self._queue = Queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, driver, name):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='ScreenshotWriter')
+                self._thread.daemon = True
+                self._thread.start()
+        self._queue.put((driver, name))
+
+    def flush(self):
+        """
+            Block until all requested screenshots are saved.
+        """
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            driver, name = self._queue.get()
+            try:
+                driver.saveScreenshot(name=name)
+            except Exception, e:
+                LOG.l4('ScreenshotWriter: Screenshot not saved:', e)
+            finally:
+                self._queue.task_done()
+
+
+class SessionPool(object):
+    """
+        Pool of warm browser sessions (instances of WebDriver.Remote) shared by Drivers of one
+          process, so tests don't pay browser start up each.
+        Sessions are kept per key (WebDriver host, port and capabilities). Session is leased to
+          one Driver at a time, health-checked when leased and reset when released: cookies and
+          storage are cleared and browser is navigated to 'about:blank'. Session is recycled (quit)
+          after maxUses leases or when it fails health check or reset.
+    """
+    def __init__(self, maxUses=20):
+        """
+            @param maxUses: Number of leases after which session is quit rather than reused.
+        """
+        self.maxUses = maxUses
+        # Idle sessions per key: {key: [(webDriver, uses), ...]}
+        self._idle = {}
+        # Number of leases of sessions in use: {webDriver: uses}
+        self._leased = {}
+        self._lock = threading.Lock()
+        atexit.register(self.quitAll)
+
+    @staticmethod
+    def getKey(driverHostname, driverPort, capabilities):
+        return (driverHostname, str(driverPort), tuple(sorted((name, repr(value)) for name, value
+            in capabilities.items())))
+
+    @staticmethod
+    def _create(driverHostname, driverPort, capabilities, maximizeWindow):
+        webDriver = webdriver.Remote(command_executor='http://%s:%s/wd/hub' % (driverHostname,
+            driverPort), desired_capabilities=capabilities)
+        if maximizeWindow:
+            webDriver.maximize_window()
+        return webDriver
+
+    @staticmethod
+    def _isHealthy(webDriver):
+        try:
+            return webDriver.execute_script(scripts.tag(scripts.isHealthyId, 'return 1;')) == 1
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(webDriver):
+        """
+            Bring session to the state of newly started one. Raises WebDriverException on failure.
+        """
+        # Storage is bound to origin, so it's cleared before leaving application's page
+        webDriver.execute_script(scripts.tag(scripts.clearStorageId, """
+            try {
+                window.localStorage.clear();
+                window.sessionStorage.clear();
+            } catch (e) {}
+        """))
+        webDriver.delete_all_cookies()
+        webDriver.get('about:blank')
+
+    @staticmethod
+    def _quit(webDriver):
+        try:
+            webDriver.quit()
+        except WebDriverException, e:
+            LOG.l4('SessionPool: WebDriver.quit():', e.msg)
+
+    def lease(self, driverHostname, driverPort, capabilities, maximizeWindow=True):
+        """
+            Lease idle healthy session or start new one.
+            @return: Instance of WebDriver.Remote.
+        """
+        key = self.getKey(driverHostname, driverPort, capabilities)
+        while True:
+            with self._lock:
+                if not self._idle.get(key):
+                    break
+                webDriver, uses = self._idle[key].pop()
+            if self._isHealthy(webDriver):
+                with self._lock:
+                    self._leased[webDriver] = uses + 1
+                LOG.l4('SessionPool.lease(): Reusing session %s (lease %s)' %
+                    (webDriver.session_id, uses + 1))
+                return webDriver
+            LOG.l4('SessionPool.lease(): Discarding unhealthy session %s' % webDriver.session_id)
+            self._quit(webDriver)
+        webDriver = self._create(driverHostname=driverHostname, driverPort=driverPort,
+            capabilities=capabilities, maximizeWindow=maximizeWindow)
+        with self._lock:
+            self._leased[webDriver] = 1
+        LOG.l4('SessionPool.lease(): Started session %s' % webDriver.session_id)
+        return webDriver
+
+    def release(self, webDriver, driverHostname, driverPort, capabilities, failed=False):
+        """
+            Return session to pool, or quit it if it failed or has been used up.
+            @param failed: If True, session is known to be broken and is quit.
+        """
+        with self._lock:
+            uses = self._leased.pop(webDriver, self.maxUses)
+        if not failed and uses < self.maxUses:
+            try:
+                self._reset(webDriver)
+            except WebDriverException, e:
+                LOG.l4('SessionPool.release(): Reset failed:', e.msg)
+            else:
+                with self._lock:
+                    self._idle.setdefault(self.getKey(driverHostname, driverPort,
+                        capabilities), []).append((webDriver, uses))
+                return
+        self._quit(webDriver)
+
+    def warm(self, driverHostname, driverPort, capabilities, count, maximizeWindow=True):
+        """
+            Start count sessions in parallel and keep them idle, ahead of first lease.
+        """
+        key = self.getKey(driverHostname, driverPort, capabilities)
+
+        def start():
+            try:
+                webDriver = self._create(driverHostname=driverHostname, driverPort=driverPort,
+                    capabilities=capabilities, maximizeWindow=maximizeWindow)
+            except WebDriverException, e:
+                LOG.l4('SessionPool.warm():', e.msg)
+                return
+            with self._lock:
+                self._idle.setdefault(key, []).append((webDriver, 0))
+        threads = [threading.Thread(target=start) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def quitAll(self):
+        """
+            Quit all idle sessions (done automatically at exit of process).
+        """
+        with self._lock:
+            sessions = [webDriver for idle in self._idle.values() for webDriver, _ in idle]
+            self._idle = {}
+        for webDriver in sessions:
+            self._quit(webDriver)
+
 
 class Driver(object):
     """
         Wrapper for Selenium Remote WebDriver class.
     """
-    def __init__(self, driverHostname, driverPort, browser, maximizeWindow=True):
+    # Warm sessions shared by Drivers of process
+    pool = SessionPool()
+    # WebDriver commands which may change state of page, dropping memo of component states
+    mutatingCommands = frozenset(['clickElement', 'sendKeysToElement', 'clearElement',
+        'submitElement', 'get', 'refresh', 'goBack', 'goForward', 'mouseClick',
+        'mouseDoubleClick', 'mouseButtonDown', 'mouseButtonUp', 'sendKeysToActiveElement',
+        'w3cActions'])
+    # Background writer of failure screenshots shared by Drivers of process
+    screenshotWriter = ScreenshotWriter()
+    # Serial numbers of Drivers of process, making names of their statistics files unique
+    _serials = itertools.count(1)
+
+    def __init__(self, driverHostname, driverPort, browser, maximizeWindow=True, usePool=True):
         """
             @param driverHostname: Host name on which instance of Remote WebDriver is running.
               Ex. 'mvm-win35'
             @param driverPort: Port number which WebDriver is communicating over. Ex. 4444
             @param browser: Type of browser which is open by WebDriver: 'firefox' or 'chrome'.
             @param maximizeWindow: If True (default), maximize newly opened window in browser.
+            @param usePool: If True (default), lease browser session from pool of warm sessions
+              (see SessionPool) and return it there on quit(), rather than starting and quitting
+              own one.
         """
         LOG.info('Instantiating Mangal.Driver...')
         self.driverHostname = driverHostname
@@ -31,7 +314,35 @@ class Driver(object):
         self.browser = browser
         self.timeout = 10
         self.delay = .3
+        # Time in seconds which top-level operation (ex. opening wizard) may take in total, see
+        #   deadline()
+        self.budget = 60
+        # Deadlines (as absolute time) of operations in progress, innermost last
+        self._deadlines = []
         self._maximizeWindow = maximizeWindow
+        self.usePool = usePool
+        # Set if session is known to be broken, so it's not returned to pool
+        self.failed = False
+        # Name of command statistics file written on quit(), id of test setting up the driver
+        #   by default. File name is made unique by time, process id and serial number of driver
+        #   (see writeStats()).
+        self.statsName = CommandStats.getTestName()
+        self._serial = next(self._serials)
+        # Maximum number of screenshots queued by queueScreenshot() during driver's life (test)
+        self.screenshotLimit = 20
+        self._screenshotCount = 0
+        # Key of page state (URL and hash of DOM) and hash of content of last saved screenshot,
+        #   identical consecutive ones are neither taken nor saved (see saveScreenshot())
+        self._lastPageStateKey = None
+        self._lastScreenshotHash = None
+        # Serializes commands of test and of screenshot writer's thread in WebDriver session
+        self._sessionLock = threading.RLock()
+        # States of components read by BaseComponent.getStates(), as {key: (time, state)}. Entries
+        #   live at most stateMemoTime seconds and are dropped by any mutating command.
+        self.stateMemo = {}
+        self.stateMemoTime = .5
+        # Pages and wizards shared within driver's life, see BasePage.get()
+        self.pageCache = {}
         self._start()
 
     def _start(self):
@@ -42,10 +353,100 @@ class Driver(object):
             self.capabilities = DesiredCapabilities.CHROME.copy()
         else:
             raise FailedConfigException('Unsupported type of browser:', browser)
-        self.webDriver = webdriver.Remote(command_executor='http://%s:%s/wd/hub' %
-        (self.driverHostname, self.driverPort), desired_capabilities=self.capabilities)
-        if self._maximizeWindow:
-            self.maximizeWindow()
+        if self.usePool:
+            self.webDriver = self.pool.lease(driverHostname=self.driverHostname,
+                driverPort=self.driverPort, capabilities=self.capabilities,
+                maximizeWindow=self._maximizeWindow)
+        else:
+            self.webDriver = webdriver.Remote(command_executor='http://%s:%s/wd/hub' %
+            (self.driverHostname, self.driverPort), desired_capabilities=self.capabilities)
+            if self._maximizeWindow:
+                self.maximizeWindow()
+        # Script time out currently set in WebDriver session (see executeAsyncScript())
+        self._scriptTimeout = None
+        self.stats = CommandStats()
+        self._instrument()
+
+    def _instrument(self):
+        """
+            Route all commands of WebDriver session (including ones issued by WebElements, which
+              delegate to WebDriver.execute()) through CommandStats and session lock.
+        """
+        execute = type(self.webDriver).execute.__get__(self.webDriver)
+
+        def instrumentedExecute(command, params=None):
+            if command in self.mutatingCommands:
+                self.stateMemo.clear()
+            owner = self.stats.getOwnerName()
+            with self._sessionLock:
+                startTime = time.time()
+                try:
+                    return execute(command, params)
+                finally:
+                    self.stats.record(command=command, owner=owner, duration=time.time() -
+                        startTime)
+        self.webDriver.execute = instrumentedExecute
+
+    def sleep(self, seconds=None):
+        """
+            Pause between retries, recorded by CommandStats.
+            @param seconds: Time to sleep. Default is driver's delay.
+        """
+        if seconds is None:
+            seconds = self.delay
+        time.sleep(seconds)
+        self.stats.record(command='sleep', owner=self.stats.getOwnerName(), duration=seconds)
+
+    def writeStats(self, name='commands'):
+        """
+            Write summary of WebDriver commands issued since driver start to text file in log
+              directory.
+            @param name: Name of summary file (ex. name of test).
+        """
+        if LOG.getLogDir() is not None:
+            logDirectory = LOG.getLogDir()
+        else:
+            logDirectory = os.getcwd()
+        # Several drivers may quit within the same second, in one or several processes
+        pathFileName = os.path.join(logDirectory, '%s.%s.%s_%s.txt' % (name,
+            express.getUnixTime(formatstr='%Y%m%d_%H%M%S'), os.getpid(), self._serial))
+        with open(pathFileName, 'w') as statsFile:
+            statsFile.write('\n'.join(self.stats.getSummary()) + '\n')
+        LOG.l4("Mangal.Driver: writeStats(): Saved into '%s'" % pathFileName)
+
+    @property
+    def timeout(self):
+        """
+            Time out in seconds of single wait. Within deadline() it is cut to time remaining until
+              deadline, so nested waits draw from budget of top-level operation instead of each
+              starting own full time out.
+        """
+        if self._deadlines:
+            return max(min(self._timeout, self._deadlines[-1] - time.time()), 0)
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout):
+        self._timeout = timeout
+
+    @contextmanager
+    def deadline(self, budget=None):
+        """
+            Run operation within time budget, ex.
+                with self.driver.deadline():
+                    <steps of operation>
+            Nested deadlines never extend beyond enclosing one. Once budget is used up, waits of
+              nested operations inspect their condition once and fail without waiting.
+            @param budget: Time in seconds operation may take in total. Default is driver's budget.
+        """
+        deadline = time.time() + (self.budget if budget is None else budget)
+        if self._deadlines:
+            deadline = min(deadline, self._deadlines[-1])
+        self._deadlines.append(deadline)
+        try:
+            yield
+        finally:
+            self._deadlines.pop()
 
     def getWebDriver(self):
         return self.webDriver
@@ -66,12 +467,40 @@ class Driver(object):
             LOG.l4('WebDriver.close():', e.msg)
 
     def quit(self):
+        # Screenshots are taken before session is reset or quit
+        self.screenshotWriter.flush()
+        try:
+            self.writeStats(name=self.statsName)
+        except IOError, e:
+            LOG.l4('Mangal.Driver: writeStats():', e)
+        # Session may be leased to another driver, so it's detached from this one's statistics
+        self.webDriver.__dict__.pop('execute', None)
+        if self.usePool:
+            LOG.l4('Returning WebDriver session to pool')
+            self.pool.release(webDriver=self.webDriver, driverHostname=self.driverHostname,
+                driverPort=self.driverPort, capabilities=self.capabilities, failed=self.failed)
+            return
         LOG.l4('Quitting WebDriver')
         try:
             self.webDriver.quit()
         except WebDriverException, e:
             LOG.l4('WebDriver.quit():', e.msg)
 
+    def executeAsyncScript(self, script, timeout, *args):
+        """
+            Execute asynchronous JavaScript in browser. Script time out of WebDriver session is
+              only raised when given time out exceeds the one set by previous calls, as scripts
+              bound their waits themselves and session's time out is only a safety net.
+            @param script: JavaScript code which reports result by calling its last argument.
+            @param timeout: Time in seconds to let script run before WebDriver gives up.
+            @param args: Arguments passed to script.
+            @return: Value passed by script to its callback.
+        """
+        if self._scriptTimeout is None or timeout > self._scriptTimeout:
+            self.webDriver.set_script_timeout(timeout)
+            self._scriptTimeout = timeout
+        return self.webDriver.execute_async_script(script, *args)
+
     def maximizeWindow(self):
         """
             Maximize browser's active window
@@ -92,5 +521,73 @@ class Driver(object):
         self.webDriver.save_screenshot(pathFileName)
         LOG.l4("Mangal.Driver: takeScreenshot(): Saved into '%s'" % pathFileName)
 
+    def queueScreenshot(self, name):
+        """
+            Request screenshot of active web page to be taken and saved in background (see
+              ScreenshotWriter and saveScreenshot()). Requests above driver's screenshotLimit are
+              dropped without issuing any command.
+            Screenshots are requested by failures meant to reach the test (exceptions raised
+              with takeScreenshot=False are expected to be handled by Mangal itself), so the
+              session is flagged as failed and isn't handed over to next test by session pool.
+            @param name: Name of screenshot file, or function returning it (called only if
+              screenshot is saved).
+        """
+        self.failed = True
+        if self._screenshotCount >= self.screenshotLimit:
+            LOG.l5('Mangal.Driver: queueScreenshot(): Limit of %d screenshots reached.' %
+                self.screenshotLimit)
+            return
+        self._screenshotCount += 1
+        self.screenshotWriter.submit(driver=self, name=name)
+
+    def getPageStateKey(self):
+        """
+            @return: Cheap key of state of active web page (URL and hash of DOM computed in
+              browser), None if it can't be read.
+        """
+        try:
+            return self.webDriver.execute_script(scripts.tag(scripts.getPageStateKeyId, """
+                var text = document.documentElement.outerHTML, hash = 0;
+                for (var index = 0; index < text.length; index++) {
+                    hash = ((hash << 5) - hash + text.charCodeAt(index)) | 0;
+                }
+                return location.href + '|' + text.length + '|' + hash;
+            """))
+        except WebDriverException, e:
+            LOG.l5('Mangal.Driver: getPageStateKey():', e.msg)
+            return None
+
+    def saveScreenshot(self, name):
+        """
+            Save screenshot of active web page to PNG file, unless page is in the same state as
+              on previous screenshot saved by this method (then screenshot is not even taken) or
+              screenshot is identical to previous one.
+            @param name: Name of screenshot file, or function returning it.
+        """
+        with self._sessionLock:
+            pageStateKey = self.getPageStateKey()
+            if pageStateKey is not None and pageStateKey == self._lastPageStateKey:
+                LOG.l5('Mangal.Driver: saveScreenshot(): Page unchanged since previous screenshot, '
+                    'skipped.')
+                return
+            screenshot = self.webDriver.get_screenshot_as_png()
+        self._lastPageStateKey = pageStateKey
+        screenshotHash = hashlib.md5(screenshot).hexdigest()
+        if screenshotHash == self._lastScreenshotHash:
+            LOG.l5('Mangal.Driver: saveScreenshot(): Identical to previous screenshot, skipped.')
+            return
+        self._lastScreenshotHash = screenshotHash
+        if callable(name):
+            name = name()
+        if LOG.getLogDir() is not None:
+            logDirectory = LOG.getLogDir()
+        else:
+            logDirectory = os.getcwd()
+        pathFileName = os.path.join(logDirectory, name + '.' +
+            express.getUnixTime(formatstr='%Y%m%d_%H%M%S') + '.png')
+        with open(pathFileName, 'wb') as screenshotFile:
+            screenshotFile.write(screenshot)
+        LOG.l4("Mangal.Driver: saveScreenshot(): Saved into '%s'" % pathFileName)
+
     def setBrowser(self, browser):
         self.browser = browser
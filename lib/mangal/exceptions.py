@@ -7,7 +7,6 @@ import os
 
 sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/../lib"))
 
-import inspect
 from frexceptions import FRException
 from frlog import LOG
 
@@ -29,10 +28,18 @@ class MangalException(FRException):
         super(MangalException, self).__init__(message)
         if takeScreenshot:
             if screenshotName is None:
-                # Compose screenshot name out of records in call stack.
+                # Compose screenshot name out of function names in call stack, joined only if
+                #   screenshot is saved.
                 #   Ex.: test_create_luns_wizard.goNext.waitUntilOpen.isOpen.__init__.20150910_150554.png
-                screenshotName = '.'.join([record[3] for record in reversed(inspect.stack()[:-7])])
-            driver.takeScreenshot(name=screenshotName)
+                functionNames = []
+                frame = sys._getframe()
+                while frame is not None:
+                    functionNames.append(frame.f_code.co_name)
+                    frame = frame.f_back
+                screenshotName = lambda: '.'.join(reversed(functionNames[:-7]))
+            # Screenshot is taken and saved in background and session is flagged as failed, see
+            #   Driver.queueScreenshot()
+            driver.queueScreenshot(name=screenshotName)
 
 
 class DriverException(MangalException):
@@ -7,5 +7,7 @@ __all__ = [
     'login_failed_page',
     'login_page',
     'luns_page',
-    'manager_page'
+    'manager_page',
+    'navigator',
+    'page_recognizer'
 ]
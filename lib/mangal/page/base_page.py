@@ -3,24 +3,73 @@ import os
 
 sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/.."))
 
+import functools
 import time
 import re
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from component import *
 from frlog import LOG
 from mariner.timeout import Timeout
 from mangal.exceptions import *
+from mangal import scripts
+
+
+class LazyComponents(dict):
+    """
+        Dictionary of components of page, some of which are constructed on first access only (see
+          setLazy() and BasePage.addComponent()).
+    """
+    class Factory(object):
+        def __init__(self, build):
+            self.build = build
+
+    def setLazy(self, name, build):
+        """
+            @param name: Name of component.
+            @param build: Callable without arguments returning component.
+        """
+        dict.__setitem__(self, name, self.Factory(build))
+
+    def __getitem__(self, name):
+        component = dict.__getitem__(self, name)
+        if isinstance(component, self.Factory):
+            component = component.build()
+            dict.__setitem__(self, name, component)
+        return component
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def values(self):
+        return [self[name] for name in self.keys()]
+
+    def items(self):
+        return [(name, self[name]) for name in self.keys()]
 
 
 class BasePage(object):
     class Selector(object):
         """
-            In-transit class allowing use of '<some_page>.selectors.<some_selector>' notation for
-              obtaining element selectors from page (ex. 'loginPage.selectors.btnSignIn')
+            Compiled table of selectors of page class, allowing use of
+              '<some_page>.selectors.<some_selector>' notation for obtaining element selectors from
+              page (ex. 'loginPage.selectors.btnSignIn'). Built once per page class (see
+              BasePage.__init__()); parameterized selectors are split into parts once, and
+              selectors built from them are memoized.
         """
         def __init__(self, selectors):
             self.selectors = selectors
+            # Parameterized selectors as {name: (parts, arguments)}, where parts are literal
+            #   pieces of selector interleaved with argument names
+            self._templates = {}
+            for selectorName, selector in selectors.items():
+                parts = re.split('{(.*?)}', selector)
+                if len(parts) > 1:
+                    self._templates[selectorName] = (parts, set(parts[1::2]))
+            # Selectors built from parameterized ones, by (name, arguments)
+            self._built = {}
+            # Functions building parameterized selectors, by name
+            self._builders = {}
 
         def __getattr__(self, selectorName):
             # Obtaining parameterized selectors (ex. LoginPage().btnLocaleByIndex(index=2)). Used in
@@ -32,37 +81,98 @@ class BasePage(object):
             #     selectors['numberOfLUNsItm'] = '//body/div[contains(@class, "{class}")]/div/ul/li[.="{index}"]'
             #   Call:
             #     lunsPage.selectors.numberOfLUNsItm(class='mg-list-lun-count', index='12')
-            if re.search('{(.*?)}', self.selectors[selectorName]):
-                # Passed name of element (ex. 'btnLocaleByIndex') as it's defined on its page
-                #   (LoginPage etc.)
-                self.selectorName = selectorName
-                # Build raw method instance without concrete arguments
-                selector = self._getParameterizedSelector
+            if selectorName in self._templates:
+                if selectorName not in self._builders:
+                    self._builders[selectorName] = functools.partial(
+                        self._getParameterizedSelector, selectorName)
+                selector = self._builders[selectorName]
             else:
                 selector = self.selectors[selectorName]
             return selector
 
-        def _getParameterizedSelector(self, **kwargs):
+        def _getParameterizedSelector(self, selectorName, **kwargs):
             """
-                Method obtains argument passed to __getattr__ along with selector name (ex.
-                  LoginPage().selectors.btnLocaleByIndex(index=2)), then converts parameterized
-                  selector string to target selector.
+                Convert parameterized selector to target selector by replacing placeholders
+                  {<argument_name>} with given arguments (ex. 'div[{index}] -> 'div[3]').
             """
-            # Get selector string by given selector name (self.selectorName), then replace
-            #   placeholder {<argument_name>} with given argument (ex. 'div[{index}] -> 'div[3]')
-            selector = self.selectors[self.selectorName]
-            # Pull out of selector all arguments as list. Ex.
-            #   '//div[@class="{className}"]/div[{index}]' -> ['className', 'index']
-            arguments = re.findall('{(.*?)}', self.selectors[self.selectorName])
-            try:
-                # For all argument placeholders (ex. '{number}') found in selector, replace them
-                #   with concrete values
-                for argument in arguments:
-                    selector = selector.replace('{' + argument + '}', str(kwargs[argument]))
-            except KeyError:
-                raise KeyError('Argument mismatch:\n%s\n%s' % (self.selectors[self.selectorName],
-                    str(kwargs)))
-            return selector
+            key = (selectorName, tuple(sorted(kwargs.items())))
+            if key not in self._built:
+                parts, arguments = self._templates[selectorName]
+                if not arguments.issubset(kwargs):
+                    raise KeyError('Argument mismatch:\n%s\n%s' % (self.selectors[selectorName],
+                        str(kwargs)))
+                self._built[key] = ''.join([str(kwargs[part]) if index % 2 else part for index,
+                    part in enumerate(parts)])
+            return self._built[key]
+
+    class SelectorTable(dict):
+        """
+            Dictionary of selectors of page class, read-only once built by setupSelectors().
+        """
+        def __setitem__(self, name, value):
+            raise TypeError('Selectors of page are read-only: %s' % name)
+
+    # Compiled selectors by page class, see Selector
+    _selectorTables = {}
+
+    # Script of fill(): applies entries {'selector', 'kind', 'value', 'exact'} in order through Ext
+    #   fields owning elements, returns index of first entry it couldn't apply (number of entries
+    #   if all applied), to be done by component's own interaction
+    fillScript = condition.scriptHelpers + """
+        var entries = arguments[0];
+        var getField = function (element) {
+            if (window.Ext === undefined) {
+                return null;
+            }
+            return Ext.getCmp(element.id) || Ext.getCmp(element.id.replace(/-inputEl$/, '')) ||
+                null;
+        };
+        for (var index = 0; index < entries.length; index++) {
+            var entry = entries[index];
+            var element = findElement(entry.selector);
+            if (element === null) {
+                return index;
+            }
+            var field = getField(element);
+            if (entry.kind === 'text') {
+                if (field !== null && field.setValue) {
+                    field.setValue(entry.value);
+                } else if ('value' in element) {
+                    element.value = entry.value;
+                    var names = ['input', 'change'];
+                    for (var i = 0; i < names.length; i++) {
+                        var event = document.createEvent('HTMLEvents');
+                        event.initEvent(names[i], true, true);
+                        element.dispatchEvent(event);
+                    }
+                } else {
+                    return index;
+                }
+            } else if (entry.kind === 'select') {
+                if (field === null || !field.store || typeof entry.value !== 'string') {
+                    return index;
+                }
+                var recordIndex = field.store.findBy(function (record) {
+                    var text = String(record.get(field.displayField));
+                    return entry.exact ? text === entry.value : text.indexOf(entry.value) >= 0;
+                });
+                if (recordIndex < 0) {
+                    return index;
+                }
+                var record = field.store.getAt(recordIndex);
+                field.select(record);
+                field.fireEvent('select', field, [record]);
+            } else if (entry.kind === 'check') {
+                if (field === null || !field.setValue) {
+                    return index;
+                }
+                field.setValue(entry.value);
+            } else {
+                return index;
+            }
+        }
+        return entries.length;
+    """
 
     def __init__(self, driver, protocol='http', url='', path='', parentName='',
     validateLayout=False):
@@ -74,9 +184,17 @@ class BasePage(object):
         # In wizards, pages can be instantiated with parameter parentName=<wizard_name> to make a
         #   page appeared in logs as ex. 'CloneLUNWizard.SelectInitiatorGroupsPage'
         self.name = ((parentName + '.') if parentName else '') + self.__class__.__name__
-        self._selectors = {}
-        self.setupSelectors()
-        self.components = {}
+        # If False, page can't be reached by route within loaded application (see open())
+        self.isRoutable = True
+        # Selectors are defined by setupSelectors() once per page class and shared by instances
+        if type(self) not in self._selectorTables:
+            self._selectors = {}
+            self.setupSelectors()
+            BasePage._selectorTables[type(self)] = self.Selector(selectors=self.SelectorTable(
+                self._selectors))
+        self.selectors = self._selectorTables[type(self)]
+        self._selectors = self.selectors.selectors
+        self.components = LazyComponents()
         self.setupComponents()
 
     def __getattr__(self, attributeName):
@@ -85,11 +203,9 @@ class BasePage(object):
               named element is absent in page declaration, return attribute of underlying
               selenium.webdriver.remote.webelement.WebElement.
         """
-        if attributeName == 'selectors':
-            attribute = self.Selector(selectors=self._selectors)
         # Used in base_page.isOpen() for inspection if page's unique component is present (hence
         #   page is open).
-        elif attributeName == 'token':
+        if attributeName == 'token':
             attribute = self.components['token']
         elif attributeName in self.components:
             attribute = self.components[attributeName]
@@ -98,6 +214,105 @@ class BasePage(object):
             raise AttributeError('%s: Invalid attribute: %s' % (self.name, attributeName))
         return attribute
 
+    @classmethod
+    def get(cls, driver, **kwargs):
+        """
+            Return instance of page for driver, constructing it only once per driver and
+              arguments. Page instances are stateless enough to be shared (ex. by wizards and
+              Navigator) within driver's life.
+            @param kwargs: Arguments of page's constructor besides driver.
+        """
+        key = (cls, tuple(sorted(kwargs.items())))
+        if key not in driver.pageCache:
+            driver.pageCache[key] = cls(driver=driver, **kwargs)
+        return driver.pageCache[key]
+
+    def addComponent(self, name, componentClass, selector=None, items=None, **kwargs):
+        """
+            Declare component of page, constructed on first access only (see LazyComponents).
+            @param name: Name of component (ex. 'txtName').
+            @param componentClass: Class of component (ex. textbox.TextBox).
+            @param selector: Selector of component. Default is page's selector of the same name.
+            @param items: Name of component holding items of component (ex. 'dItmSizeUnit' for
+              drop-down list 'dLstSizeUnit'), added to component by addItems() on construction.
+            @param kwargs: Other arguments of component's constructor.
+        """
+        def build():
+            component = componentClass(driver=self.driver, selector=selector if selector is not
+                None else self._selectors[name], name=self.name, **kwargs)
+            if items is not None:
+                component.addItems(items=self.components[items])
+            return component
+        self.components.setLazy(name, build)
+
+    def fill(self, values, verify=True):
+        """
+            Set values of several components of form at once. Text entry, drop-down selections
+              and check boxes are applied in given order by single script call through Ext fields
+              of components; entry which script can't apply (ex. component not rendered yet,
+              item not in store of list, item given by index) is done by component's own
+              interaction, after which script resumes with the rest. Resulting values are
+              verified all at once by single condition (see condition.waitUntil()).
+            @param values: Dictionary {<component name>: <value>}, or list of (<component name>,
+              <value>) pairs (or OrderedDict) if order matters (ex. selecting number of LUNs
+              changes rest of form). Value is text for text boxes, item text for drop-down lists
+              (matched by pattern, as in DropDownList.select()) or its index, True/False for
+              check boxes and True for radio buttons.
+            @param verify: If True (default), wait until all components show given values.
+        """
+        items = values.items() if hasattr(values, 'items') else list(values)
+        entries = []
+        conditions = []
+        for name, value in items:
+            component = getattr(self, name)
+            if isinstance(component, (checkbox.CheckBox, radiobutton.RadioButton)):
+                if isinstance(component, radiobutton.RadioButton) and not value:
+                    raise PageException(message="%s.fill(): Radio button '%s' can't be unselected."
+                        % (self.name, name), driver=self.driver, screenshotName=self.name + '.fill')
+                entry = {'kind': 'check', 'value': bool(value)}
+                conditions.append((condition.hasClass if value else condition.lacksClass)(
+                    component, 'x-form-cb-checked'))
+            elif isinstance(component, dropdownlist.DropDownList):
+                entry = {'kind': 'select', 'value': value, 'exact': False}
+                # Text of item given by index isn't known in advance
+                if not isinstance(value, int):
+                    conditions.append(condition.text(component.inputElement, text=value))
+            elif isinstance(component, textbox.TextBox):
+                entry = {'kind': 'text', 'value': value}
+                conditions.append(condition.text(component, text=value, exact=True))
+            else:
+                raise PageException(message="%s.fill(): Component '%s' (%s) can't be filled." %
+                    (self.name, name, type(component).__name__), driver=self.driver,
+                    screenshotName=self.name + '.fill')
+            entry['selector'] = component.selector
+            entries.append((component, entry))
+
+        with self.driver.deadline():
+            index = 0
+            while index < len(entries):
+                index += self.webDriver.execute_script(scripts.tag(scripts.fillId,
+                    self.fillScript), [entry for _, entry in entries[index:]])
+                # Script changes page behind WebDriver's back, see Driver.mutatingCommands
+                self.driver.stateMemo.clear()
+                if index < len(entries):
+                    component, entry = entries[index]
+                    LOG.l5('%s.fill(): %s set by component' % (self.name, component.name))
+                    if entry['kind'] == 'text':
+                        component.clear()
+                        component.setText(text=entry['value'])
+                    elif entry['kind'] == 'select':
+                        component.select(item=entry['value'])
+                    elif isinstance(component, checkbox.CheckBox):
+                        component.setState(select=entry['value'])
+                    else:
+                        component.select()
+                    index += 1
+            if verify and conditions:
+                condition.waitUntil(driver=self.driver, condition=condition.allOf(*conditions),
+                    screenshotName=self.name + '.fill')
+        LOG.l4('%s.fill(%s)' % (self.name, ', '.join(['%s=%r' % (name, value) for name, value in
+            items])))
+
     def setupSelectors(self):
         """
             Define selectors of web page. To be overwritten in concrete pages.
@@ -106,8 +321,8 @@ class BasePage(object):
 
     def setupComponents(self):
         """
-            Define components (sub-classed BaseComponents) of web page. To be overwritten in
-              concrete pages.
+            Define components (sub-classed BaseComponents) of web page, either constructed at
+              once or declared by addComponent(). To be overwritten in concrete pages.
         """
         pass
 
@@ -118,38 +333,78 @@ class BasePage(object):
         """
         LOG.l3('%s.doValidation(): No validation added.', self.name)
 
-    def open(self, wait=True):
+    def open(self, wait=True, useRoute=True):
         """
             Open web page in browser.
+            @param useRoute: If True (default) and application is loaded in browser already, open
+              page by changing route (location.hash, ex. '#manager/storage/allstorage/luns')
+              within application instead of loading it anew. Page is loaded by URL if
+              application is not loaded yet, or if page doesn't open by route (ex. session has
+              expired).
+        """
+        with self.driver.deadline():
+            isRouted = False
+            if useRoute and self.isRoutable and self.path.startswith('#') and \
+            self.isAppLoaded():
+                LOG.l4("%s.open(): Route='%s'" % (self.name, self.path))
+                self.webDriver.execute_script(scripts.tag(scripts.routeId,
+                    'if (location.hash !== arguments[0]) { location.hash = arguments[0]; }'),
+                    self.path)
+                self.driver.stateMemo.clear()
+                # Router renders page asynchronously, wait for it. Condition is evaluated rather
+                #   than waited for by waitUntilOpen(), as page not open is no failure here.
+                isRouted = condition.evaluate(driver=self.driver, conditions=[self.opened()])[0]
+                if not isRouted:
+                    LOG.l4('%s.open(): Not open by route, loading URL' % self.name)
+            if not isRouted:
+                LOG.l4("%s.open(): URL='%s'" % (self.name, self.url))
+                self.webDriver.get(self.url)
+                if wait:
+                    condition.evaluate(driver=self.driver, conditions=[self.opened()])
+            if self.validateLayout:
+                self.doValidation()
+            LOG.l4("%s.open(): Done." % self.name)
+
+    def isAppLoaded(self):
+        """
+            Check if Ext application of page's URL is loaded and ready in browser, so pages can be
+              opened by route.
         """
-        LOG.l4("%s.open(): URL='%s'" % (self.name, self.url))
-        self.webDriver.get(self.url)
-        if wait:
-            try:
-                self.waitUntilOpen()
-            except PageException:
-                pass
-        if self.validateLayout:
-            self.doValidation()
-        LOG.l4("%s.open(): Done." % self.name)
+        try:
+            isAppLoaded = self.webDriver.execute_script(scripts.tag(scripts.isAppLoadedId, """
+                var strip = function (url) {
+                    return url.split('#')[0].replace(/\\/+$/, '');
+                };
+                return (strip(location.href) === strip(arguments[0])) && (window.Ext !== undefined)
+                    && (Ext.isReady === true);
+            """), self.url) is True
+        except WebDriverException:
+            isAppLoaded = False
+        LOG.l5('%s.isAppLoaded(): %s' % (self.name, isAppLoaded))
+        return isAppLoaded
 
-    def isOpen(self, suppressLog=False):
+    def isOpen(self, suppressLog=False, wait=False):
         """
             Check if page is loaded and visible by verifying if its unique components ('token') are
               present and visible on page.
             Can be overwritten in sub-classes for better page recognition by inspecting multiple
               page-specific components.
+            @param wait: If False (default), inspect all tokens at once and answer immediately. If
+              True, wait for each token to appear until driver's time out.
         """
         if hasattr(self, 'token'):
             if not isinstance(self.token, list):
                 tokens = [self.token]
             else:
                 tokens = self.token
-            isOpen = True
-            for token in tokens:
-                if not (token.isPresent() and token.isVisible()):
-                    isOpen = False
-                    break
+            if not wait:
+                isOpen = condition.check(driver=self.driver, condition=self.opened())
+            else:
+                isOpen = True
+                for token in tokens:
+                    if not (token.isPresent(wait=True) and token.isVisible(wait=True)):
+                        isOpen = False
+                        break
         else:
             raise PageException(message=('%s: Page token is not defined.' % self.name),
                 driver=self.driver, screenshotName=self.name + '.isOpen')
@@ -157,6 +412,19 @@ class BasePage(object):
             LOG.l4('%s.isOpen(): %s' % (self.name, isOpen))
         return isOpen
 
+    def opened(self):
+        """
+            Condition holding if page is open, for use in composed waits (ex.
+              condition.anyOf(nextPage.opened(), page.lblNameError.visible())).
+        """
+        if not hasattr(self, 'token'):
+            raise PageException(message=('%s: Page token is not defined.' % self.name),
+                driver=self.driver, screenshotName=self.name + '.opened')
+        return condition.opened(self)
+
+    def closed(self):
+        return condition.closed(self)
+
     def reload(self):
         self.webDriver.refresh()
         LOG.l4("%s.reload(): url='%s'" % (self.name, self.url))
@@ -168,7 +436,8 @@ class BasePage(object):
         """
         try:
             WebDriverWait(driver=self.webDriver, timeout=self.driver.timeout).until(lambda _:
-            self.webDriver.execute_script(script='return document.readyState') == 'complete')
+            self.webDriver.execute_script(script=scripts.tag(scripts.readyStateId,
+            'return document.readyState')) == 'complete')
         except TimeoutException:
             raise PageException(message="%s.waitUntilLoaded: Time out." % self.name,
                 driver=self.driver, screenshotName=self.name + '.waitUntilLoaded')
@@ -179,13 +448,8 @@ class BasePage(object):
             Customized solution doing inspection of presence and visibility of page-specific
               components.
         """
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.waitUntilOpen(): Time out.' %
-            self.name)
-        while not self.isOpen(suppressLog=True):
-            if timeout.exceeded(raiseException=False):
-                raise PageNotFoundException(message='%s.waitUntilOpen(): Time out.' % self.name,
-                    driver=self.driver, screenshotName=self.name + '.waitUntilOpen')
-            time.sleep(self.driver.delay)
+        condition.waitUntil(driver=self.driver, condition=self.opened(),
+            exceptionClass=PageNotFoundException, screenshotName=self.name + '.waitUntilOpen')
         if not suppressLog:
             LOG.l5('%s.waitUntilOpen()' % self.name)
 
@@ -194,11 +458,6 @@ class BasePage(object):
             Customized solution doing inspection of absence or invisibility of page-specific
               components.
         """
-        timeout = Timeout(timeout=self.driver.timeout, description='%s.waitUntilClosed(): Time out.'
-            % self.name)
-        while self.isOpen(suppressLog=True):
-            if timeout.exceeded(raiseException=False):
-                raise PageException(message='%s.waitUntilClosed(): Time out.' % self.name,
-                    driver=self.driver, screenshotName=self.name + '.waitUntilClosed')
-            time.sleep(self.driver.delay)
+        condition.waitUntil(driver=self.driver, condition=self.closed(),
+            exceptionClass=PageException, screenshotName=self.name + '.waitUntilClosed')
         LOG.l5('%s.waitUntilClosed()' % self.name)
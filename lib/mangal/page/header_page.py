@@ -47,3 +47,70 @@ class HeaderPage(BasePage):
         self.menuInfo.addItems(items=self.mItmInfo)
         # Component uniquely identifying given page
         self.components['token'] = self.btnDashboard
+
+    def reset(self):
+        """
+            Bring application loaded in browser back to baseline without reloading it: close modal
+              windows (wizards, dialogs), hide menus, collapse drop-down pickers, clear selections
+              of grids and search boxes, then route to dashboard. Lets tests share warm
+              application instead of bootstrapping it anew.
+            @return: True if application is at baseline, False if it couldn't be reset (ex. it's
+              not loaded or not signed in), so it has to be loaded by URL.
+        """
+        script = """
+            if ((window.Ext === undefined) || (Ext.isReady !== true)) {
+                return false;
+            }
+            // Message box is singleton reused by application, so it's only hidden
+            Ext.each(Ext.ComponentQuery.query('window'), function (dialog) {
+                if (!dialog.isDestroyed && dialog.isVisible()) {
+                    if (dialog === Ext.Msg) {
+                        dialog.hide();
+                    } else {
+                        dialog.destroy();
+                    }
+                }
+            });
+            Ext.each(Ext.ComponentQuery.query('menu'), function (menu) {
+                if (!menu.isDestroyed && menu.isVisible()) {
+                    menu.hide();
+                }
+            });
+            Ext.each(Ext.ComponentQuery.query('pickerfield'), function (field) {
+                if (!field.isDestroyed && field.isExpanded) {
+                    field.collapse();
+                }
+            });
+            Ext.each(Ext.ComponentQuery.query('tablepanel'), function (grid) {
+                if (!grid.isDestroyed && grid.getSelectionModel) {
+                    grid.getSelectionModel().deselectAll();
+                }
+            });
+            var searchBoxes = document.evaluate(arguments[0], document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var index = 0; index < searchBoxes.snapshotLength; index++) {
+                var searchBox = Ext.getCmp(searchBoxes.snapshotItem(index).id);
+                if (searchBox && searchBox.setValue && searchBox.getValue()) {
+                    searchBox.setValue('');
+                }
+            }
+            if (location.hash !== arguments[1]) {
+                location.hash = arguments[1];
+            }
+            return Ext.ComponentQuery.query('window[hidden=false]').length === 0;
+        """
+        try:
+            isReset = self.webDriver.execute_script(scripts.tag(scripts.resetApplicationId,
+                script), '//table[starts-with(@data-mg-comp, "search")]', self.path) is True
+        except WebDriverException:
+            isReset = False
+        # Script changes page behind WebDriver's back, see Driver.mutatingCommands
+        self.driver.stateMemo.clear()
+        # Windows are closed by script at once (it returns False if any is left open), while
+        #   route is rendered asynchronously and is waited for: application stays at dashboard
+        #   (ex. isn't redirected to login form) and shows header
+        if isReset:
+            isReset = condition.evaluate(driver=self.driver, conditions=[self.opened() &
+                condition.routed(self.path)])[0]
+        LOG.l4('%s.reset(): %s' % (self.name, isReset))
+        return isReset
@@ -1,13 +1,20 @@
 import random
+import urlparse
 from base_page import *
 from header_page import HeaderPage
 
 
 class LoginPage(BasePage):
+    # Cookies and local storage of authenticated sessions by (host, username, locale), shared by
+    #   LoginPages of process (see signIn())
+    sessions = {}
+
     def __init__(self, **kwargs):
         path = '#dashboard'
         super(LoginPage, self).__init__(path=path, **kwargs)
         self.locale = None
+        # Login form is only shown by application without valid session, never by its router
+        self.isRoutable = False
 
     def setupSelectors(self):
         # Company branding elements
@@ -83,9 +90,24 @@ class LoginPage(BasePage):
         self.menuLocale.select(item=locale)
         LOG.l4('Set locale:', locale)
 
-    def signIn(self, username, password, locale=None, openPage=True):
+    def signIn(self, username, password, locale=None, openPage=True, reuseSession=True):
+        """
+            Sign in to System Manager.
+            @param reuseSession: If True (default), restore session saved by earlier sign-in of the
+              same user with the same locale on the same host, instead of filling in login form.
+              Form is only used if there is no saved session or it's no longer valid.
+        """
         LOG.l4('Logging in')
-        if openPage and (not self.isOpen()):
+        sessionKey = (urlparse.urlparse(self.url).netloc, username, locale)
+        isRestoreFailed = False
+        if reuseSession and (sessionKey in self.sessions):
+            if self.restoreSession(sessionKey):
+                LOG.l4('Login performed (session restored).')
+                return
+            # Browser may have been left off application by failed restore
+            isRestoreFailed = True
+
+        if (openPage or isRestoreFailed) and (not self.isOpen()):
             self.open()
             self.waitUntilOpen()
 
@@ -102,4 +124,58 @@ class LoginPage(BasePage):
         LOG.l5("Clicked button 'Sign In'.")
 
         HeaderPage(driver=self.driver).waitUntilOpen()
+        if reuseSession:
+            self.saveSession(sessionKey)
         LOG.l4('Login performed.')
+
+    def saveSession(self, sessionKey):
+        """
+            Save cookies and local storage of authenticated session for restoreSession().
+            @param sessionKey: Key of session as (host, username, locale).
+        """
+        self.sessions[sessionKey] = {
+            'cookies': self.webDriver.get_cookies(),
+            'localStorage': self.webDriver.execute_script(scripts.tag(scripts.getSessionId, """
+                var items = {};
+                for (var index = 0; index < localStorage.length; index++) {
+                    items[localStorage.key(index)] = localStorage.getItem(localStorage.key(index));
+                }
+                return items;
+            """))
+        }
+        LOG.l5('%s.saveSession(%s)' % (self.name, sessionKey))
+
+    def restoreSession(self, sessionKey):
+        """
+            Inject cookies and local storage saved by saveSession() into browser, then load
+              application and check whether it starts signed in.
+            @param sessionKey: Key of session as (host, username, locale).
+            @return: True if application is signed in, False if session is no longer valid or
+              couldn't be injected (it is forgotten then, and sign-in is to be done by form).
+        """
+        session = self.sessions[sessionKey]
+        # Cookies and local storage can only be set for origin of page open in browser. Any
+        #   light-weight page of host will do, application itself is not loaded twice.
+        url = urlparse.urlparse(self.url)
+        try:
+            self.webDriver.get('%s://%s/favicon.ico' % (url.scheme, url.netloc))
+            for cookie in session['cookies']:
+                self.webDriver.add_cookie(dict([(name, cookie[name]) for name in ['name',
+                    'value', 'path', 'secure', 'httpOnly', 'expiry'] if name in cookie]))
+            self.webDriver.execute_script(scripts.tag(scripts.restoreSessionId, """
+                for (var name in arguments[0]) {
+                    localStorage.setItem(name, arguments[0][name]);
+                }
+            """), session['localStorage'])
+            self.webDriver.get(self.url)
+        except WebDriverException, e:
+            LOG.l4('%s.restoreSession(%s): Not restored: %s' % (self.name, sessionKey, e.msg))
+            del self.sessions[sessionKey]
+            return False
+        # Application shows either header (signed in) or login form (session invalidated)
+        isSignedIn = condition.evaluate(driver=self.driver, conditions=[HeaderPage(
+            driver=self.driver).opened(), self.opened()])[0]
+        if not isSignedIn:
+            del self.sessions[sessionKey]
+        LOG.l4('%s.restoreSession(%s): %s' % (self.name, sessionKey, isSignedIn))
+        return isSignedIn
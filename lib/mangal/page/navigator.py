@@ -0,0 +1,111 @@
+import heapq
+from base_page import *
+from all_storage_page import AllStoragePage
+from consistency_groups_page import ConsistencyGroupsPage
+from header_page import HeaderPage
+from initiator_groups_page import InitiatorGroupsPage
+from luns_page import LUNsPage
+from page_recognizer import PageRecognizer
+
+
+class Navigator(object):
+    """
+        Graph of pages (by class) and transitions between them (ex. HeaderPage -> AllStoragePage by
+          clicking on 'Manager'). Navigator recognizes pages open now (see PageRecognizer) and
+          takes cheapest path from any of them to target page, so steps leading to pages already
+          open are skipped. Transitions are weighted by their latency measured so far.
+    """
+    # Measured latencies of transitions in seconds, shared by navigators of process, as
+    #   {(source page class, target page class): latency}
+    latencies = {}
+    # Latency assumed for transitions not measured yet
+    defaultLatency = 1.0
+
+    def __init__(self, driver):
+        """
+            @param driver: Instance of Mangal.Driver.
+        """
+        self.driver = driver
+        self.name = self.__class__.__name__
+        # Page instances by page class
+        self.pages = {}
+        # Transitions as {source page class: {target page class: action}}
+        self.transitions = {}
+        self.addTransition(source=HeaderPage, target=AllStoragePage,
+            action=lambda pages: pages[HeaderPage].btnManager.click())
+        self.addTransition(source=AllStoragePage, target=LUNsPage,
+            action=lambda pages: pages[AllStoragePage].tabLUNs.click())
+        self.addTransition(source=AllStoragePage, target=ConsistencyGroupsPage,
+            action=lambda pages: pages[AllStoragePage].tabConsistencyGroups.click())
+        self.addTransition(source=AllStoragePage, target=InitiatorGroupsPage,
+            action=lambda pages: pages[AllStoragePage].tabInitiatorGroups.click())
+
+    def addTransition(self, source, target, action):
+        """
+            @param source: Class of page transition starts at.
+            @param target: Class of page transition leads to.
+            @param action: Callable performing transition, given dictionary of page instances by
+              page class (ex. lambda pages: pages[HeaderPage].btnManager.click()).
+        """
+        for pageClass in [source, target]:
+            if pageClass not in self.pages:
+                self.pages[pageClass] = pageClass.get(driver=self.driver)
+        self.transitions.setdefault(source, {})[target] = action
+
+    def getLatency(self, source, target):
+        return self.latencies.get((source, target), self.defaultLatency)
+
+    def getPath(self, sources, target):
+        """
+            Find cheapest path to target page from any of source pages (Dijkstra).
+            @param sources: Classes of pages open now.
+            @param target: Class of target page.
+            @return: List of transitions as (source class, target class) pairs, empty if target
+              is among sources, None if target is not reachable.
+        """
+        queue = [(0, index, source, []) for index, source in enumerate(sources)]
+        heapq.heapify(queue)
+        visited = set()
+        counter = len(queue)
+        while queue:
+            cost, _, pageClass, path = heapq.heappop(queue)
+            if pageClass is target:
+                return path
+            if pageClass in visited:
+                continue
+            visited.add(pageClass)
+            for nextClass in self.transitions.get(pageClass, {}):
+                if nextClass not in visited:
+                    counter += 1
+                    heapq.heappush(queue, (cost + self.getLatency(pageClass, nextClass), counter,
+                        nextClass, path + [(pageClass, nextClass)]))
+        return None
+
+    def goTo(self, target):
+        """
+            Navigate to page, skipping transitions to pages which are open already. If target is
+              not reachable from pages open now, it is opened by its URL (see BasePage.open()).
+            @param target: Class of target page (ex. LUNsPage).
+            @return: Instance of target page.
+        """
+        with self.driver.deadline():
+            if target not in self.pages:
+                self.pages[target] = target.get(driver=self.driver)
+            openPages = PageRecognizer(driver=self.driver, pages=self.pages.values()).getOpenPages()
+            path = self.getPath(sources=[type(page) for page in openPages], target=target)
+            if path is None:
+                LOG.l4('%s.goTo(%s): Not reachable, opening by URL' % (self.name,
+                    target.__name__))
+                self.pages[target].open()
+                self.pages[target].waitUntilOpen()
+            for source, nextClass in path or []:
+                startTime = time.time()
+                self.transitions[source][nextClass](self.pages)
+                self.pages[nextClass].waitUntilOpen()
+                latency = time.time() - startTime
+                # Moving average smooths out occasional slow transitions
+                self.latencies[(source, nextClass)] = latency if (source, nextClass) not in \
+                    self.latencies else (self.latencies[(source, nextClass)] + latency) / 2
+            LOG.l4('%s.goTo(%s): %s' % (self.name, target.__name__, [nextClass.__name__ for _,
+                nextClass in path or []]))
+        return self.pages[target]
@@ -0,0 +1,79 @@
+from base_page import *
+from all_storage_page import AllStoragePage
+from consistency_groups_page import ConsistencyGroupsPage
+from header_page import HeaderPage
+from initiator_groups_page import InitiatorGroupsPage
+from login_page import LoginPage
+from luns_page import LUNsPage
+
+
+class PageRecognizer(object):
+    """
+        Tells which of registered pages are open. Tokens of all pages are evaluated at once in
+          single script call (see condition.evaluate()), so answer doesn't depend on number of
+          pages and missing tokens cost no time outs. Useful as 'where am I' query, ex. to recover
+          from unexpected dialog, or to wait for any of several possible outcomes of an action.
+    """
+    # Pages recognized by default, all of them constructible from driver only
+    pageClasses = [LoginPage, HeaderPage, AllStoragePage, LUNsPage, ConsistencyGroupsPage,
+        InitiatorGroupsPage]
+
+    def __init__(self, driver, pages=None):
+        """
+            @param driver: Instance of Mangal.Driver.
+            @param pages: Pages (instances of BasePage) or wizards (instances of BaseWizard, all
+              their pages are registered) to recognize. Default is pages of pageClasses.
+        """
+        self.driver = driver
+        self.name = self.__class__.__name__
+        self.pages = []
+        if pages is None:
+            pages = [pageClass.get(driver=driver) for pageClass in self.pageClasses]
+        for page in pages:
+            self.register(page)
+
+    def register(self, page):
+        """
+            Add page, or all pages of wizard, to recognized ones. Pages without token are
+              skipped, as they can't be recognized.
+            @param page: Instance of BasePage or BaseWizard.
+        """
+        if not isinstance(page, BasePage):
+            for wizardPage in page:
+                self.register(wizardPage)
+        elif hasattr(page, 'token'):
+            self.pages.append(page)
+        else:
+            LOG.l5('%s.register(): %s has no token, skipped' % (self.name, page.name))
+
+    def getOpenPages(self):
+        """
+            @return: List of registered pages which are open now, in order of registration.
+        """
+        states = condition.evaluate(driver=self.driver, conditions=[page.opened() for page in
+            self.pages], timeout=0)
+        openPages = [page for page, isOpen in zip(self.pages, states) if isOpen]
+        LOG.l4('%s.getOpenPages(): %s' % (self.name, [page.name for page in openPages]))
+        return openPages
+
+    def isOpen(self, page):
+        """
+            @param page: Registered page or its class.
+            @return: True if page (any page of class) is open.
+        """
+        return any([openPage is page or (isinstance(page, type) and isinstance(openPage, page))
+            for openPage in self.getOpenPages()])
+
+    def waitUntilAnyOpen(self, pages=None):
+        """
+            Block until any of pages is open or driver's time out is reached.
+            @param pages: Pages to wait for. Default is all registered pages.
+            @return: Page which has opened first.
+        """
+        pages = pages if pages is not None else self.pages
+        conditions = [page.opened() for page in pages]
+        openCondition = condition.waitUntilAny(driver=self.driver, conditions=conditions,
+            exceptionClass=PageNotFoundException, screenshotName=self.name + '.waitUntilAnyOpen')
+        page = pages[conditions.index(openCondition)]
+        LOG.l4('%s.waitUntilAnyOpen(): %s' % (self.name, page.name))
+        return page
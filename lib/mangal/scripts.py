@@ -0,0 +1,51 @@
+"""
+    Ids of scripts executed by Mangal in browser. Every script carries its id in leading comment
+      (see tag()), so it's told apart by id rather than by its text (ex. by fake WebDriver of
+      offline tests).
+"""
+
+import re
+
+# Condition engine, see condition.evaluate()
+waitConditionsId = 'waitConditions'
+# Components, see BaseComponent
+probeId = 'probe'
+getStatesId = 'getStates'
+getChildrenId = 'getChildren'
+# Grid, see Grid
+getGridColumnsId = 'getGridColumns'
+getGridSnapshotId = 'getGridSnapshot'
+selectGridRecordsId = 'selectGridRecords'
+getStoreDetailsId = 'getStoreDetails'
+getStoreRowsId = 'getStoreRows'
+# Pages, see BasePage, HeaderPage and LoginPage
+readyStateId = 'readyState'
+isAppLoadedId = 'isAppLoaded'
+routeId = 'route'
+fillId = 'fill'
+resetApplicationId = 'resetApplication'
+getSessionId = 'getSession'
+restoreSessionId = 'restoreSession'
+# Driver and session pool, see Driver and SessionPool
+getPageStateKeyId = 'getPageStateKey'
+isHealthyId = 'isHealthy'
+clearStorageId = 'clearStorage'
+
+idPattern = re.compile(r'// mangal:(\w+)\n')
+
+
+def tag(scriptId, script):
+    """
+        @param scriptId: Id of script (ex. probeId).
+        @param script: JavaScript code.
+        @return: Script carrying its id in leading comment, ignored by browser.
+    """
+    return '// mangal:%s\n%s' % (scriptId, script)
+
+
+def getId(script):
+    """
+        @return: Id of script tagged by tag(), None if script is not tagged.
+    """
+    match = idPattern.match(script)
+    return match.group(1) if match else None
@@ -1,7 +1,9 @@
 import re
 from collections import OrderedDict
 from frlog import LOG
-from mangal.exceptions import PageNotFoundException
+from mangal.component import condition
+from mangal.exceptions import PageException, PageNotFoundException
+from mangal.page.page_recognizer import PageRecognizer
 
 
 class BaseWizard(object):
@@ -17,6 +19,18 @@ class BaseWizard(object):
         self.activePage = None
         self.name = self.__class__.__name__
 
+    @classmethod
+    def get(cls, driver, **kwargs):
+        """
+            Return instance of wizard for driver, constructing it (and its pages) only once per
+              driver and arguments (see BasePage.get()).
+            @param kwargs: Arguments of wizard's constructor besides driver.
+        """
+        key = (cls, tuple(sorted(kwargs.items())))
+        if key not in driver.pageCache:
+            driver.pageCache[key] = cls(driver=driver, **kwargs)
+        return driver.pageCache[key]
+
     def __getattr__(self, attributeName):
         # Get page as class attribute by page's name
         if attributeName in self._pages:
@@ -65,6 +79,24 @@ class BaseWizard(object):
         """
         self._pages[name] = page
 
+    def recognizeActivePage(self):
+        """
+            Find out which page of wizard is open, inspecting all pages in single script call (see
+              PageRecognizer), and make it active page. Useful to resynchronize with dialog after
+              unexpected transition.
+            @return: Active page, None if no page of wizard is open.
+        """
+        openPages = PageRecognizer(driver=self.driver, pages=[self]).getOpenPages()
+        if openPages:
+            self.activePage = openPages[0]
+            self.activePageNumber = list(self).index(self.activePage)
+        else:
+            self.activePage = None
+            self.activePageNumber = -1
+        LOG.l4('%s.recognizeActivePage(): %s' % (self.name, self.activePage.name if
+            self.activePage else None))
+        return self.activePage
+
     def open(self):
         """
             Steps to open dialog (ex. close active dialog, navigate to particular page, open menu
@@ -74,104 +106,128 @@ class BaseWizard(object):
         self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
         pass
 
-    def goNext(self):
+    def goNext(self, errors=None):
         """
             Navigate to next page of dialog by clicking on button 'Next'.
             Can be overwritten in sub-class to address page's specifics (say, page has button
               'btnFinish' rather than 'btnNext').
+            @param errors: List of components of active page (ex. validation error labels) whose
+              appearance means next page will not open. Waiting stops as soon as next page is
+              open or any of them is visible, in the latter case PageNotFoundException is raised
+              without waiting for time out.
         """
-        # Active page has own method 'goNext'
-        if hasattr(self.activePage, 'goNext') and callable(self.activePage.goNext):
-            self.activePage.goNext()
-            self[self.activePageNumber + 1].waitUntilOpen()
-            self.activePageNumber += 1
-            self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
-        # Active page has no method 'goNext', thus use wizard's generic solution
-        elif hasattr(self.activePage, 'btnNext'):
-            self.activePage.btnNext.waitUntilEnabled()
-            self.activePage.btnNext.click()
-            # Wait for next page of dialog to be open
-            self[self.activePageNumber + 1].waitUntilOpen()
-            self.activePageNumber += 1
-            self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
-        else:
-            raise PageException(message='%s.%s.goNext(): Cannot proceed to next page.' % (self.name,
-                self.activePage.name), driver=self.driver, screenshotName=self.name + '.goNext')
+        with self.driver.deadline():
+            # Active page has own method 'goNext'
+            if hasattr(self.activePage, 'goNext') and callable(self.activePage.goNext):
+                self.activePage.goNext()
+                self._waitUntilNextOpen(errors=errors)
+                self.activePageNumber += 1
+                self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
+            # Active page has no method 'goNext', thus use wizard's generic solution
+            elif hasattr(self.activePage, 'btnNext'):
+                self.activePage.btnNext.waitUntilEnabled()
+                self.activePage.btnNext.click()
+                # Wait for next page of dialog to be open
+                self._waitUntilNextOpen(errors=errors)
+                self.activePageNumber += 1
+                self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
+            else:
+                raise PageException(message='%s.%s.goNext(): Cannot proceed to next page.' %
+                    (self.name, self.activePage.name), driver=self.driver,
+                    screenshotName=self.name + '.goNext')
+
+    def _waitUntilNextOpen(self, errors=None):
+        nextPage = self[self.activePageNumber + 1]
+        if not errors:
+            nextPage.waitUntilOpen()
+            return
+        nextPageOpened = nextPage.opened()
+        satisfied = condition.waitUntilAny(driver=self.driver, conditions=[nextPageOpened] +
+            [error.visible() for error in errors], exceptionClass=PageNotFoundException,
+            screenshotName=self.name + '.goNext')
+        if satisfied is not nextPageOpened:
+            raise PageNotFoundException(message="%s.%s.goNext(): Next page not open: '%s'" %
+                (self.name, self.activePage.name, satisfied), driver=self.driver,
+                screenshotName=self.name + '.goNext')
 
     def goBack(self):
         """
             Navigate back to previous page of dialog by clicking on button 'Back'.
             Can be overwritten in sub-class.
         """
-        if hasattr(self.activePage, 'goBack') and callable(self.activePage.goBack):
-            self.activePage.goBack()
-            self[self.activePageNumber - 1].waitUntilOpen()
-            self.activePageNumber -= 1
-            self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
-        elif hasattr(self.activePage, 'btnBack'):
-            self.activePage.btnBack.waitUntilEnabled()
-            self.activePage.btnBack.click()
-            # Wait for previous page of dialog to be open
-            self[self.activePageNumber - 1].waitUntilOpen()
-            self.activePageNumber -= 1
-            self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
-        else:
-            raise PageException(message='%s.%s.goBack(): Cannot proceed back to previous page.' %
-                (self.name, self.activePage.name), screenshotName=self.name + '.goBack')
+        with self.driver.deadline():
+            if hasattr(self.activePage, 'goBack') and callable(self.activePage.goBack):
+                self.activePage.goBack()
+                self[self.activePageNumber - 1].waitUntilOpen()
+                self.activePageNumber -= 1
+                self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
+            elif hasattr(self.activePage, 'btnBack'):
+                self.activePage.btnBack.waitUntilEnabled()
+                self.activePage.btnBack.click()
+                # Wait for previous page of dialog to be open
+                self[self.activePageNumber - 1].waitUntilOpen()
+                self.activePageNumber -= 1
+                self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
+            else:
+                raise PageException(message='%s.%s.goBack(): Cannot proceed back to previous page.'
+                    % (self.name, self.activePage.name), screenshotName=self.name + '.goBack')
 
     def submit(self):
         """
             Submit dialog by clicking on button 'OK'.
         """
-        self.activePage.btnOK.waitUntilEnabled()
-        self.activePage.btnOK.click()
-        self.activePage.waitUntilClosed()
-        LOG.l4('%s.submit()' % self.name)
+        with self.driver.deadline():
+            self.activePage.btnOK.waitUntilEnabled()
+            self.activePage.btnOK.click()
+            self.activePage.waitUntilClosed()
+            LOG.l4('%s.submit()' % self.name)
 
     def cancel(self):
         """
             Cancel dialog by clicking on button 'Cancel'.
             Can be overwritten in sub-class.
         """
-        if hasattr(self.activePage, 'cancel') and callable(self.activePage.cancel):
-            self.activePage.cancel()
-            self.activePage.waitUntilClosed()
-            self.activePageNumber = -1
-            self.activePage = None
-        elif hasattr(self.activePage, 'btnCancel'):
-            self.activePage.btnCancel.waitUntilEnabled()
-            self.activePage.btnCancel.click()
-            # Wait for page to be closed
-            self.activePage.waitUntilClosed()
-            self.activePageNumber = -1
-            self.activePage = None
-        else:
-            raise PageException(message='%s.%s.cancel(): Page cannot be canceled.' % (self.name,
-                self.activePage.name), screenshotName=self.name + '.cancel')
-        LOG.l4('%s.cancel()' % self.name)
+        with self.driver.deadline():
+            if hasattr(self.activePage, 'cancel') and callable(self.activePage.cancel):
+                self.activePage.cancel()
+                self.activePage.waitUntilClosed()
+                self.activePageNumber = -1
+                self.activePage = None
+            elif hasattr(self.activePage, 'btnCancel'):
+                self.activePage.btnCancel.waitUntilEnabled()
+                self.activePage.btnCancel.click()
+                # Wait for page to be closed
+                self.activePage.waitUntilClosed()
+                self.activePageNumber = -1
+                self.activePage = None
+            else:
+                raise PageException(message='%s.%s.cancel(): Page cannot be canceled.' % (self.name,
+                    self.activePage.name), screenshotName=self.name + '.cancel')
+            LOG.l4('%s.cancel()' % self.name)
 
     def close(self):
         """
             Close dialog by clicking on button 'Close' (if any).
             Can be overwritten in sub-class to address page's specifics.
         """
-        # Active page has own method 'close'
-        if hasattr(self.activePage, 'close') and callable(self.activePage.close):
-            self.activePage.close()
-            self[self.activePageNumber].waitUntilClosed()
-            self.activePageNumber = -1
-            self.activePage = None
-        # Active page has no method 'close', thus use wizard's generic solution
-        elif hasattr(self.activePage, 'btnClose'):
-            self.activePage.btnClose.waitUntilEnabled()
-            self.activePage.btnClose.click()
-            # Wait until page is closed
-            self[self.activePageNumber].waitUntilClosed()
-            self.activePageNumber = -1
-            self.activePage = None
-        else:
-            raise PageException(message='%s.%s.goNext(): Cannot proceed to next page.' % (self.name,
-                self.activePage.name), screenshotName=self.name + '.close')
+        with self.driver.deadline():
+            # Active page has own method 'close'
+            if hasattr(self.activePage, 'close') and callable(self.activePage.close):
+                self.activePage.close()
+                self[self.activePageNumber].waitUntilClosed()
+                self.activePageNumber = -1
+                self.activePage = None
+            # Active page has no method 'close', thus use wizard's generic solution
+            elif hasattr(self.activePage, 'btnClose'):
+                self.activePage.btnClose.waitUntilEnabled()
+                self.activePage.btnClose.click()
+                # Wait until page is closed
+                self[self.activePageNumber].waitUntilClosed()
+                self.activePageNumber = -1
+                self.activePage = None
+            else:
+                raise PageException(message='%s.%s.goNext(): Cannot proceed to next page.' %
+                    (self.name, self.activePage.name), screenshotName=self.name + '.close')
 
     def hasNext(self):
         """
@@ -4,9 +4,8 @@ import os
 sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/../.."))
 
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.initiator_groups_page import InitiatorGroupsPage
+from mangal.page.navigator import Navigator
 from mangal.wizard.base_wizard import *
 
 
@@ -140,9 +139,7 @@ class ChangeInitiatorGroupOSTypeWizard(BaseWizard):
               grid.
         """
         # Select menu item 'Create -> LUNs'
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabInitiatorGroups.click()
-        initiatorGroupsPage = InitiatorGroupsPage(driver=self.driver)
+        initiatorGroupsPage = Navigator(driver=self.driver).goTo(InitiatorGroupsPage)
         initiatorGroupsPage.gridInitiatorGroups.select(initiator_group=initiator_groups)
         initiatorGroupsPage.menuEdit.select(item='OS Type')
         self.changeInitiatorGroupOSTypePage.waitUntilOpen()
@@ -156,7 +153,7 @@ class ChangeInitiatorGroupOSTypeWizard(BaseWizard):
         """
         self.activePage.btnOK.waitUntilEnabled()
         self.activePage.btnOK.click()
-        if self.changeRelatedInitiatorGroupsPage.isOpen():
+        if self.changeRelatedInitiatorGroupsPage.isOpen(wait=True):
             self.activePageNumber += 1
             self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
         else:
@@ -5,9 +5,8 @@ sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "
 
 import time
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.initiator_groups_page import InitiatorGroupsPage
+from mangal.page.navigator import Navigator
 from mangal.wizard.base_wizard import *
 
 
@@ -89,7 +88,7 @@ class ChangeInitiatorsPage(BasePage):
             self.txtAddWWPN.setText(text=wwpn)
             self.btnAddWWPN.click()
             # Subsequent input is not performing unless some delay provided.
-            time.sleep(.5)
+            self.driver.sleep(.5)
 
         LOG.l4("ChangeInitiatorsWizard.%s.addWWPNs(wwpns=%s)" % (self.name, wwpns))
 
@@ -123,9 +122,7 @@ class ChangeInitiatorsWizard(BaseWizard):
             Open dialog 'Change Initiators'.
             @param initiator_group: Name of initiator group to select in grid.
         """
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabInitiatorGroups.click()
-        initiatorGroupsPage = InitiatorGroupsPage(driver=self.driver)
+        initiatorGroupsPage = Navigator(driver=self.driver).goTo(InitiatorGroupsPage)
         initiatorGroupsPage.gridInitiatorGroups.select(initiator_group=initiator_group)
         initiatorGroupsPage.menuEdit.select(item='Initiators')
         self.changeInitiatorsPage.waitUntilOpen()
@@ -4,9 +4,8 @@ sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "
 
 from express.utils import *
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.consistency_groups_page import ConsistencyGroupsPage
+from mangal.page.navigator import Navigator
 from wizard.base_wizard import *
 
 
@@ -105,12 +104,9 @@ class CreateConsistencyGroupWizard(BaseWizard):
 
     def open(self, parentConsistencyGroup=None):
         # Select menu item 'Create -> LUNs'
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabConsistencyGroups.click()
-        consistencyGroupsPage = ConsistencyGroupsPage(driver=self.driver)
+        consistencyGroupsPage = Navigator(driver=self.driver).goTo(ConsistencyGroupsPage)
         if parentConsistencyGroup is not None:
-            consistencyGroupsPage.gridConsistencyGroups.unselect()
-            consistencyGroupsPage.gridConsistencyGroups.select(name=parentConsistencyGroup)
+            consistencyGroupsPage.gridConsistencyGroups.selectOnly(name=parentConsistencyGroup)
         menuCreate = consistencyGroupsPage.menuCreate
         menuCreate.select(item='Consistency group')
         self.createConsistencyGroupPage.waitUntilOpen()
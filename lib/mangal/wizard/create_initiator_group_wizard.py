@@ -4,9 +4,8 @@ import os
 sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/../.."))
 
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.initiator_groups_page import InitiatorGroupsPage
+from mangal.page.navigator import Navigator
 from mangal.wizard.base_wizard import *
 
 
@@ -91,9 +90,10 @@ class CreateInitiatorGroupPage(BasePage):
         self.components['token'] = self.lblTitle
 
     def defineInitiatorGroup(self, name, osType=None, wwpns=None):
-        self.setName(name=name)
+        values = {'txtName': name}
         if osType is not None:
-            self.setOSType(osType=osType)
+            values['dLstOSType'] = osType
+        self.fill(values)
         if wwpns is not None:
             self.setWWPNs(wwpns=wwpns)
         LOG.l4("CreateInitiatorGroupWizard.%s.defineInitiatorGroup(name='%s', osType='%s', wwpns=%s)"
@@ -109,8 +109,7 @@ class CreateInitiatorGroupPage(BasePage):
         LOG.l4("CreateInitiatorGroupWizard.%s.setOSType(osType='%s')" % (self.name, osType))
 
     def setWWPNs(self, wwpns):
-        self.gridInitiatorWWPNs.unselect()
-        self.gridInitiatorWWPNs.select(initiator_group=wwpns)
+        self.gridInitiatorWWPNs.selectOnly(initiator_group=wwpns)
         LOG.l4("CreateInitiatorGroupWizard.%s.setWWPNs(wwpns=%s)" % (self.name, wwpns))
 
     def addWWPNs(self, wwpns):
@@ -152,9 +151,7 @@ class CreateInitiatorGroupWizard(BaseWizard):
         """
             Open dialog 'Create an Initiator Group'.
         """
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabInitiatorGroups.click()
-        initiatorGroupsPage = InitiatorGroupsPage(driver=self.driver)
+        initiatorGroupsPage = Navigator(driver=self.driver).goTo(InitiatorGroupsPage)
         initiatorGroupsPage.menuCreate.select(item='Initiator Group')
         self.createInitiatorGroupPage.waitUntilOpen()
 
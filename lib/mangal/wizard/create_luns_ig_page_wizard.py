@@ -3,9 +3,8 @@ import sys
 sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/../.."))
 
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.initiator_groups_page import InitiatorGroupsPage
+from mangal.page.navigator import Navigator
 from wizard.base_wizard import *
 from wizard.create_luns_wizard import DefineLUNsPage
 
@@ -71,9 +70,7 @@ class CreateLUNsIGPageWizard(BaseWizard):
             @param initiator_group: Name of initiator group to select in grid.
         """
         # Select menu item 'Create -> LUNs'
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabInitiatorGroups.click()
-        initiatorGroupsPage = InitiatorGroupsPage(driver=self.driver)
+        initiatorGroupsPage = Navigator(driver=self.driver).goTo(InitiatorGroupsPage)
         initiatorGroupsPage.gridInitiatorGroups.select(initiator_group=initiator_group)
         initiatorGroupsPage.menuCreate.select(item='LUNs')
         self.defineLUNsPage.waitUntilOpen()
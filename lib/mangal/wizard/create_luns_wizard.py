@@ -4,9 +4,8 @@ sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "
 
 from express.utils import *
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.luns_page import LUNsPage
+from mangal.page.navigator import Navigator
 from wizard.base_wizard import *
 
 
@@ -134,72 +133,38 @@ class DefineLUNsPage(BasePage):
         self._selectors['btnNext'] = '//div[@data-mg-comp="lunCreateWiz"]/div[@data-mg-comp="footer"]/div/div/a[@data-mg-comp="next"]'
 
     def setupComponents(self):
-        self.components['lblTitle'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblTitle, name=self.name)
-        self.components['lblStepDescription'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblStepDescription, name=self.name)
-        self.components['lblNumberOfLUNs'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblNumberOfLUNs, name=self.name)
-        self.components['dLstNumberOfLUNs'] = dropdownlist.DropDownList(driver=self.driver,
-            selector=self.selectors.dLstNumberOfLUNs, name=self.name)
-        self.components['dItmNumberOfLUNs'] = dropdownlist.DropDownItems(driver=self.driver,
-            selector=self.selectors.dItmNumberOfLUNs, name=self.name)
-        self.dLstNumberOfLUNs.addItems(items=self.dItmNumberOfLUNs)
-        self.components['lblName'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblName, name=self.name)
-        self.components['txtName'] = textbox.TextBox(driver=self.driver,
-            selector=self.selectors.txtName, name=self.name)
-        self.components['lblNameError'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblNameError, name=self.name)
-        self.components['lblSize'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblSize, name=self.name)
-        self.components['txtSize'] = textbox.TextBox(driver=self.driver,
-            selector=self.selectors.txtSize, name=self.name)
-        self.components['lblSizeError'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblSizeError, name=self.name)
-        self.components['dLstSizeUnit'] = dropdownlist.DropDownList(driver=self.driver,
-            selector=self.selectors.dLstSizeUnit, name=self.name)
-        self.components['dItmSizeUnit'] = dropdownlist.DropDownItems(driver=self.driver,
-            selector=self.selectors.dItmSizeUnit, name=self.name)
-        self.dLstSizeUnit.addItems(items=self.dItmSizeUnit)
-        self.components['lblNameAndSize'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblNameAndSize, name=self.name)
-        self.components['rBtnAutoNameAndSize'] = radiobutton.RadioButton(driver=self.driver,
-            selector=self.selectors.rBtnAutoNameAndSize, name=self.name)
-        self.components['lblAutoNameAndSize'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblAutoNameAndSize, name=self.name)
-        self.components['rBtnManuallyNameAndSize'] = radiobutton.RadioButton(driver=self.driver,
-            selector=self.selectors.rBtnManuallyNameAndSize, name=self.name)
-        self.components['lblManuallyNameAndSize'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblManuallyNameAndSize, name=self.name)
-        self.components['lblPrefix'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblPrefix, name=self.name)
-        self.components['txtPrefix'] = textbox.TextBox(driver=self.driver,
-            selector=self.selectors.txtPrefix, name=self.name)
-        self.components['lblSuffix'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblSuffix, name=self.name)
-        self.components['dLstSuffix'] = dropdownlist.DropDownList(driver=self.driver,
-            selector=self.selectors.dLstSuffix, name=self.name)
-        self.components['dItmSuffix'] = dropdownlist.DropDownItems(driver=self.driver,
-            selector=self.selectors.dItmSuffix, name=self.name)
-        self.dLstSuffix.addItems(items=self.dItmSuffix)
-        self.components['lblStartAt'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblStartAt, name=self.name)
-        self.components['txtStartAt'] = textbox.TextBox(driver=self.driver,
-            selector=self.selectors.txtStartAt, name=self.name)
-        self.components['lblPreview'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblPreview, name=self.name)
-        self.components['lblAutoSize'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblAutoSize, name=self.name)
-        self.components['txtAutoSize'] = textbox.TextBox(driver=self.driver,
-            selector=self.selectors.txtAutoSize, name=self.name)
-        self.components['dLstAutoSizeUnit'] = dropdownlist.DropDownList(driver=self.driver,
-            selector=self.selectors.dLstAutoSizeUnit, name=self.name)
-        self.components['dItmAutoSizeUnit'] = dropdownlist.DropDownItems(driver=self.driver,
-            selector=self.selectors.dItmAutoSizeUnit, name=self.name)
-        self.dLstAutoSizeUnit.addItems(items=self.dItmAutoSizeUnit)
-        self.components['lblAutoSizeError'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblAutoSizeError, name=self.name)
+        # Components are only constructed when used, see BasePage.addComponent()
+        self.addComponent('lblTitle', label.Label)
+        self.addComponent('lblStepDescription', label.Label)
+        self.addComponent('lblNumberOfLUNs', label.Label)
+        self.addComponent('dLstNumberOfLUNs', dropdownlist.DropDownList, items='dItmNumberOfLUNs')
+        self.addComponent('dItmNumberOfLUNs', dropdownlist.DropDownItems)
+        self.addComponent('lblName', label.Label)
+        self.addComponent('txtName', textbox.TextBox)
+        self.addComponent('lblNameError', label.Label)
+        self.addComponent('lblSize', label.Label)
+        self.addComponent('txtSize', textbox.TextBox)
+        self.addComponent('lblSizeError', label.Label)
+        self.addComponent('dLstSizeUnit', dropdownlist.DropDownList, items='dItmSizeUnit')
+        self.addComponent('dItmSizeUnit', dropdownlist.DropDownItems)
+        self.addComponent('lblNameAndSize', label.Label)
+        self.addComponent('rBtnAutoNameAndSize', radiobutton.RadioButton)
+        self.addComponent('lblAutoNameAndSize', label.Label)
+        self.addComponent('rBtnManuallyNameAndSize', radiobutton.RadioButton)
+        self.addComponent('lblManuallyNameAndSize', label.Label)
+        self.addComponent('lblPrefix', label.Label)
+        self.addComponent('txtPrefix', textbox.TextBox)
+        self.addComponent('lblSuffix', label.Label)
+        self.addComponent('dLstSuffix', dropdownlist.DropDownList, items='dItmSuffix')
+        self.addComponent('dItmSuffix', dropdownlist.DropDownItems)
+        self.addComponent('lblStartAt', label.Label)
+        self.addComponent('txtStartAt', textbox.TextBox)
+        self.addComponent('lblPreview', label.Label)
+        self.addComponent('lblAutoSize', label.Label)
+        self.addComponent('txtAutoSize', textbox.TextBox)
+        self.addComponent('dLstAutoSizeUnit', dropdownlist.DropDownList, items='dItmAutoSizeUnit')
+        self.addComponent('dItmAutoSizeUnit', dropdownlist.DropDownItems)
+        self.addComponent('lblAutoSizeError', label.Label)
 
         # As all 'Manually...' controls are indexed (selector has '{index}'), they should be created
         #   in end script rather than here.
@@ -209,37 +174,23 @@ class DefineLUNsPage(BasePage):
         #     textBox = TextBox(driver=self.driver,
         #     selector=self.selectors.txtManuallyName(index=1))
 
-        self.components['lblManuallyNameError'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblManuallyNameError, name=self.name)
-        self.components['lblManuallySizeError'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblManuallySizeError, name=self.name)
-        self.components['chkAddToConsistencyGroup'] = checkbox.CheckBox(driver=self.driver,
-            selector=self.selectors.chkAddToConsistencyGroup, name=self.name)
-        self.components['lblAddToConsistencyGroup'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblAddToConsistencyGroup, name=self.name)
-        self.components['lblConsistencyGroupDescription'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblConsistencyGroupDescription, name=self.name)
-        self.components['lblParentConsistencyGroup'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblParentConsistencyGroup, name=self.name)
-        self.components['cBoxParentConsistencyGroup'] = combobox.ComboBox(driver=self.driver,
-            selector=self.selectors.cBoxParentConsistencyGroup, name=self.name)
-        self.components['cItmParentConsistencyGroup'] = combobox.ComboBoxItems(driver=self.driver,
-            selector=self.selectors.cItmParentConsistencyGroup, name=self.name)
-        self.cBoxParentConsistencyGroup.addItems(items=self.cItmParentConsistencyGroup)
-        self.components['lblNewConsistencyGroup'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblNewConsistencyGroup, name=self.name)
-        self.components['txtNewConsistencyGroup'] = textbox.TextBox(driver=self.driver,
-            selector=self.selectors.txtNewConsistencyGroup, name=self.name)
-        self.components['lblConsistencyGroupError'] = label.Label(driver=self.driver,
-            selector=self.selectors.lblConsistencyGroupError, name=self.name)
-        self.components['btnCancel'] = button.Button(driver=self.driver,
-            selector=self.selectors.btnCancel, name=self.name)
-        self.components['btnBack'] = button.Button(driver=self.driver,
-            selector=self.selectors.btnBack, name=self.name)
-        self.components['btnNext'] = button.Button(driver=self.driver,
-            selector=self.selectors.btnNext, name=self.name)
+        self.addComponent('lblManuallyNameError', label.Label)
+        self.addComponent('lblManuallySizeError', label.Label)
+        self.addComponent('chkAddToConsistencyGroup', checkbox.CheckBox)
+        self.addComponent('lblAddToConsistencyGroup', label.Label)
+        self.addComponent('lblConsistencyGroupDescription', label.Label)
+        self.addComponent('lblParentConsistencyGroup', label.Label)
+        self.addComponent('cBoxParentConsistencyGroup', combobox.ComboBox,
+            items='cItmParentConsistencyGroup')
+        self.addComponent('cItmParentConsistencyGroup', combobox.ComboBoxItems)
+        self.addComponent('lblNewConsistencyGroup', label.Label)
+        self.addComponent('txtNewConsistencyGroup', textbox.TextBox)
+        self.addComponent('lblConsistencyGroupError', label.Label)
+        self.addComponent('btnCancel', button.Button)
+        self.addComponent('btnBack', button.Button)
+        self.addComponent('btnNext', button.Button)
         # Component uniquely identifying given page
-        self.components['token'] = self.dLstNumberOfLUNs
+        self.components.setLazy('token', lambda: self.components['dLstNumberOfLUNs'])
 
     def defineSingleLUN(self, name, size):
         """
@@ -252,19 +203,13 @@ class DefineLUNsPage(BasePage):
         """
         # Verify proper page is displayed
         self.dLstNumberOfLUNs.waitUntilPresent()
-        # Select single LUN
-        self.dLstNumberOfLUNs.select(item='1')
-        self.txtName.clear()
-        self.txtName.setText(text=name)
-
         # Extract from provided size ('1024 K', '2GB' etc.) included size unit ('K', 'M' etc.)
         sizeUnit = Utility.getLocalizedSizeUnit(sizeUnit=Utility.getSizeUnit(size=size),
             locale=self.locale)
-        # Select size unit ('KiB', 'Gib')
-        self.dLstSizeUnit.select(item=sizeUnit)
-        self.txtSize.clear()
         sizeText = Utility.getLocalizedSizeFormat(size=size, locale=self.locale)
-        self.txtSize.setText(text=sizeText)
+        # Single LUN is selected first, as number of LUNs switches widgets of rest of form
+        self.fill([('dLstNumberOfLUNs', '1'), ('txtName', name), ('dLstSizeUnit', sizeUnit),
+            ('txtSize', sizeText)])
 
     def defineMultipleLUNsAuto(self, number, size, prefix, suffix=None, startAt=None):
         self.dLstNumberOfLUNs.waitUntilPresent()
@@ -494,10 +439,9 @@ class CreateLUNsWizard(BaseWizard):
         self.addPage(name='closePage', page=ClosePage(driver=self.driver))
 
     def open(self):
-        # Select menu item 'Create -> LUNs'
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabLUNs.click()
-        LUNsPage(driver=self.driver).menuCreate.select(item='LUNs')
-        self.defineLUNsPage.waitUntilOpen()
+        with self.driver.deadline():
+            # Select menu item 'Create -> LUNs'
+            Navigator(driver=self.driver).goTo(LUNsPage).menuCreate.select(item='LUNs')
+            self.defineLUNsPage.waitUntilOpen()
         self.activePageNumber = 0
         self.activePage = self._pages[self._pages.keys()[self.activePageNumber]]
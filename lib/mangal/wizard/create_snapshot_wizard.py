@@ -69,7 +69,7 @@ class CreateSnapshotPage(BasePage):
         self.txtName.clear()
         self.txtName.setText(text=name)
         # Let the form to update value
-        time.sleep(.5)
+        self.driver.sleep(.5)
         LOG.l4('%s.setName(name=%s)' % (self.name, name))
 
     def submit(self):
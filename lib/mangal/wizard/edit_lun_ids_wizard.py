@@ -5,9 +5,8 @@ sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "
 
 from selenium.webdriver.common.keys import Keys
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.luns_page import LUNsPage
+from mangal.page.navigator import Navigator
 from mangal.wizard.base_wizard import *
 
 
@@ -159,13 +158,10 @@ class EditLUNIDsWizard(BaseWizard):
             Select LUN in grid by given name, then open 'Edit IDs' dialog.
             @param name: Name of LUN which to select in grid.
         """
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabLUNs.click()
-        lunsPage = LUNsPage(driver=self.driver)
+        lunsPage = Navigator(driver=self.driver).goTo(LUNsPage)
 
-        # In LUNs grid, select row with given LUN name by checking row check box.
-        lunsPage.gridLUNs.unselect()
-        lunsPage.gridLUNs.select(name=name)
+        # In LUNs grid, make row with given LUN name the only selected one
+        lunsPage.gridLUNs.selectOnly(name=name)
 
         # In menu 'Edit', select item 'ID'.
         lunsPage.menuEdit.select(item='ID')
@@ -4,9 +4,8 @@ import os
 sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/../.."))
 
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.luns_page import LUNsPage
+from mangal.page.navigator import Navigator
 from mangal.wizard.base_wizard import *
 
 
@@ -91,13 +90,10 @@ class EditLUNMappingsWizard(BaseWizard):
         """
         if isinstance(name, list) and len(name) != 1:
             raise FailedConfigException('Wizard accepts single LUN name as argument.')
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabLUNs.click()
-        lunsPage = LUNsPage(driver=self.driver)
+        lunsPage = Navigator(driver=self.driver).goTo(LUNsPage)
 
-        # In LUNs grid, select row with given LUN name by checking row check box.
-        lunsPage.gridLUNs.unselect()
-        lunsPage.gridLUNs.select(name=name)
+        # In LUNs grid, make row with given LUN name the only selected one
+        lunsPage.gridLUNs.selectOnly(name=name)
 
         # In menu 'Edit', select item 'Name'.
         lunsPage.menuEdit.select(item='Mappings')
@@ -4,9 +4,8 @@ import os
 sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/../.."))
 
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.luns_page import LUNsPage
+from mangal.page.navigator import Navigator
 from mangal.wizard.base_wizard import *
 
 
@@ -70,13 +69,10 @@ class EditLUNStateWizard(BaseWizard):
             Selects LUN(s) in grid by names(s), then selects menu item Edit -> state -> Online.
             @param filterAttrs: Filtering condition applied to rows of grid. See satisfyFilters().
         """
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabLUNs.click()
-        lunsPage = LUNsPage(driver=self.driver)
+        lunsPage = Navigator(driver=self.driver).goTo(LUNsPage)
 
-        # In LUNs grid, select row with given LUN name by checking row check box.
-        lunsPage.gridLUNs.unselect()
-        lunsPage.gridLUNs.select(**filterAttrs)
+        # In LUNs grid, make rows satisfying filter conditions the only selected ones
+        lunsPage.gridLUNs.selectOnly(**filterAttrs)
 
         menuEdit = lunsPage.menuEdit
         # In menu 'Edit', select item 'Name'.
@@ -88,13 +84,10 @@ class EditLUNStateWizard(BaseWizard):
             Select LUN(s) in grid by given name(s), then open 'Take LUNs Offline' dialog.
             @param filterAttrs: Filtering condition applied to rows of grid. See satisfyFilters().
         """
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabLUNs.click()
-        lunsPage = LUNsPage(driver=self.driver)
+        lunsPage = Navigator(driver=self.driver).goTo(LUNsPage)
 
         # In LUNs grid, select rows satisfying filter conditions by checking row check box.
-        lunsPage.gridLUNs.unselect()
-        lunsPage.gridLUNs.select(**filterAttrs)
+        lunsPage.gridLUNs.selectOnly(**filterAttrs)
 
         menuEdit = lunsPage.menuEdit
         # In menu 'Edit', select item 'Name'.
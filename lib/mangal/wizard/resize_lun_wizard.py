@@ -5,9 +5,8 @@ sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "
 
 import time
 from mangal.page.base_page import *
-from mangal.page.header_page import HeaderPage
-from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.luns_page import LUNsPage
+from mangal.page.navigator import Navigator
 from mangal.wizard.base_wizard import *
 
 class ResizeLUNPage(BasePage):
@@ -91,7 +90,7 @@ class ResizeLUNPage(BasePage):
         self.txtSize.setText(text=sizeText)
         # By undefined reason, typed text isn't propagated immediately after typing, so click on
         #   'OK' submits old value. Sleep helps the things to make up.
-        time.sleep(.5)
+        self.driver.sleep(.5)
         LOG.l4("ResizeLUNWizard.ResizeLUNPage.resizeLUN(size='%s')" % size)
 
     def submit(self):
@@ -116,13 +115,10 @@ class ResizeLUNWizard(BaseWizard):
             Select LUN in grid by given name, then open resize dialog.
             @param name: Name of LUN which to select in grid.
         """
-        HeaderPage(driver=self.driver).btnManager.click()
-        AllStoragePage(driver=self.driver).tabLUNs.click()
-        lunsPage = LUNsPage(driver=self.driver)
+        lunsPage = Navigator(driver=self.driver).goTo(LUNsPage)
 
-        # In LUNs grid, select row with given LUN name by checking row check box.
-        lunsPage.gridLUNs.unselect()
-        lunsPage.gridLUNs.select(name=name)
+        # In LUNs grid, make row with given LUN name the only selected one
+        lunsPage.gridLUNs.selectOnly(name=name)
 
         # In menu 'Edit', select item 'Name'.
         lunsPage.menuEdit.select(item='Size')
@@ -12,6 +12,7 @@ from mangal.page.header_page import HeaderPage
 from mangal.page.all_storage_page import AllStoragePage
 from mangal.page.luns_page import LUNsPage
 from mangal.wizard.create_luns_wizard import DefineLUNsPage
+from mangal.component import condition
 
 import express
 from frlog import LOG
@@ -125,6 +126,27 @@ class TestComponentBasic(FRTestCase):
         self.loginPage.imgCompanyLogo.waitUntilPresent()
         LOG.info('Company logo is present on page:', self.loginPage.imgCompanyLogo.isPresent())
 
+    def test_component_basic_conditions(self):
+        LOG.step('Opening login page')
+        self.loginPage.open()
+
+        LOG.step('Waiting for username, password and enabled button Sign In at once')
+        condition.waitUntil(driver=self.driver, condition=self.loginPage.txtUsername.visible() &
+            self.loginPage.txtPassword.visible() & self.loginPage.btnSignIn.enabled())
+        self.assertTrue(condition.check(driver=self.driver, condition=self.loginPage.opened()))
+        self.assertFalse(condition.check(driver=self.driver, condition=self.headerPage.opened()))
+
+        LOG.step('Signing in')
+        self.loginPage.txtUsername.setText(self.username)
+        self.loginPage.txtPassword.setText(self.password)
+        self.loginPage.btnSignIn.click()
+
+        LOG.step('Waiting for either header page to open or login page to close')
+        satisfied = condition.waitUntilAny(driver=self.driver,
+            conditions=[self.headerPage.opened(), self.loginPage.closed()])
+        LOG.info('Condition satisfied first:', satisfied)
+        self.headerPage.waitUntilOpen()
+
     def testTeardown(self):
         self.driver.quit()
 
@@ -467,6 +467,72 @@ class TestComponentGrid(FRTestCase):
             self.driver.back()
             LOG.info('Navigated back in browser history')
 
+    def test_component_grid_snapshot(self):
+        prefix = 'TITAN'
+        lunCount = 3
+
+        LOG.step("Creating %s LUNs with name prefix '%s'" % (lunCount, prefix))
+        self.luns.create(count=lunCount, size=self.lunSize, prefix=prefix)
+
+        self.lunsPage.btnRefresh.click()
+
+        LOG.step('Creating LUNs grid object')
+        gridLUNs = self.lunsPage.gridLUNs
+
+        LOG.step('Finding rows using grid snapshot')
+        gridLUNs.useSnapshot = True
+        snapshotRows = gridLUNs.find()
+        LOG.info('Found rows:\n', len(snapshotRows))
+
+        LOG.step('Finding rows element by element')
+        gridLUNs.useSnapshot = False
+        elementRows = gridLUNs.find()
+        LOG.info('Found rows:\n', len(elementRows))
+        self.assertTrue(snapshotRows == elementRows)
+
+        LOG.step('Selecting rows by name using grid snapshot')
+        gridLUNs.useSnapshot = True
+        gridLUNs.unselect()
+        gridLUNs.select(name=prefix, matchPattern=True)
+        selectedRows = gridLUNs.find(selected=True)
+        self.assertTrue(len(selectedRows) == lunCount)
+        for row in selectedRows:
+            self.assertTrue(row['name'].startswith(prefix))
+        LOG.info('Selected rows:\n', selectedRows)
+
+        LOG.step('Unselecting all rows')
+        gridLUNs.unselect()
+
+    def test_component_grid_store(self):
+        prefix = 'CALLISTO'
+        lunCount = 135
+
+        LOG.step("Creating %s LUNs with name prefix '%s'" % (lunCount, prefix))
+        self.luns.create(count=lunCount, size=self.lunSize, prefix=prefix)
+
+        self.lunsPage.btnRefresh.click()
+
+        LOG.step('Creating LUNs grid object')
+        gridLUNs = self.lunsPage.gridLUNs
+
+        LOG.step('Getting details of grid store')
+        storeDetails = gridLUNs.getStoreDetails()
+        self.assertTrue(storeDetails['pages'] == gridLUNs.pages)
+        LOG.info('Store details:\n', storeDetails)
+
+        LOG.step('Finding rows on all pages by paging through grid')
+        gridLUNs.useStore = False
+        pagedRows = gridLUNs.find(allPages=True, name=prefix, matchPattern=True)
+        self.assertTrue(len(pagedRows) == lunCount)
+        LOG.info('Found rows:', len(pagedRows))
+
+        LOG.step('Finding rows on all pages using grid store')
+        gridLUNs.useStore = True
+        storeRows = gridLUNs.find(allPages=True, name=prefix, matchPattern=True)
+        self.assertTrue(sorted([row['name'] for row in storeRows]) ==
+            sorted([row['name'] for row in pagedRows]))
+        LOG.info('Found rows:', len(storeRows))
+
     def testTeardown(self):
         try:
             LOG.info("Destroying existing LUNs...")
@@ -0,0 +1,329 @@
+#!/usr/bin/env python
+
+purpose = """Offline unit test of Mangal UI API Grid component over fake WebDriver"""
+
+import os
+import sys
+sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/../../.."))
+sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/.."))
+
+from fake_driver import FakeDriver, toggleClass
+from mangal.component.grid import Grid, RowFilter
+from mangal.component.label import Label
+from mangal.page import base_page
+from mangal.page.base_page import BasePage
+from mangal.component import condition
+from mangal import scripts
+from selenium.common.exceptions import WebDriverException
+from mangal.exceptions import ComponentFailedStateException, PageException
+from frlog import LOG
+from frargs import ARGS
+from frtestcase import FRTestCase
+from frexceptions import *
+
+
+ROW = """
+    <tr class="x-grid-row x-grid-data-row{selected}" data-recordid="ext-record-{index}">
+        <td class="x-grid-cell x-grid-cell-row-checker"><div><div class="x-grid-row-checker"></div></div></td>
+        <td class="x-grid-cell"><div>{name}</div></td>
+        <td class="x-grid-cell"><div>{size}</div></td>
+    </tr>
+"""
+
+PAGE = """
+<html><body>
+    <div id="grid-1">
+        <div id="headercontainer-1"><div><div>
+            <div class="x-column-header x-column-header-checkbox" data-mg-comp=""><div></div></div>
+            <div class="x-column-header" data-mg-comp="name"><div>Name</div></div>
+            <div class="x-column-header x-column-header-sort-ASC" data-mg-comp="size"><div>Size</div></div>
+            <div class="x-column-header" data-mg-comp="hidden" style="display: none"><div>Hidden</div></div>
+        </div></div></div>
+        <div class="x-grid-with-row-lines"><div><table><tbody>
+            {rows}
+        </tbody></table></div></div>
+    </div>
+    <div id="error" style="display: none">Name is invalid</div>
+    <input id="filter" type="text" value="LUN"/>
+</body></html>
+"""
+
+
+class OfflinePage(BasePage):
+    def setupSelectors(self):
+        self._selectors['txtFilter'] = '//input[@id="filter"]'
+        self._selectors['grid'] = '//div[@id="grid-1"]'
+
+    def setupComponents(self):
+        # Component classes are taken from namespace of base_page, as pages do with
+        #   'from base_page import *'
+        self.addComponent('txtFilter', base_page.textbox.TextBox)
+        self.addComponent('grid', base_page.grid.Grid)
+
+
+class TestComponentGridOffline(FRTestCase):
+    def testSetup(self):
+        rows = ''.join([ROW.format(name='LUN_%s' % index, size='%s GiB' % index,
+            selected=' x-grid-row-selected' if index == 3 else '', index=index) for index in
+            range(1, 6)])
+        self.driver = FakeDriver(source=PAGE.format(rows=rows))
+        # Clicking on row check box toggles selection of row
+        self.driver.getWebDriver().onClick(xpath='//div[@class="x-grid-row-checker"]',
+            handler=lambda node: toggleClass(node.getparent().getparent().getparent(),
+            'x-grid-row-selected'))
+        self.grid = Grid(driver=self.driver, selector='//div[@id="grid-1"]', name='Offline.grid')
+        self.lblError = Label(driver=self.driver, selector='//div[@id="error"]',
+            name='Offline.lblError')
+
+    def test_component_grid_offline_find(self):
+        LOG.step('Finding rows of grid')
+        rows = self.grid.find()
+        self.assertTrue(self.grid.columnNames == ['selected', 'name', 'size'])
+        self.assertTrue([row['name'] for row in rows] == ['LUN_%s' % index for index in range(1, 6)])
+        self.assertTrue([row['name'] for row in rows if row['selected']] == ['LUN_3'])
+
+        LOG.step('Finding rows by pattern')
+        rows = self.grid.find(name='LUN_[24]', matchPattern=True)
+        self.assertTrue([row['size'] for row in rows] == ['2 GiB', '4 GiB'])
+
+        LOG.step('Reading rows element by element gives the same result')
+        self.grid.useSnapshot = False
+        self.assertTrue(self.grid.find() == self.grid.find(allPages=True))
+        self.assertTrue(self.grid.sortedBy() == {'column': 'size', 'ascend': True})
+
+    def test_component_grid_offline_budget(self):
+        LOG.step('Finding rows gets budget per page, or given one')
+        budgets = []
+        deadline = self.driver.deadline
+        self.driver.deadline = lambda budget=None: budgets.append(budget) or deadline(budget=budget)
+        self.grid.find(allPages=True)
+        self.grid.find(budget=5)
+        self.assertTrue(budgets == [self.driver.budget * self.grid.pages, 5])
+
+    def test_component_grid_offline_iterate(self):
+        LOG.step('Iterating over rows of grid')
+        self.assertTrue([row['name'] for row in self.grid.iterRows(limit=2)] == ['LUN_1', 'LUN_2'])
+        self.assertTrue([row['name'] for row in self.grid.iterRows(first=True,
+            name='LUN_[345]', matchPattern=True)] == ['LUN_3'])
+        for row in self.grid.iterRows(size='4 GiB'):
+            self.assertTrue(row['name'] == 'LUN_4')
+
+        LOG.step('Selecting first matching row only')
+        self.grid.select(first=True, name=['LUN_4', 'LUN_5'])
+        self.assertTrue([row['name'] for row in self.grid.find(selected=True)] == ['LUN_3', 'LUN_4'])
+
+    def test_component_grid_offline_filter(self):
+        LOG.step('Filtering rows with compiled filters')
+        row = {'selected': False, 'name': 'LUN_12', 'size': '12 GiB', 'mapping': 'IG_1, IG_2'}
+        self.assertTrue(RowFilter.compile({})(row))
+        self.assertTrue(RowFilter.compile({'name': 'LUN_12'})(row))
+        self.assertTrue(RowFilter.compile({'name': 'LUN_1', 'size': '12 GiB'})(row))
+        self.assertFalse(RowFilter.compile({'name': 'LUN_1', 'size': '12 GiB',
+            'attributeCondition': 'AND'})(row))
+        self.assertTrue(RowFilter.compile({'name': 'LUN_1\\d', 'matchPattern': True})(row))
+        self.assertTrue(RowFilter.compile({'mapping': ['IG_2', 'IG_3']})(row))
+        self.assertFalse(RowFilter.compile({'mapping': ['IG_2', 'IG_3'],
+            'valuesCondition': 'AND'})(row))
+        self.assertFalse(RowFilter.compile({'name': 'LUN_12', 'state': 'Online',
+            'attributeCondition': 'AND'})(row))
+        self.assertTrue(RowFilter.compile({'selected': False})(row))
+        self.assertTrue(RowFilter.compile({'name': 'LUN_12'}) is RowFilter.compile({'name':
+            'LUN_12'}))
+        self.assertFalse(RowFilter.compile({'selected': 1})(row))
+        self.assertTrue(RowFilter.compile({'mapping': ('IG_2',)}) is not
+            RowFilter.compile({'mapping': ['IG_2']}))
+
+        LOG.step('Filter of control keys only matches every row')
+        self.assertTrue(RowFilter.compile({'matchPattern': True})(row))
+        self.assertTrue(RowFilter.compile({'attributeCondition': 'AND', 'valuesCondition':
+            'AND'})(row))
+        self.assertTrue(len(self.grid.find(matchPattern=True)) == 5)
+
+    def test_component_grid_offline_select(self):
+        LOG.step('Selecting rows')
+        self.grid.select(name=['LUN_1', 'LUN_2'])
+        self.assertTrue([row['name'] for row in self.grid.find(selected=True)] ==
+            ['LUN_1', 'LUN_2', 'LUN_3'])
+
+        LOG.step('Unselecting row')
+        self.grid.unselect(name='LUN_3')
+        self.assertTrue([row['name'] for row in self.grid.find(selected=True)] ==
+            ['LUN_1', 'LUN_2'])
+
+    def test_component_grid_offline_select_store(self):
+        LOG.step('Selecting on all pages of store-backed grid acts upon rows of page')
+        grid = Grid(driver=self.driver, selector='//div[@id="grid-1"]', name='Offline.gridStore',
+            useStore=True)
+        grid.select(allPages=True, name='LUN_5')
+        grid.unselect(allPages=True, name='LUN_3')
+        self.assertTrue([row['name'] for row in grid.find(selected=True)] == ['LUN_5'])
+
+    def test_component_grid_offline_columns(self):
+        LOG.step('Columns are re-read only when header changes')
+        self.grid.refreshColumnNames()
+        fingerprint = self.grid.columnsFingerprint
+        self.grid.refreshColumnNames()
+        self.assertTrue(self.grid.columnsFingerprint == fingerprint)
+        self.assertTrue([column['position'] for column in self.grid.getColumns()] == [1, 2, 3])
+
+        LOG.step('Showing hidden column is noticed')
+        header = self.driver.getWebDriver().document.xpath('//div[@data-mg-comp="hidden"]')[0]
+        del header.attrib['style']
+        self.grid.find()
+        self.assertTrue(self.grid.columnNames == ['selected', 'name', 'size', 'hidden'])
+        self.assertTrue(self.grid.columnsFingerprint != fingerprint)
+
+    def test_component_grid_offline_identity(self):
+        LOG.step('Looking up rows by record id')
+        self.grid.find()
+        self.assertTrue(self.grid.getRowById('ext-record-2')['name'] == 'LUN_2')
+        self.assertTrue(self.grid.getRowById('ext-record-9') is None)
+        self.assertTrue(self.grid.getCell('ext-record-4', 'size').element.text() == '4 GiB')
+
+        LOG.step('Row keeps pointing at the same record after rows are reordered')
+        row = self.grid._getRowComponent(self.grid._readRowById('ext-record-1'))
+        tbody = self.driver.getWebDriver().document.xpath('//tbody')[0]
+        tbody.append(tbody[0])
+        self.assertTrue(row.getChild(relativePath='/td[2]').element.text() == 'LUN_1')
+        self.assertTrue(self.grid.getRowById('ext-record-1')['name'] == 'LUN_1')
+        self.assertTrue(self.grid.rowIndex['ext-record-1'] == 5)
+        self.assertTrue([row['name'] for row in self.grid.find()][-1] == 'LUN_1')
+
+        LOG.step('Row looked up by record id shows its current state')
+        self.assertFalse(self.grid.getRowById('ext-record-2')['selected'])
+        self.grid.select(name='LUN_2')
+        self.assertTrue(self.grid.getRowById('ext-record-2')['selected'])
+
+        LOG.step('Record id held by nested node is read the same element by element')
+        row = self.driver.getWebDriver().document.xpath('//tr[@data-recordid="ext-record-4"]')[0]
+        row.xpath('td[2]/div')[0].set('data-recordid', row.attrib.pop('data-recordid'))
+        snapshot = self.grid._readRows()
+        self.assertTrue('ext-record-4' in [row['recordId'] for row in snapshot])
+        self.grid.useSnapshot = False
+        self.assertTrue(self.grid._readRows() == snapshot)
+
+    def test_component_grid_offline_children(self):
+        LOG.step('Enumerating children of component in single script call')
+        self.driver.stats.records.clear()
+        children = self.grid.getChildren(relativePath='div[2]/div/table/tbody/tr')
+        self.assertTrue(set([command for command, _ in self.driver.stats.records]) ==
+            set(['executeScript']))
+        self.assertTrue([child.selector for child in children] == [child.selector for child in
+            self.grid.getChildren(relativePath='div[2]/div/table/tbody/tr', bulk=False)])
+        self.assertTrue(children[1].getChild(relativePath='td[2]').element.text() == 'LUN_2')
+
+        LOG.step('Component without children has no children')
+        self.assertTrue(self.grid.getChildren(relativePath='div[2]/div/table/tbody/td') == [])
+
+    def test_component_grid_offline_states(self):
+        LOG.step('Reading states of components at once')
+        gridState, errorState = self.grid.getStates(driver=self.driver, components=[self.grid,
+            self.lblError], cssProperties=['display'])
+        self.assertTrue(gridState['present'] and gridState['visible'])
+        self.assertTrue(errorState['present'] and not errorState['visible'])
+        self.assertTrue(errorState['text'] == '' and errorState['css']['display'] == 'none')
+        self.assertTrue(self.grid.getPageDetails()['pages'] == 1)
+
+        LOG.step('Memo of states is dropped by click')
+        self.assertTrue(self.lblError.getState(memo=True) is self.lblError.getState(memo=True))
+        self.grid.select(name='LUN_1')
+        self.assertFalse(self.driver.stateMemo)
+
+    def test_component_grid_offline_fill(self):
+        LOG.step('Filling text box of page')
+        page = OfflinePage(driver=self.driver)
+        self.assertTrue(page.txtFilter.getState(memo=True)['value'] == 'LUN')
+        page.fill({'txtFilter': 'LUN_2'})
+        self.assertTrue(page.txtFilter.getState(memo=True)['value'] == 'LUN_2')
+
+        LOG.step('Filling grid is refused')
+        isRefused = False
+        try:
+            page.fill({'grid': 'LUN_2'})
+        except PageException:
+            isRefused = True
+        self.assertTrue(isRefused)
+
+    def test_component_grid_offline_presence(self):
+        LOG.step('Presence and visibility are answered by single script, without waiting')
+        lblMissing = Label(driver=self.driver, selector='//div[@id="missing"]',
+            name='Offline.lblMissing')
+        self.driver.stats.records.clear()
+        self.assertTrue(self.lblError.isPresent() and not self.lblError.isVisible())
+        self.assertFalse(lblMissing.isPresent() or lblMissing.isVisible())
+        self.assertTrue(set([command for command, _ in self.driver.stats.records]) ==
+            set(['executeScript']))
+
+        LOG.step('Waiting for element which never appears fails without failing session')
+        self.assertFalse(lblMissing.isPresent(wait=True))
+        self.assertFalse(self.driver.failed)
+
+    def test_component_grid_offline_conditions(self):
+        LOG.step('Evaluating composed conditions')
+        self.assertTrue(condition.check(driver=self.driver, condition=self.grid.visible() &
+            self.lblError.present()))
+        self.assertFalse(condition.check(driver=self.driver, condition=self.lblError.visible()))
+        self.assertTrue(condition.waitUntilAny(driver=self.driver, conditions=[
+            self.lblError.visible(), self.grid.visible()]) is not None)
+        self.assertFalse(self.lblError.isVisible())
+
+        LOG.step('Waiting for component state built from condition factories')
+        self.lblError.waitUntilText(text='invalid')
+        self.lblError.waitUntilHidden()
+        self.assertTrue(condition.check(driver=self.driver, condition=condition.lacksClass(
+            self.grid, 'x-item-disabled') & condition.enabled(self.grid)))
+
+        LOG.step('Condition of unknown predicate fails instead of not holding')
+        isFailed = False
+        try:
+            condition.check(driver=self.driver, condition=condition.ElementCondition(
+                selector=self.grid.selector, predicate='unknown', description='unknown'))
+        except WebDriverException:
+            isFailed = True
+        self.assertTrue(isFailed)
+        isAbstract = False
+        try:
+            condition.Condition(description='abstract')
+        except TypeError:
+            isAbstract = True
+        self.assertTrue(isAbstract)
+
+        LOG.step('Evaluating route of application')
+        self.driver.getWebDriver().current_url = 'http://localhost/#dashboard'
+        self.assertTrue(condition.check(driver=self.driver, condition=condition.routed(
+            '#dashboard') & self.grid.visible()))
+        self.assertFalse(condition.check(driver=self.driver, condition=condition.routed(
+            '#manager')))
+
+        LOG.step('Waiting for condition which never holds fails immediately')
+        isTimedOut = False
+        try:
+            self.lblError.waitUntilVisible()
+        except ComponentFailedStateException:
+            isTimedOut = True
+        self.assertTrue(isTimedOut)
+
+    def test_component_grid_offline_scripts(self):
+        LOG.step('Scripts are told apart by id, untagged ones are refused')
+        webDriver = self.driver.getWebDriver()
+        isRefused = False
+        try:
+            webDriver.execute_script('return 1;')
+        except WebDriverException:
+            isRefused = True
+        self.assertTrue(isRefused)
+        self.assertTrue(webDriver.execute_script(scripts.tag(scripts.isHealthyId, 'return 1;')) == 1)
+
+        LOG.step('Stubbed script answers by its id')
+        webDriver.onScript(scriptId=scripts.isAppLoadedId, handler=lambda url: True)
+        self.assertTrue(webDriver.execute_script(scripts.tag(scripts.isAppLoadedId,
+            'return false;'), 'http://localhost'))
+
+    def testTeardown(self):
+        self.driver.quit()
+
+
+if __name__ == '__main__':
+    ARGS.parseArgs(purpose)
+    testComponentGridOffline = TestComponentGridOffline()
+    sys.exit(testComponentGridOffline.numberOfFailedTests())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+purpose = """Offline unit test of Mangal UI API Driver over fake WebDriver"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/../../.."))
+sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/.."))
+
+from fake_driver import FakeDriver, FakeWebDriver
+from mangal import scripts
+from mangal.driver import SessionPool
+from mangal.component.label import Label
+from mangal.exceptions import ComponentFailedStateException
+from frlog import LOG
+from frargs import ARGS
+from frtestcase import FRTestCase
+from frexceptions import *
+
+
+PAGE = """
+<html><body>
+    <div id="error" style="display: none">Name is invalid</div>
+</body></html>
+"""
+
+
+class TestDriverOffline(FRTestCase):
+    def testSetup(self):
+        self.driver = FakeDriver(source=PAGE)
+        self.lblError = Label(driver=self.driver, selector='//div[@id="error"]',
+            name='Offline.lblError')
+
+    def getCount(self, command):
+        return sum([count for (recordCommand, _), (count, _) in self.driver.stats.records.items()
+            if recordCommand == command])
+
+    def test_driver_offline_deadline(self):
+        LOG.step('Time out of wait is cut to time remaining until deadline')
+        self.driver.timeout = 10
+        with self.driver.deadline(budget=2):
+            self.assertTrue(self.driver.timeout <= 2)
+            LOG.step('Nested deadline never extends beyond enclosing one')
+            with self.driver.deadline(budget=30):
+                self.assertTrue(self.driver.timeout <= 2)
+            with self.driver.deadline(budget=0):
+                self.assertTrue(self.driver.timeout == 0)
+        self.assertTrue(self.driver.timeout == 10)
+
+        LOG.step('Wait fails without waiting once budget is used up')
+        startTime = time.time()
+        isTimedOut = False
+        with self.driver.deadline(budget=0):
+            try:
+                self.lblError.waitUntilVisible()
+            except ComponentFailedStateException:
+                isTimedOut = True
+        self.assertTrue(isTimedOut)
+        self.assertTrue(time.time() - startTime < 5)
+
+    def test_driver_offline_pool(self):
+        pool = SessionPool(maxUses=2)
+        created = []
+
+        def create(**kwargs):
+            webDriver = FakeWebDriver(source=PAGE)
+            created.append(webDriver)
+            return webDriver
+        pool._create = create
+        key = {'driverHostname': 'localhost', 'driverPort': 4444, 'capabilities':
+            {'browserName': 'fake'}}
+
+        LOG.step('Released session is reset and leased again')
+        first = pool.lease(maximizeWindow=False, **key)
+        first.current_url = 'http://localhost/#dashboard'
+        pool.release(webDriver=first, **key)
+        self.assertTrue(first.current_url == 'about:blank')
+        self.assertTrue(pool.lease(maximizeWindow=False, **key) is first)
+
+        LOG.step('Used up session is not returned to pool')
+        pool.release(webDriver=first, **key)
+        second = pool.lease(maximizeWindow=False, **key)
+        self.assertTrue(second is not first and len(created) == 2)
+
+        LOG.step('Failed session is not returned to pool')
+        pool.release(webDriver=second, failed=True, **key)
+        third = pool.lease(maximizeWindow=False, **key)
+        self.assertTrue(third is not second and len(created) == 3)
+
+        LOG.step('Unhealthy idle session is discarded on lease')
+        pool.release(webDriver=third, **key)
+        third.onScript(scriptId=scripts.isHealthyId, handler=lambda *args: 0)
+        fourth = pool.lease(maximizeWindow=False, **key)
+        self.assertTrue(fourth is not third and len(created) == 4)
+
+        LOG.step('Sessions of other key are not shared')
+        pool.release(webDriver=fourth, **key)
+        otherKey = dict(key, driverPort=5555)
+        self.assertTrue(pool.lease(maximizeWindow=False, **otherKey) is not fourth)
+        pool.quitAll()
+
+    def test_driver_offline_screenshots(self):
+        LOG.step('Failure screenshots are taken in background, once per page state')
+        self.driver.queueScreenshot(name='test_driver_offline_screenshots.1')
+        self.driver.queueScreenshot(name='test_driver_offline_screenshots.2')
+        self.driver.screenshotWriter.flush()
+        self.assertTrue(self.getCount('screenshot') == 1)
+        self.assertTrue(self.driver.failed)
+
+        LOG.step('Changed page is taken again')
+        error = self.driver.getWebDriver().document.xpath('//div[@id="error"]')[0]
+        del error.attrib['style']
+        self.driver.queueScreenshot(name='test_driver_offline_screenshots.3')
+        self.driver.screenshotWriter.flush()
+        self.assertTrue(self.getCount('screenshot') == 2)
+
+        LOG.step('Requests above limit issue no command')
+        self.driver.screenshotLimit = 3
+        self.driver.stats.records.clear()
+        self.driver.queueScreenshot(name='test_driver_offline_screenshots.4')
+        self.driver.screenshotWriter.flush()
+        self.assertFalse(self.driver.stats.records)
+
+    def testTeardown(self):
+        self.driver.quit()
+
+
+if __name__ == '__main__':
+    ARGS.parseArgs(purpose)
+    testDriverOffline = TestDriverOffline()
+    sys.exit(testDriverOffline.numberOfFailedTests())
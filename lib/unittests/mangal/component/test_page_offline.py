@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+
+purpose = """Offline unit test of Mangal UI API pages over fake WebDriver"""
+
+import os
+import sys
+sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/../../.."))
+sys.path.append(os.path.realpath(os.path.dirname(os.path.realpath(__file__)) + "/.."))
+
+from fake_driver import FakeDriver
+from mangal import scripts
+from mangal.page import base_page
+from mangal.page.base_page import BasePage, LazyComponents
+from mangal.page.all_storage_page import AllStoragePage
+from mangal.page.header_page import HeaderPage
+from mangal.page.luns_page import LUNsPage
+from mangal.page.navigator import Navigator
+from mangal.page.page_recognizer import PageRecognizer
+from mangal.component import condition
+from mangal.exceptions import PageNotFoundException
+from frlog import LOG
+from frargs import ARGS
+from frtestcase import FRTestCase
+from frexceptions import *
+
+
+PAGE = """
+<html><body>
+    <div id="dashboard">Dashboard</div>
+    <input id="filter" type="text" value="LUN"/>
+    <input name="size" type="text" value="1"/>
+</body></html>
+"""
+
+
+class DashboardPage(BasePage):
+    # Number of calls of setupSelectors(), see test of selector tables
+    setupCount = 0
+
+    def __init__(self, **kwargs):
+        super(DashboardPage, self).__init__(url='localhost', path='#dashboard', **kwargs)
+
+    def setupSelectors(self):
+        DashboardPage.setupCount += 1
+        self._selectors['lblDashboard'] = '//div[@id="dashboard"]'
+        self._selectors['txtFilter'] = '//input[@id="filter"]'
+        self._selectors['txtByName'] = '//input[@name="{name}"]'
+
+    def setupComponents(self):
+        # Component classes are taken from namespace of base_page, as pages do with
+        #   'from base_page import *'
+        self.addComponent('token', base_page.label.Label, selector=self.selectors.lblDashboard)
+        self.addComponent('txtFilter', base_page.textbox.TextBox)
+
+
+class ManagerPage(BasePage):
+    def __init__(self, **kwargs):
+        super(ManagerPage, self).__init__(url='localhost', path='#manager', **kwargs)
+
+    def setupSelectors(self):
+        self._selectors['lblManager'] = '//div[@id="manager"]'
+
+    def setupComponents(self):
+        self.addComponent('token', base_page.label.Label, selector=self.selectors.lblManager)
+
+
+class TestPageOffline(FRTestCase):
+    def testSetup(self):
+        self.driver = FakeDriver(source=PAGE)
+        self.webDriver = self.driver.getWebDriver()
+
+    def getCommands(self):
+        return set([command for command, _ in self.driver.stats.records])
+
+    def getCount(self, commands):
+        return sum([count for (command, _), (count, _) in self.driver.stats.records.items() if
+            command in commands])
+
+    def test_page_offline_selectors(self):
+        LOG.step('Selector table is built once per page class')
+        page = DashboardPage(driver=self.driver)
+        self.assertTrue(DashboardPage(driver=self.driver).selectors is page.selectors)
+        self.assertTrue(DashboardPage.setupCount == 1)
+        self.assertTrue(ManagerPage(driver=self.driver).selectors is not page.selectors)
+
+        LOG.step('Selector table is read-only once built')
+        isRefused = False
+        try:
+            page._selectors['txtFilter'] = '//input'
+        except TypeError:
+            isRefused = True
+        self.assertTrue(isRefused)
+        self.assertTrue(page.selectors.txtFilter == '//input[@id="filter"]')
+
+        LOG.step('Parameterized selectors are built once per arguments')
+        self.assertTrue(page.selectors.txtByName(name='size') == '//input[@name="size"]')
+        self.assertTrue(page.selectors.txtByName(name='size') is
+            page.selectors.txtByName(name='size'))
+        isRefused = False
+        try:
+            page.selectors.txtByName(index=2)
+        except KeyError:
+            isRefused = True
+        self.assertTrue(isRefused)
+
+    def test_page_offline_components(self):
+        LOG.step('Components are constructed on first access only')
+        page = DashboardPage(driver=self.driver)
+        self.assertTrue(isinstance(dict.__getitem__(page.components, 'txtFilter'),
+            LazyComponents.Factory))
+        self.assertTrue(page.txtFilter is page.txtFilter)
+        self.assertTrue(page.txtFilter.name == 'DashboardPage.txtFilter')
+        self.assertFalse(isinstance(dict.__getitem__(page.components, 'txtFilter'),
+            LazyComponents.Factory))
+        self.assertTrue(len(page.components.values()) == 2)
+
+        LOG.step('Pages are cached per driver and arguments')
+        self.assertTrue(DashboardPage.get(driver=self.driver) is DashboardPage.get(
+            driver=self.driver))
+        page = DashboardPage.get(driver=self.driver, parentName='Wizard')
+        self.assertTrue(page is not DashboardPage.get(driver=self.driver))
+        self.assertTrue(page.name == 'Wizard.DashboardPage')
+
+    def test_page_offline_route(self):
+        page = DashboardPage(driver=self.driver)
+        LOG.step('Application not loaded: page is opened by URL')
+        self.assertFalse(page.isAppLoaded())
+        self.driver.stats.records.clear()
+        page.open()
+        self.assertTrue('get' in self.getCommands())
+        self.assertTrue(self.webDriver.current_url == 'http://localhost')
+
+        LOG.step('Application loaded: page is opened by route')
+        self.webDriver.onScript(scriptId=scripts.isAppLoadedId, handler=lambda url: True)
+        self.webDriver.onScript(scriptId=scripts.routeId, handler=lambda path:
+            setattr(self.webDriver, 'current_url', 'http://localhost/' + path))
+        self.assertTrue(page.isAppLoaded())
+        self.driver.stats.records.clear()
+        page.open()
+        self.assertFalse('get' in self.getCommands())
+        self.assertTrue(condition.check(driver=self.driver, condition=condition.routed(
+            '#dashboard') & page.opened()))
+
+        LOG.step('Page which is not routable is opened by URL')
+        page.isRoutable = False
+        self.driver.stats.records.clear()
+        page.open()
+        self.assertTrue('get' in self.getCommands())
+
+    def test_page_offline_recognizer(self):
+        dashboardPage = DashboardPage(driver=self.driver)
+        managerPage = ManagerPage(driver=self.driver)
+        recognizer = PageRecognizer(driver=self.driver, pages=[dashboardPage, managerPage])
+        LOG.step('Open pages are recognized by single script call')
+        self.driver.stats.records.clear()
+        self.assertTrue(recognizer.getOpenPages() == [dashboardPage])
+        self.assertTrue(self.getCount(['executeScript', 'executeAsyncScript']) == 1)
+        self.assertTrue(recognizer.isOpen(DashboardPage) and not recognizer.isOpen(managerPage))
+        self.assertTrue(recognizer.waitUntilAnyOpen() is dashboardPage)
+
+        LOG.step('Waiting for page which is not open fails')
+        isTimedOut = False
+        try:
+            recognizer.waitUntilAnyOpen(pages=[managerPage])
+        except PageNotFoundException:
+            isTimedOut = True
+        self.assertTrue(isTimedOut)
+
+    def test_page_offline_navigator(self):
+        navigator = Navigator(driver=self.driver)
+        # Latencies are shared by navigators of process, keep measured ones out of test
+        navigator.latencies = {}
+        LOG.step('Path to page skips pages open already')
+        self.assertTrue(navigator.getPath(sources=[HeaderPage], target=LUNsPage) ==
+            [(HeaderPage, AllStoragePage), (AllStoragePage, LUNsPage)])
+        self.assertTrue(navigator.getPath(sources=[HeaderPage, AllStoragePage],
+            target=LUNsPage) == [(AllStoragePage, LUNsPage)])
+        self.assertTrue(navigator.getPath(sources=[LUNsPage], target=LUNsPage) == [])
+        self.assertTrue(navigator.getPath(sources=[LUNsPage], target=HeaderPage) is None)
+
+        LOG.step('Path follows cheapest transitions')
+        navigator.addTransition(source=HeaderPage, target=LUNsPage, action=lambda pages: None)
+        navigator.latencies[(HeaderPage, LUNsPage)] = 5.0
+        self.assertTrue(navigator.getPath(sources=[HeaderPage], target=LUNsPage) ==
+            [(HeaderPage, AllStoragePage), (AllStoragePage, LUNsPage)])
+        navigator.latencies[(HeaderPage, AllStoragePage)] = 10.0
+        self.assertTrue(navigator.getPath(sources=[HeaderPage], target=LUNsPage) ==
+            [(HeaderPage, LUNsPage)])
+
+    def testTeardown(self):
+        self.driver.quit()
+
+
+if __name__ == '__main__':
+    ARGS.parseArgs(purpose)
+    testPageOffline = TestPageOffline()
+    sys.exit(testPageOffline.numberOfFailedTests())
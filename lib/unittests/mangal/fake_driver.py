@@ -0,0 +1,512 @@
+"""
+    In-process fake of Selenium Remote WebDriver over static HTML, for offline tests of components
+      and pages (no Selenium hub, browser or Mars cluster needed). Offline tests put directory of
+      this module on sys.path, as it's not part of Mangal itself.
+"""
+
+import json
+import re
+import zlib
+
+from lxml import html
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, \
+    WebDriverException
+
+from mangal import scripts
+from mangal.driver import CommandStats, Driver
+
+
+def getClasses(node):
+    return (node.get('class') or '').split()
+
+
+def hasClass(node, className):
+    return className in getClasses(node)
+
+
+def toggleClass(node, className):
+    """
+        Add class to element or remove it if present (ex. to model click on Sencha check box).
+    """
+    classes = getClasses(node)
+    if className in classes:
+        classes.remove(className)
+    else:
+        classes.append(className)
+    node.set('class', ' '.join(classes))
+
+
+def getStyle(node):
+    """
+        @return: Inline style of element as dictionary (ex. {'display': 'none'}).
+    """
+    style = {}
+    for declaration in (node.get('style') or '').split(';'):
+        if ':' in declaration:
+            name, value = declaration.split(':', 1)
+            style[name.strip().lower()] = value.strip()
+    return style
+
+
+def isVisible(node):
+    """
+        Element is visible unless it or any of its ancestors is hidden by inline style, attribute
+          'hidden' or Sencha hiding classes.
+    """
+    element = node
+    while element is not None:
+        style = getStyle(element)
+        if style.get('display') == 'none' or style.get('visibility') in ['hidden', 'collapse'] or \
+        element.get('hidden') is not None or set(getClasses(element)) & set(['x-hide-display',
+        'x-hidden', 'x-hide-offsets']):
+            return False
+        element = element.getparent()
+    return True
+
+
+def getText(node):
+    return re.sub(r'\s+', ' ', node.text_content()).strip()
+
+
+def getContent(node):
+    return node.value if node.tag in ['input', 'textarea'] else getText(node)
+
+
+class FakeWebElement(object):
+    """
+        Fake of WebDriver.WebElement wrapping lxml element.
+    """
+    def __init__(self, parent, node, id_):
+        self._parent = parent
+        self.node = node
+        self._id = id_
+
+    def __eq__(self, other):
+        return isinstance(other, FakeWebElement) and self.node is other.node
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def _execute(self, command, params=None):
+        params = dict(params or {})
+        params['id'] = self._id
+        return self._parent.execute(command, params)['value']
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @property
+    def tag_name(self):
+        return self._execute('getElementTagName')
+
+    @property
+    def text(self):
+        return self._execute('getElementText')
+
+    def get_attribute(self, name):
+        return self._execute('getElementAttribute', {'name': name})
+
+    def is_displayed(self):
+        return self._execute('isElementDisplayed')
+
+    def value_of_css_property(self, property_name):
+        return self._execute('getElementValueOfCssProperty', {'propertyName': property_name})
+
+    def click(self):
+        self._execute('clickElement')
+
+    def send_keys(self, *value):
+        self._execute('sendKeysToElement', {'value': value})
+
+    def clear(self):
+        self._execute('clearElement')
+
+    def find_element_by_xpath(self, xpath):
+        return self._execute('findChildElement', {'using': 'xpath', 'value': xpath})
+
+    def find_elements_by_xpath(self, xpath):
+        return self._execute('findChildElements', {'using': 'xpath', 'value': xpath})
+
+
+class FakeWebDriver(object):
+    """
+        Fake of WebDriver.Remote over static HTML parsed with lxml. Implements WebDriver subset
+          used by Mangal. Application behaviour is modelled by handlers of clicks (see onClick())
+          and scripts (see onScript()). Scripts are told apart by their ids (see scripts.tag()).
+          Scripts executed by Mangal itself on elements (presence/visibility probes, condition
+          waits, bulk enumeration of children, grid snapshot) are handled in Python out of the
+          box; scripts using Ext (ex. store scripts, routing) are to be stubbed.
+    """
+    def __init__(self, source='<html><body></body></html>', pages=None):
+        """
+            @param source: HTML of page open initially.
+            @param pages: HTML of pages opened by get(), as dictionary {url: html}.
+        """
+        self.pages = pages or {}
+        self.session_id = 'fake'
+        self.current_url = 'about:blank'
+        self._history = []
+        self._clickHandlers = []
+        # Handlers of scripts by id (see scripts.tag()), stubs set by onScript() included
+        self._scriptHandlers = {
+            scripts.readyStateId: lambda *args: 'complete',
+            scripts.isHealthyId: lambda *args: 1,
+            scripts.clearStorageId: lambda *args: None,
+            scripts.getPageStateKeyId: lambda *args: '%s|%s' % (self.current_url,
+                zlib.crc32(html.tostring(self.document)) & 0xffffffff),
+            scripts.probeId: self._probe,
+            scripts.getStatesId: self._getStates,
+            scripts.getChildrenId: self._getChildren,
+            scripts.getGridSnapshotId: self._getSnapshot,
+            scripts.getGridColumnsId: self._getColumns,
+            scripts.fillId: self._fill,
+            scripts.waitConditionsId: self._evaluateConditions
+        }
+        self._commands = {
+            'findElement': lambda params: self._find(self.document, params, single=True),
+            'findElements': lambda params: self._find(self.document, params, single=False),
+            'findChildElement': lambda params: self._find(self._getNode(params), params,
+                single=True),
+            'findChildElements': lambda params: self._find(self._getNode(params), params,
+                single=False),
+            'getElementTagName': lambda params: self._getNode(params).tag,
+            'getElementText': lambda params: getText(self._getNode(params)) if
+                isVisible(self._getNode(params)) else '',
+            'getElementAttribute': self._getAttribute,
+            'isElementDisplayed': lambda params: isVisible(self._getNode(params)),
+            'getElementValueOfCssProperty': self._getCSSProperty,
+            'clickElement': self._click,
+            'sendKeysToElement': self._sendKeys,
+            'clearElement': self._clear,
+            'executeScript': self._executeScript,
+            'executeAsyncScript': self._executeScript,
+            'get': self._get,
+            'refresh': lambda params: self._load(self.current_url),
+            'goBack': lambda params: None,
+            'goForward': lambda params: None,
+            'setScriptTimeout': lambda params: None,
+            'deleteAllCookies': lambda params: None,
+            'maximizeWindow': lambda params: None,
+            'screenshot': lambda params: html.tostring(self.document),
+            'close': lambda params: None,
+            'quit': lambda params: None
+        }
+        self._elements = {}
+        self._nodeIds = {}
+        self._setDocument(source)
+
+    def _setDocument(self, source):
+        self.document = html.document_fromstring(source)
+
+    def _load(self, url):
+        if url in self.pages:
+            self._setDocument(self.pages[url])
+        self.current_url = url
+
+    def onClick(self, xpath, handler):
+        """
+            Model application response to click on element.
+            @param xpath: XPath of elements handler applies to.
+            @param handler: Function of clicked lxml element (ex. lambda node: toggleClass(node,
+              'x-form-cb-checked')).
+        """
+        self._clickHandlers.append((xpath, handler))
+
+    def onScript(self, scriptId, handler):
+        """
+            Stub result of script executed by execute_script() or execute_async_script().
+            @param scriptId: Id of script (ex. scripts.isAppLoadedId).
+            @param handler: Function of script arguments returning result of script.
+        """
+        self._scriptHandlers[scriptId] = handler
+
+    def execute(self, driver_command, params=None):
+        """
+            Single entry point of all commands, as in WebDriver.Remote (so Driver's command
+              statistics work with fake too).
+        """
+        if driver_command not in self._commands:
+            raise WebDriverException('FakeWebDriver: Unsupported command: %s' % driver_command)
+        return {'value': self._commands[driver_command](params or {})}
+
+    def _wrap(self, node):
+        if node not in self._nodeIds:
+            self._nodeIds[node] = str(len(self._nodeIds) + 1)
+            self._elements[self._nodeIds[node]] = FakeWebElement(parent=self, node=node,
+                id_=self._nodeIds[node])
+        return self._elements[self._nodeIds[node]]
+
+    def _unwrap(self, value):
+        # Arguments of scripts may be WebElements
+        return value.node if isinstance(value, FakeWebElement) else value
+
+    def _getNode(self, params):
+        node = self._elements[params['id']].node
+        # Element removed from page or left on previous page
+        if node.getroottree().getroot() is not self.document:
+            raise StaleElementReferenceException('FakeWebDriver: Element is stale.')
+        return node
+
+    def _xpath(self, xpath, context=None):
+        try:
+            result = (self.document if context is None else context).xpath(xpath)
+        except Exception, e:
+            raise WebDriverException('FakeWebDriver: Invalid XPath: %s (%s)' % (xpath, e))
+        return [node for node in result if isinstance(node, html.HtmlElement)]
+
+    def _findNode(self, xpath):
+        nodes = self._xpath(xpath)
+        return nodes[0] if nodes else None
+
+    def _find(self, context, params, single):
+        nodes = self._xpath(params['value'], context=context)
+        if single:
+            if not nodes:
+                raise NoSuchElementException('FakeWebDriver: Element not found: %s' %
+                    params['value'])
+            return self._wrap(nodes[0])
+        return [self._wrap(node) for node in nodes]
+
+    def _getAttribute(self, params):
+        node = self._getNode(params)
+        if params['name'] == 'value' and node.tag in ['input', 'textarea']:
+            return node.value
+        return node.get(params['name'])
+
+    def _getCSSProperty(self, params):
+        node = self._getNode(params)
+        if params['propertyName'] == 'display' and not isVisible(node):
+            return 'none'
+        return getStyle(node).get(params['propertyName'], 'block' if params['propertyName'] ==
+            'display' else '')
+
+    def _click(self, params):
+        node = self._getNode(params)
+        for xpath, handler in self._clickHandlers:
+            if node in self._xpath(xpath):
+                handler(node)
+
+    def _sendKeys(self, params):
+        node = self._getNode(params)
+        # Special keys (ex. Keys.ENTER) are in Unicode private use area and have no text
+        text = ''.join([character for character in ''.join(params['value']) if not
+            (u'\ue000' <= character <= u'\uf8ff')])
+        node.value = (node.value or '') + text
+
+    def _clear(self, params):
+        self._getNode(params).value = ''
+
+    def _get(self, params):
+        self._history.append(self.current_url)
+        self._load(params['url'])
+
+    def _executeScript(self, params):
+        args = [self._unwrap(arg) for arg in params.get('args', [])]
+        scriptId = scripts.getId(params['script'])
+        if scriptId not in self._scriptHandlers:
+            raise WebDriverException('FakeWebDriver: Script not supported (id %s):\n%s' %
+                (scriptId, params['script']))
+        result = self._scriptHandlers[scriptId](*args)
+        if isinstance(result, html.HtmlElement):
+            result = self._wrap(result)
+        elif isinstance(result, list):
+            result = [self._wrap(item) if isinstance(item, html.HtmlElement) else item for item in
+                result]
+        return result
+
+    def _probe(self, selectors):
+        result = []
+        for selector in selectors:
+            node = self._findNode(selector)
+            result.append({'present': node is not None, 'visible': node is not None and
+                isVisible(node)})
+        return result
+
+    def _getStates(self, selectors, cssProperties):
+        result = []
+        for selector in selectors:
+            node = self._findNode(selector)
+            state = {'present': node is not None, 'visible': False, 'class': None, 'value': None,
+                'text': None, 'css': {}}
+            if node is not None:
+                state.update({'visible': isVisible(node), 'class': node.get('class') or '',
+                    'value': node.value if node.tag in ['input', 'textarea'] else
+                    node.get('value'), 'text': getText(node) if isVisible(node) else '', 'css':
+                    dict([(name, getStyle(node).get(name, '')) for name in cssProperties])})
+            result.append(state)
+        return result
+
+    def _fill(self, entries):
+        # No Ext fields here, so only text is entered by script (see BasePage.fill())
+        for index, entry in enumerate(entries):
+            node = self._findNode(entry['selector'])
+            if entry['kind'] != 'text' or node is None or node.tag not in ['input', 'textarea']:
+                return index
+            node.value = entry['value']
+        return len(entries)
+
+    def _getChildren(self, path):
+        children = []
+        while True:
+            child = self._findNode(path + '[%d]' % (len(children) + 1))
+            if child is None:
+                break
+            children.append(child)
+        return children
+
+    def _getSnapshot(self, rowPath, dataCellPath, wrapCellPath):
+        result = []
+        for rowIndex, row in enumerate(self._xpath(rowPath)):
+            rowClass = row.get('class') or ''
+            cellPath = dataCellPath if 'x-grid-data-row' in rowClass else wrapCellPath if \
+                'x-grid-wrap-row' in rowClass else None
+            cells = []
+            if cellPath is not None:
+                cells = [{'class': cell.get('class') or '', 'text': getText(cell)} for cell in
+                    self._xpath('.' + cellPath, context=row)]
+            recordNodes = self._xpath('descendant-or-self::*[@data-recordid]', context=row)
+            result.append({'index': rowIndex + 1, 'class': rowClass, 'cells': cells,
+                'recordId': recordNodes[0].get('data-recordid') if recordNodes else None})
+        return json.dumps(result)
+
+    def _getColumns(self, headerPath, knownFingerprint):
+        columns = []
+        parts = []
+        for index, header in enumerate(self._xpath(headerPath)):
+            column = {'position': index + 1, 'class': header.get('class') or '', 'name':
+                header.get('data-mg-comp'), 'visible': getStyle(header).get('display') != 'none',
+                'tag': header.tag, 'id': header.get('id') or '', 'text': getText(header)}
+            columns.append(column)
+            parts.append('|'.join([column['name'] or '', 'true' if column['visible'] else 'false',
+                column['class']]))
+        fingerprint = '%s:%s' % (len(columns), zlib.crc32(';'.join(parts)) & 0xffffffff)
+        if fingerprint == knownFingerprint:
+            return json.dumps({'fingerprint': fingerprint})
+        return json.dumps({'fingerprint': fingerprint, 'columns': columns})
+
+    def _evaluateConditions(self, conditions, selectors, timeout):
+        """
+            Evaluate conditions of condition.waitScript once: static page doesn't change while
+              waiting. Conditions are trees built by Condition.serialize(), their predicates are
+              implemented in Python (see predicates).
+        """
+        nodes = {}
+
+        def test(condition):
+            if 'allOf' in condition:
+                return all([test(part) for part in condition['allOf']])
+            if 'anyOf' in condition:
+                return any([test(part) for part in condition['anyOf']])
+            if 'not' in condition:
+                return not test(condition['not'])
+            if condition['predicate'] not in self.predicates:
+                raise WebDriverException('FakeWebDriver: Unsupported predicate: %s' %
+                    condition['predicate'])
+            node = None
+            if condition['element'] is not None:
+                if condition['element'] not in nodes:
+                    nodes[condition['element']] = self._findNode(selectors[condition['element']])
+                node = nodes[condition['element']]
+            return bool(self.predicates[condition['predicate']](self, node, condition['params']))
+        return [test(condition) for condition in conditions]
+
+    def _getHash(self):
+        return '#' + self.current_url.split('#', 1)[1] if '#' in self.current_url else ''
+
+    @staticmethod
+    def _hasText(node, params):
+        if node is None:
+            return False
+        content = getContent(node) or ''
+        return content == params['text'] or (not params['exact'] and params['text'] in content)
+
+    # Predicates of condition.predicatesScript, as functions of fake, element (None if absent or
+    #   not bound) and parameters
+    predicates = {
+        'present': lambda fake, node, params: node is not None,
+        'visible': lambda fake, node, params: node is not None and isVisible(node),
+        'hasClass': lambda fake, node, params: node is not None and hasClass(node,
+            params['className']) == params['state'],
+        'text': lambda fake, node, params: FakeWebDriver._hasText(node, params),
+        'routed': lambda fake, node, params: fake._getHash() == params['path']
+    }
+
+    # Selenium WebDriver API used by Mangal
+
+    def find_element_by_xpath(self, xpath):
+        return self.execute('findElement', {'using': 'xpath', 'value': xpath})['value']
+
+    def find_elements_by_xpath(self, xpath):
+        return self.execute('findElements', {'using': 'xpath', 'value': xpath})['value']
+
+    def execute_script(self, script, *args):
+        return self.execute('executeScript', {'script': script, 'args': list(args)})['value']
+
+    def execute_async_script(self, script, *args):
+        return self.execute('executeAsyncScript', {'script': script, 'args': list(args)})['value']
+
+    def set_script_timeout(self, time_to_wait):
+        self.execute('setScriptTimeout', {'ms': float(time_to_wait) * 1000})
+
+    def get(self, url):
+        self.execute('get', {'url': url})
+
+    def refresh(self):
+        self.execute('refresh')
+
+    def back(self):
+        self.execute('goBack')
+
+    def forward(self):
+        self.execute('goForward')
+
+    def delete_all_cookies(self):
+        self.execute('deleteAllCookies')
+
+    def maximize_window(self):
+        self.execute('maximizeWindow')
+
+    def get_screenshot_as_png(self):
+        # Serialized page stands for image, so identical pages give identical 'screenshots'
+        return self.execute('screenshot')['value']
+
+    def save_screenshot(self, filename):
+        with open(filename, 'wb') as screenshotFile:
+            screenshotFile.write(self.get_screenshot_as_png())
+        return True
+
+    def close(self):
+        self.execute('close')
+
+    def quit(self):
+        self.execute('quit')
+
+
+class FakeDriver(Driver):
+    """
+        Mangal.Driver backed by FakeWebDriver. Time outs and retry delays are zero, as static page
+          doesn't change while waiting.
+    """
+    def __init__(self, source='<html><body></body></html>', pages=None):
+        """
+            @param source: HTML of page open initially.
+            @param pages: HTML of pages opened by URL, as dictionary {url: html}.
+        """
+        self.source = source
+        self.pages = pages
+        super(FakeDriver, self).__init__(driverHostname='localhost', driverPort=0, browser='fake',
+            maximizeWindow=False, usePool=False)
+        self.timeout = 0
+        self.delay = 0
+
+    def _start(self):
+        self.capabilities = {}
+        self.webDriver = FakeWebDriver(source=self.source, pages=self.pages)
+        self._scriptTimeout = None
+        self.stats = CommandStats()
+        self._instrument()
@@ -544,7 +544,8 @@ class TestCreateLUNsWizard(FRTestCase):
         LOG.step('Verifying consistency group error message when text box in dirty state')
         wizard.activePage.txtNewConsistencyGroup.setFocus()
         wizard.activePage.cBoxParentConsistencyGroup.element.click()
-        self.assertTrue(wizard.activePage.lblConsistencyGroupError.isPresent() and
+        wizard.activePage.lblConsistencyGroupError.waitUntilVisible()
+        self.assertTrue(wizard.activePage.lblConsistencyGroupError.isPresent(wait=True) and
         wizard.activePage.lblConsistencyGroupError.isVisible() and
         wizard.activePage.lblConsistencyGroupError.getText() == consistencyGroupError)
         LOG.info('Consistency group error message is present:', wizard.activePage.lblConsistencyGroupError.isPresent())
@@ -574,7 +575,7 @@ class TestCreateLUNsWizard(FRTestCase):
         LOG.info('Confirmation page is open:', wizard.confirmPage.isOpen())
 
         LOG.step('Verifying new consistency group is presented on confirmation page')
-        self.assertTrue(wizard.activePage.lblNewConsistencyGroup.isPresent())
+        self.assertTrue(wizard.activePage.lblNewConsistencyGroup.isPresent(wait=True))
         LOG.info('New consistency group is present:', wizard.activePage.lblNewConsistencyGroup.isPresent())
         self.assertTrue(wizard.activePage.lblNewConsistencyGroup.isVisible())
         LOG.info('New consistency group is visible:', wizard.activePage.lblNewConsistencyGroup.isVisible())
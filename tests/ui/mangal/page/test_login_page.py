@@ -83,53 +83,53 @@ class TestLoginPage(FRTestCase):
         self.assertTrue(self.loginPage.linkHelp.isVisible())
         LOG.info('Help link available.')
 
-        self.assertTrue(self.loginPage.linkSupport.isPresent())
+        self.assertTrue(self.loginPage.linkSupport.isPresent(wait=True))
         self.assertTrue(self.loginPage.linkSupport.isVisible())
         self.assertTrue(self.loginPage.linkSupport.getHref() == supportLinkHRef)
         LOG.info('Support link available.')
 
-        self.assertTrue(self.loginPage.linkNetApp.isPresent())
+        self.assertTrue(self.loginPage.linkNetApp.isPresent(wait=True))
         self.assertTrue(self.loginPage.linkNetApp.isVisible())
         LOG.info('Company page link available.')
 
         LOG.step('Validating company branding availability')
 
-        self.assertTrue(self.loginPage.imgCompanyLogo.isPresent())
+        self.assertTrue(self.loginPage.imgCompanyLogo.isPresent(wait=True))
         self.assertTrue(self.loginPage.imgCompanyLogo.isVisible())
         LOG.info('Company logo available.')
 
-        self.assertTrue(self.loginPage.lblProductName.isPresent())
+        self.assertTrue(self.loginPage.lblProductName.isPresent(wait=True))
         self.assertTrue(self.loginPage.lblProductName.isVisible())
         self.assertTrue(productName in self.loginPage.lblProductName.getText())
         LOG.info('Product name label available.')
 
-        self.assertTrue(self.loginPage.lblProductVersion.isPresent())
+        self.assertTrue(self.loginPage.lblProductVersion.isPresent(wait=True))
         self.assertTrue(self.loginPage.lblProductVersion.isVisible())
         LOG.info('Product version label available.')
 
         LOG.step('Validating input controls availability')
 
-        self.assertTrue(self.loginPage.lblUsername.isPresent())
+        self.assertTrue(self.loginPage.lblUsername.isPresent(wait=True))
         self.assertTrue(self.loginPage.lblUsername.isVisible())
         LOG.info('Username label available.')
 
-        self.assertTrue(self.loginPage.lblPassword.isPresent())
+        self.assertTrue(self.loginPage.lblPassword.isPresent(wait=True))
         self.assertTrue(self.loginPage.lblPassword.isVisible())
         LOG.info('Password label available.')
 
-        self.assertTrue(self.loginPage.txtUsername.isPresent())
+        self.assertTrue(self.loginPage.txtUsername.isPresent(wait=True))
         self.assertTrue(self.loginPage.txtUsername.isVisible())
         LOG.info('Username input box available.')
 
-        self.assertTrue(self.loginPage.txtPassword.isPresent())
+        self.assertTrue(self.loginPage.txtPassword.isPresent(wait=True))
         self.assertTrue(self.loginPage.txtPassword.isVisible())
         LOG.info('Password input box available.')
 
-        self.assertTrue(self.loginPage.btnSignIn.isPresent())
+        self.assertTrue(self.loginPage.btnSignIn.isPresent(wait=True))
         self.assertTrue(self.loginPage.btnSignIn.isVisible())
         LOG.info('Sign-in button available.')
 
-        self.assertTrue(self.loginPage.menuLocale.isPresent())
+        self.assertTrue(self.loginPage.menuLocale.isPresent(wait=True))
         self.assertTrue(self.loginPage.menuLocale.isVisible())
         self.assertTrue(self.loginPage.menuLocale.isEnabled())
         LOG.info('Locale selection menu available.')
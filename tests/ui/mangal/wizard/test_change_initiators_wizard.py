@@ -272,7 +272,7 @@ class TestChangeInitiatorsWizard(FRTestCase):
         LOG.step('Navigating to Initiator Groups page')
         HeaderPage(driver=self.driver).btnManager.click()
         AllStoragePage(driver=self.driver).tabInitiatorGroups.click()
-        self.assertTrue(self.initiatorGroupsPage.isOpen())
+        self.assertTrue(self.initiatorGroupsPage.isOpen(wait=True))
         LOG.info('Initiator Groups page is open:', self.initiatorGroupsPage.isOpen())
 
         self.initiatorGroupsPage.btnRefresh.click()
@@ -174,6 +174,7 @@ class TestCreateLUNSnapshotWizard(FRTestCase):
         wizard.activePage.setName(name=snapshotName)
         self.assertTrue(wizard.activePage.txtName.getText() == snapshotName)
         LOG.info('Snapshot name set:', wizard.activePage.txtName.getText())
+        wizard.activePage.lblNameError.waitUntilVisible()
         self.assertTrue(wizard.activePage.lblNameError.isVisible())
         LOG.info('Error message displayed:', wizard.activePage.lblNameError.getText())
         self.assertFalse(wizard.activePage.btnOK.isEnabled())
@@ -89,7 +89,7 @@ class TestCreateLUNsIGPageWizard(FRTestCase):
         wizard.activePage.defineSingleLUN(name=name, size=size)
 
         LOG.step('Verifying error message as name is invalid')
-        self.assertTrue(wizard.activePage.lblNameError.isPresent())
+        self.assertTrue(wizard.activePage.lblNameError.isPresent(wait=True))
         LOG.info('Error message is present:', wizard.activePage.lblNameError.isPresent())
         wizard.activePage.lblNameError.isVisible()
         LOG.info('Error message is visible:', wizard.activePage.lblNameError.isVisible())
@@ -749,7 +749,7 @@ class TestCreateLUNsIGPageWizard(FRTestCase):
         HeaderPage(driver=self.driver).btnManager.click()
         AllStoragePage(driver=self.driver).tabInitiatorGroups.click()
         initiatorGroupsPage = InitiatorGroupsPage(driver=self.driver)
-        self.assertTrue(initiatorGroupsPage.isOpen())
+        self.assertTrue(initiatorGroupsPage.isOpen(wait=True))
         LOG.info('Initiator Groups page is open:', initiatorGroupsPage.isOpen())
 
         LOG.step('Unselecting all initiator groups in grid')
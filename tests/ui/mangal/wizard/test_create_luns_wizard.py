@@ -93,7 +93,7 @@ class TestCreateLUNsWizard(FRTestCase):
         wizard.activePage.defineSingleLUN(name=name, size=size)
 
         LOG.step('Verifying error message as name is invalid')
-        self.assertTrue(wizard.activePage.lblNameError.isPresent())
+        self.assertTrue(wizard.activePage.lblNameError.isPresent(wait=True))
         LOG.info('Error message is present:', wizard.activePage.lblNameError.isPresent())
         wizard.activePage.lblNameError.isVisible()
         LOG.info('Error message is visible:', wizard.activePage.lblNameError.isVisible())
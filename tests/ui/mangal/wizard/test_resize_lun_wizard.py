@@ -130,6 +130,7 @@ class TestResizeLUNWizard(FRTestCase):
         wizard.resizeLUNPage.resizeLUN(size=lunNewSize)
         LOG.info('New LUN size:', wizard.resizeLUNPage.txtSize.getText() +
             wizard.resizeLUNPage.dLstSizeUnit.getText())
+        wizard.activePage.lblSizeError.waitUntilVisible()
         self.assertTrue(wizard.activePage.lblSizeError.isVisible())
         LOG.info('Error message displayed:',
             wizard.activePage.lblSizeError.getText())
@@ -261,6 +262,7 @@ class TestResizeLUNWizard(FRTestCase):
         wizard.activePage.btnOK.click()
 
         LOG.info('Dialog title notifies failure:', wizard.activePage.lblTitle.getText())
+        wizard.activePage.lblSameSizeError.waitUntilVisible()
         self.assertTrue(wizard.activePage.lblSameSizeError.isVisible())
         LOG.info('Error message displayed:', wizard.activePage.lblSameSizeError.getText())
         self.assertFalse(wizard.activePage.btnOK.isEnabled())